@@ -0,0 +1,54 @@
+"""use_double_precision_for_ratio_metrics
+
+Revision ID: 0a7e3c5d9f14
+Revises: f2c6d8e0a417
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a7e3c5d9f14"
+down_revision: Union[str, None] = "f2c6d8e0a417"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, original NUMERIC type)
+RATIO_COLUMNS: list[tuple[str, str, sa.Numeric]] = [
+    ("fundamental_data", "per_trailing", sa.Numeric(precision=10, scale=2)),
+    ("fundamental_data", "per_forward", sa.Numeric(precision=10, scale=2)),
+    ("fundamental_data", "peg_ratio", sa.Numeric(precision=10, scale=2)),
+    ("fundamental_data", "dividend_yield", sa.Numeric(precision=5, scale=4)),
+    ("fundamental_data", "profit_margin", sa.Numeric(precision=5, scale=4)),
+    ("fundamental_data", "earnings_growth", sa.Numeric(precision=6, scale=4)),
+    ("tickers", "beta", sa.Numeric(precision=6, scale=3)),
+]
+
+
+def upgrade() -> None:
+    for table, column, numeric_type in RATIO_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Float(),
+            existing_type=numeric_type,
+            existing_nullable=True,
+            postgresql_using=f"{column}::double precision",
+        )
+
+
+def downgrade() -> None:
+    for table, column, numeric_type in RATIO_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=numeric_type,
+            existing_type=sa.Float(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::numeric({numeric_type.precision}, "
+            f"{numeric_type.scale})",
+        )
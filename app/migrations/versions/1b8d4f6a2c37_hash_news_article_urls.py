@@ -0,0 +1,43 @@
+"""hash_news_article_urls
+
+Revision ID: 1b8d4f6a2c37
+Revises: 0a7e3c5d9f14
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1b8d4f6a2c37"
+down_revision: Union[str, None] = "0a7e3c5d9f14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "news_articles", sa.Column("url_hash", sa.LargeBinary(length=16), nullable=True)
+    )
+    op.execute("UPDATE news_articles SET url_hash = decode(md5(url), 'hex')")
+    op.alter_column("news_articles", "url_hash", nullable=False)
+
+    # (ticker_id, url) -> (ticker_id, url_hash): fixed 16-byte keys
+    op.drop_index("uq_news_ticker_url", table_name="news_articles")
+    op.create_index(
+        "uq_news_ticker_urlhash",
+        "news_articles",
+        ["ticker_id", "url_hash"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_news_ticker_urlhash", table_name="news_articles")
+    op.create_index(
+        "uq_news_ticker_url", "news_articles", ["ticker_id", "url"], unique=True
+    )
+    op.drop_column("news_articles", "url_hash")
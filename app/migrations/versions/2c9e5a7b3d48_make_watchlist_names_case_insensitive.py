@@ -0,0 +1,34 @@
+"""make_watchlist_names_case_insensitive
+
+Revision ID: 2c9e5a7b3d48
+Revises: 1b8d4f6a2c37
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2c9e5a7b3d48"
+down_revision: Union[str, None] = "1b8d4f6a2c37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # UNIQUE (name) -> UNIQUE (lower(name))
+    op.drop_constraint("watchlists_name_key", "watchlists", type_="unique")
+    op.create_index(
+        "uq_watchlists_name_ci",
+        "watchlists",
+        [sa.text("lower(name)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_watchlists_name_ci", table_name="watchlists")
+    op.create_unique_constraint("watchlists_name_key", "watchlists", ["name"])
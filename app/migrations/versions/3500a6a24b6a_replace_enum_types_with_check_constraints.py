@@ -0,0 +1,110 @@
+"""replace_enum_types_with_check_constraints
+
+Revision ID: 3500a6a24b6a
+Revises: a8c3d2e1f4b5
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3500a6a24b6a"
+down_revision: Union[str, None] = "a8c3d2e1f4b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # analyst_ratings.rating / action: ENUM -> VARCHAR + CHECK
+    op.alter_column(
+        "analyst_ratings",
+        "rating",
+        type_=sa.String(length=12),
+        existing_nullable=False,
+        postgresql_using="rating::text",
+    )
+    op.alter_column(
+        "analyst_ratings",
+        "action",
+        type_=sa.String(length=12),
+        existing_nullable=True,
+        postgresql_using="action::text",
+    )
+    op.create_check_constraint(
+        "chk_rating_valid",
+        "analyst_ratings",
+        "rating IN ('strong_buy', 'buy', 'hold', 'sell', 'strong_sell')",
+    )
+    op.create_check_constraint(
+        "chk_rating_action_valid",
+        "analyst_ratings",
+        "action IN ('upgrade', 'downgrade', 'maintain', 'initiate')",
+    )
+    op.execute("DROP TYPE IF EXISTS rating_enum")
+    op.execute("DROP TYPE IF EXISTS rating_action_enum")
+
+    # financial_statements.statement_type: ENUM -> VARCHAR + CHECK
+    op.alter_column(
+        "financial_statements",
+        "statement_type",
+        type_=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="statement_type::text",
+    )
+    op.create_check_constraint(
+        "chk_statement_type_valid",
+        "financial_statements",
+        "statement_type IN ('income_statement', 'balance_sheet', 'cash_flow')",
+    )
+    op.execute("DROP TYPE IF EXISTS statement_type_enum")
+
+
+def downgrade() -> None:
+    # financial_statements.statement_type: VARCHAR + CHECK -> ENUM
+    op.drop_constraint(
+        "chk_statement_type_valid", "financial_statements", type_="check"
+    )
+    statement_type_enum = sa.Enum(
+        "income_statement",
+        "balance_sheet",
+        "cash_flow",
+        name="statement_type_enum",
+    )
+    statement_type_enum.create(op.get_bind())
+    op.alter_column(
+        "financial_statements",
+        "statement_type",
+        type_=statement_type_enum,
+        existing_nullable=False,
+        postgresql_using="statement_type::statement_type_enum",
+    )
+
+    # analyst_ratings.rating / action: VARCHAR + CHECK -> ENUM
+    op.drop_constraint("chk_rating_action_valid", "analyst_ratings", type_="check")
+    op.drop_constraint("chk_rating_valid", "analyst_ratings", type_="check")
+    rating_enum = sa.Enum(
+        "strong_buy", "buy", "hold", "sell", "strong_sell", name="rating_enum"
+    )
+    rating_action_enum = sa.Enum(
+        "upgrade", "downgrade", "maintain", "initiate", name="rating_action_enum"
+    )
+    rating_enum.create(op.get_bind())
+    rating_action_enum.create(op.get_bind())
+    op.alter_column(
+        "analyst_ratings",
+        "action",
+        type_=rating_action_enum,
+        existing_nullable=True,
+        postgresql_using="action::rating_action_enum",
+    )
+    op.alter_column(
+        "analyst_ratings",
+        "rating",
+        type_=rating_enum,
+        existing_nullable=False,
+        postgresql_using="rating::rating_enum",
+    )
@@ -0,0 +1,34 @@
+"""add_ticker_trigram_search_index
+
+Revision ID: 4d1f8b2e6a93
+Revises: 2c9e5a7b3d48
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d1f8b2e6a93"
+down_revision: Union[str, None] = "2c9e5a7b3d48"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Ticker search uses ILIKE '%query%', which a btree index cannot serve
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_tickers_symbol_name_trgm",
+        "tickers",
+        ["symbol", "name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"symbol": "gin_trgm_ops", "name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_tickers_symbol_name_trgm", table_name="tickers")
@@ -0,0 +1,50 @@
+"""generate_news_article_url_hash
+
+Revision ID: 7c2e9a4f1d58
+Revises: 4d1f8b2e6a93
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9a4f1d58"
+down_revision: Union[str, None] = "4d1f8b2e6a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # url_hash was only set on INSERT; a generated column follows url updates too
+    op.drop_index("uq_news_ticker_urlhash", table_name="news_articles")
+    op.drop_column("news_articles", "url_hash")
+    op.execute(
+        "ALTER TABLE news_articles ADD COLUMN url_hash bytea "
+        "GENERATED ALWAYS AS (decode(md5(url), 'hex')) STORED NOT NULL"
+    )
+    op.create_index(
+        "uq_news_ticker_urlhash",
+        "news_articles",
+        ["ticker_id", "url_hash"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_news_ticker_urlhash", table_name="news_articles")
+    op.drop_column("news_articles", "url_hash")
+    op.add_column(
+        "news_articles", sa.Column("url_hash", sa.LargeBinary(length=16), nullable=True)
+    )
+    op.execute("UPDATE news_articles SET url_hash = decode(md5(url), 'hex')")
+    op.alter_column("news_articles", "url_hash", nullable=False)
+    op.create_index(
+        "uq_news_ticker_urlhash",
+        "news_articles",
+        ["ticker_id", "url_hash"],
+        unique=True,
+    )
@@ -0,0 +1,66 @@
+"""use_bigint_identity_primary_keys
+
+Revision ID: b7e4f19c2d60
+Revises: 3500a6a24b6a
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4f19c2d60"
+down_revision: Union[str, None] = "3500a6a24b6a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Append-heavy tables whose serial PKs become BIGINT identity columns.
+# Tables referenced by foreign keys (tickers, universes, watchlists) are left
+# as-is to avoid rewriting every referencing column.
+IDENTITY_TABLES: list[tuple[str, str]] = [
+    ("analyst_ratings", "rating_id"),
+    ("collection_jobs", "job_id"),
+    ("daily_prices", "price_id"),
+    ("dividend_schedule", "schedule_id"),
+    ("earnings_data", "earnings_id"),
+    ("earnings_schedule", "schedule_id"),
+    ("financial_statements", "statement_id"),
+    ("fundamental_data", "fundamental_id"),
+    ("news_articles", "article_id"),
+]
+
+
+def upgrade() -> None:
+    for table, column in IDENTITY_TABLES:
+        # Detach and drop the serial sequence, then attach an identity that
+        # continues from the current maximum value
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_{column}_seq")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            "ADD GENERATED ALWAYS AS IDENTITY (CACHE 1000)"
+        )
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+            f"COALESCE((SELECT MAX({column}) FROM {table}), 0) + 1, false)"
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(IDENTITY_TABLES):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP IDENTITY")
+        if column != "price_id":
+            # daily_prices.price_id was already BIGINT before the upgrade
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE INTEGER")
+        op.execute(f"CREATE SEQUENCE {table}_{column}_seq OWNED BY {table}.{column}")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"SET DEFAULT nextval('{table}_{column}_seq')"
+        )
+        op.execute(
+            f"SELECT setval('{table}_{column}_seq', "
+            f"COALESCE((SELECT MAX({column}) FROM {table}), 0) + 1, false)"
+        )
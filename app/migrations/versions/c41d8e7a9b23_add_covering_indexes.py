@@ -0,0 +1,62 @@
+"""add_covering_indexes
+
+Revision ID: c41d8e7a9b23
+Revises: b7e4f19c2d60
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d8e7a9b23"
+down_revision: Union[str, None] = "b7e4f19c2d60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # daily_prices: make the unique constraint covering and drop the plain
+    # (ticker_id, date) btree it duplicates
+    op.drop_index("idx_daily_prices_ticker_date", table_name="daily_prices")
+    op.drop_constraint("uq_ticker_date", "daily_prices", type_="unique")
+    op.execute(
+        "ALTER TABLE daily_prices ADD CONSTRAINT uq_ticker_date "
+        "UNIQUE (ticker_id, date) INCLUDE (close, adj_close, volume)"
+    )
+
+    # fundamental_data: include the most read metrics in the time-series index
+    op.drop_index("idx_fundamental_ticker_date", table_name="fundamental_data")
+    op.create_index(
+        "idx_fundamental_ticker_date",
+        "fundamental_data",
+        ["ticker_id", "retrieved_at"],
+        unique=False,
+        postgresql_using="btree",
+        postgresql_ops={"retrieved_at": "DESC"},
+        postgresql_include=["eps_trailing", "per_trailing"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_fundamental_ticker_date", table_name="fundamental_data")
+    op.create_index(
+        "idx_fundamental_ticker_date",
+        "fundamental_data",
+        ["ticker_id", "retrieved_at"],
+        unique=False,
+        postgresql_using="btree",
+        postgresql_ops={"retrieved_at": "DESC"},
+    )
+
+    op.drop_constraint("uq_ticker_date", "daily_prices", type_="unique")
+    op.create_unique_constraint("uq_ticker_date", "daily_prices", ["ticker_id", "date"])
+    op.create_index(
+        "idx_daily_prices_ticker_date",
+        "daily_prices",
+        ["ticker_id", "date"],
+        unique=False,
+        postgresql_using="btree",
+    )
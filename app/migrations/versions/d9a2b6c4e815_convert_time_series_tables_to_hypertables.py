@@ -0,0 +1,131 @@
+"""convert_time_series_tables_to_hypertables
+
+Revision ID: d9a2b6c4e815
+Revises: c41d8e7a9b23
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a2b6c4e815"
+down_revision: Union[str, None] = "c41d8e7a9b23"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, primary key column, time column, chunk interval)
+# news_articles is not converted: its unique (ticker_id, url) index cannot
+# include published_at without changing the de-duplication rule.
+HYPERTABLES: list[tuple[str, str, str, str]] = [
+    ("daily_prices", "price_id", "date", "30 days"),
+    ("fundamental_data", "fundamental_id", "retrieved_at", "7 days"),
+]
+
+# Constraints and indexes recreated when a hypertable is copied back into a
+# plain table (schema as of the previous revision)
+PLAIN_TABLE_DDL: dict[str, list[str]] = {
+    "daily_prices": [
+        "ALTER TABLE daily_prices ADD CONSTRAINT uq_ticker_date "
+        "UNIQUE (ticker_id, date) INCLUDE (close, adj_close, volume)",
+        "CREATE INDEX idx_daily_prices_date ON daily_prices (date)",
+    ],
+    "fundamental_data": [
+        "CREATE UNIQUE INDEX uq_fundamental_ticker_date "
+        "ON fundamental_data (ticker_id, retrieved_at)",
+        "CREATE INDEX idx_fundamental_ticker_date "
+        "ON fundamental_data USING btree (ticker_id, retrieved_at DESC) "
+        "INCLUDE (eps_trailing, per_trailing)",
+        "CREATE INDEX ix_fundamental_data_retrieved_at "
+        "ON fundamental_data (retrieved_at)",
+    ],
+}
+
+
+def _timescaledb_loadable() -> bool:
+    # The package being installed is not enough: CREATE EXTENSION also needs
+    # the library in shared_preload_libraries
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb')"
+            " OR (EXISTS (SELECT 1 FROM pg_available_extensions"
+            " WHERE name = 'timescaledb')"
+            " AND current_setting('shared_preload_libraries', true)"
+            " LIKE '%timescaledb%')"
+        )
+    )
+    return bool(result.scalar())
+
+
+def _is_hypertable(table: str) -> bool:
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb')"
+        )
+    )
+    if not result.scalar():
+        return False
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM timescaledb_information.hypertables "
+            "WHERE hypertable_name = :table"
+        ),
+        {"table": table},
+    )
+    return result.scalar() is not None
+
+
+def upgrade() -> None:
+    # Hypertable unique keys must contain the partitioning column. The primary
+    # keys are widened on every server so the schema matches the ORM models.
+    for table, pk_column, time_column, _ in HYPERTABLES:
+        op.drop_constraint(f"{table}_pkey", table, type_="primary")
+        op.create_primary_key(f"{table}_pkey", table, [pk_column, time_column])
+
+    # Plain PostgreSQL servers keep regular tables
+    if not _timescaledb_loadable():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+    for table, _, time_column, interval in HYPERTABLES:
+        op.execute(
+            f"SELECT create_hypertable('{table}', '{time_column}', "
+            f"chunk_time_interval => INTERVAL '{interval}', migrate_data => true)"
+        )
+
+
+def downgrade() -> None:
+    for table, pk_column, _, _ in reversed(HYPERTABLES):
+        if _is_hypertable(table):
+            # Hypertables cannot be converted in place: copy rows into a plain
+            # table with the same columns and swap it in
+            plain = f"{table}_plain"
+            op.execute(
+                f"CREATE TABLE {plain} (LIKE {table} INCLUDING DEFAULTS "
+                "INCLUDING IDENTITY INCLUDING CONSTRAINTS)"
+            )
+            op.execute(
+                f"INSERT INTO {plain} OVERRIDING SYSTEM VALUE SELECT * FROM {table}"
+            )
+            op.execute(f"DROP TABLE {table}")
+            op.execute(f"ALTER TABLE {plain} RENAME TO {table}")
+            op.create_foreign_key(
+                f"{table}_ticker_id_fkey",
+                table,
+                "tickers",
+                ["ticker_id"],
+                ["ticker_id"],
+                ondelete="CASCADE",
+            )
+            for statement in PLAIN_TABLE_DDL[table]:
+                op.execute(statement)
+            op.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{pk_column}'), "
+                f"COALESCE((SELECT MAX({pk_column}) FROM {table}), 0) + 1, false)"
+            )
+        else:
+            op.drop_constraint(f"{table}_pkey", table, type_="primary")
+        op.create_primary_key(f"{table}_pkey", table, [pk_column])
@@ -0,0 +1,61 @@
+"""use_brin_for_append_only_timestamps
+
+Revision ID: e5f3a7b1c902
+Revises: d9a2b6c4e815
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f3a7b1c902"
+down_revision: Union[str, None] = "d9a2b6c4e815"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # news_articles.published_at: btree -> BRIN
+    op.drop_index(op.f("ix_news_articles_published_at"), table_name="news_articles")
+    op.create_index(
+        "idx_news_published_at_brin",
+        "news_articles",
+        ["published_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+    # fundamental_data.retrieved_at: btree -> BRIN
+    op.drop_index(
+        op.f("ix_fundamental_data_retrieved_at"), table_name="fundamental_data"
+    )
+    op.create_index(
+        "idx_fundamental_retrieved_at_brin",
+        "fundamental_data",
+        ["retrieved_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_fundamental_retrieved_at_brin", table_name="fundamental_data")
+    op.create_index(
+        op.f("ix_fundamental_data_retrieved_at"),
+        "fundamental_data",
+        ["retrieved_at"],
+        unique=False,
+    )
+
+    op.drop_index("idx_news_published_at_brin", table_name="news_articles")
+    op.create_index(
+        op.f("ix_news_articles_published_at"),
+        "news_articles",
+        ["published_at"],
+        unique=False,
+    )
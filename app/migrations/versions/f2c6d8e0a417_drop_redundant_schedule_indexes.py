@@ -0,0 +1,38 @@
+"""drop_redundant_schedule_indexes
+
+Revision ID: f2c6d8e0a417
+Revises: e5f3a7b1c902
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c6d8e0a417"
+down_revision: Union[str, None] = "e5f3a7b1c902"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same columns as uq_earnings_schedule / uq_dividend_schedule
+    op.drop_index("idx_earnings_schedule_ticker_date", table_name="earnings_schedule")
+    op.drop_index("idx_dividend_schedule_ticker_date", table_name="dividend_schedule")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_dividend_schedule_ticker_date",
+        "dividend_schedule",
+        ["ticker_id", "ex_dividend_date"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_earnings_schedule_ticker_date",
+        "earnings_schedule",
+        ["ticker_id", "earnings_date"],
+        unique=False,
+    )
@@ -3,13 +3,15 @@
 # pyright: reportUnknownVariableType=false
 # NOTE: dataclass field default_factory typing issue
 
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
 from typing import TYPE_CHECKING, cast
 
 import pandas as pd
 
-from src.shared.exceptions import StockDataFetchError
+from src.shared.exceptions import StockDataFetchError, ValidationError
 
 if TYPE_CHECKING:
     from src.domain.ports.stock_data_source import StockDataSource
@@ -20,6 +22,9 @@ if TYPE_CHECKING:
         PostgresDailyPriceRepository,
     )
 
+# Concurrent per-symbol requests when the bulk download falls back
+MAX_FETCH_WORKERS = 8
+
 
 @dataclass
 class FetchStockDataCommand:
@@ -30,6 +35,57 @@ class FetchStockDataCommand:
     end_date: date | None = None
     period: str | None = None
 
+    def __post_init__(self) -> None:
+        """取得条件の組み合わせを検証する."""
+        if not self.symbols:
+            raise ValidationError("At least one symbol is required")
+        if self.period and (self.start_date or self.end_date):
+            raise ValidationError("Cannot use period with start_date/end_date")
+        if not self.period and not self.start_date:
+            raise ValidationError("Must specify period or start_date")
+
+    @classmethod
+    def from_strings(
+        cls,
+        symbols: list[str],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        period: str | None = None,
+    ) -> "FetchStockDataCommand":
+        """
+        文字列の入力（CLI引数など）からコマンドを生成する.
+
+        日付のパースと取得条件の検証を1か所で行う。
+
+        Args:
+            symbols: 銘柄シンボルのリスト
+            start_date: 開始日（YYYY-MM-DD）
+            end_date: 終了日（YYYY-MM-DD）
+            period: 取得期間（1mo, 1y など）
+
+        Returns:
+            株価データ取得コマンド
+
+        Raises:
+            ValidationError: 日付形式または取得条件が不正な場合
+        """
+        return cls(
+            symbols=list(symbols),
+            start_date=_parse_date(start_date, "start"),
+            end_date=_parse_date(end_date, "end"),
+            period=period,
+        )
+
+
+def _parse_date(value: str | None, label: str) -> date | None:
+    """ISO形式の日付文字列をパースする（未指定はNone）."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f"Invalid {label} date format: {value}") from None
+
 
 @dataclass
 class FetchStockDataResult:
@@ -98,19 +154,7 @@ class CollectDataHandler:
 
         except StockDataFetchError:
             # Fall back to individual fetching on bulk failure
-            for symbol in command.symbols:
-                try:
-                    df = self._data_source.fetch_daily_prices(
-                        symbol=symbol,
-                        start_date=command.start_date,
-                        end_date=command.end_date,
-                        period=command.period,
-                    )
-                    result.data[symbol] = df
-                    result.success_count += 1
-                except StockDataFetchError as e:
-                    result.errors[symbol] = str(e)
-                    result.error_count += 1
+            self._fetch_individually(command, result)
 
         # Prepare ticker cache for indicator calculation and saving
         ticker_cache: dict[str, int] = {}
@@ -127,13 +171,55 @@ class CollectDataHandler:
 
         return result
 
+    def _fetch_individually(
+        self, command: FetchStockDataCommand, result: FetchStockDataResult
+    ) -> None:
+        """
+        銘柄ごとに株価データを取得する（一括取得に失敗した場合のフォールバック）.
+
+        HTTPリクエストだけをスレッドプールで並行に発行し、結果の格納は
+        呼び出し元スレッドで銘柄の指定順に行う。
+        """
+
+        def fetch(symbol: str) -> pd.DataFrame:
+            return self._data_source.fetch_daily_prices(
+                symbol=symbol,
+                start_date=command.start_date,
+                end_date=command.end_date,
+                period=command.period,
+            )
+
+        workers = min(MAX_FETCH_WORKERS, len(command.symbols))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                symbol: executor.submit(fetch, symbol) for symbol in command.symbols
+            }
+            for symbol, future in futures.items():
+                try:
+                    result.data[symbol] = future.result()
+                    result.success_count += 1
+                except StockDataFetchError as e:
+                    result.errors[symbol] = str(e)
+                    result.error_count += 1
+
     def _prepare_tickers(self, result: FetchStockDataResult) -> dict[str, int]:
         """シンボルに対応するTickerを事前取得してキャッシュを作成する."""
         ticker_cache: dict[str, int] = {}
         if self._daily_price_repository is None:
             return ticker_cache
 
+        # Resolve already registered tickers in one query; on failure every
+        # symbol falls back to the individual lookup below
+        with contextlib.suppress(Exception), self._daily_price_repository.savepoint():
+            ticker_cache.update(
+                self._daily_price_repository.get_ticker_ids_by_symbols(
+                    list(result.data)
+                )
+            )
+
         for symbol in result.data:
+            if symbol in ticker_cache:
+                continue
             try:
                 ticker_info = self._get_ticker_info_safe(symbol)
                 name: str | None = None
@@ -142,10 +228,12 @@ class CollectDataHandler:
                     if isinstance(name_value, str):
                         name = name_value
 
-                ticker = self._daily_price_repository.get_or_create_ticker(
-                    symbol=symbol,
-                    name=name,
-                )
+                # A failed insert only rolls back this symbol's savepoint
+                with self._daily_price_repository.savepoint():
+                    ticker = self._daily_price_repository.get_or_create_ticker(
+                        symbol=symbol,
+                        name=name,
+                    )
                 ticker_cache[symbol] = cast("int", ticker.ticker_id)
             except Exception:
                 # Skip this symbol if ticker creation fails
@@ -212,21 +300,14 @@ class CollectDataHandler:
         else:
             new_data_start_date = new_data_start
 
-        # 3. Fetch historical data from DB
-        historical_prices = (
-            self._daily_price_repository.get_historical_for_indicator_calculation(
-                ticker_id=ticker_id,
-                new_data_start_date=new_data_start_date,
-                lookback_days=lookback_days,
-            )
-        )
-
-        # 4. Convert historical data to DataFrame
-        historical_df = self._daily_price_repository.daily_prices_to_dataframe(
-            historical_prices
+        # 3. Fetch historical data from DB as a DataFrame
+        historical_df = self._daily_price_repository.get_indicator_lookback_dataframe(
+            ticker_id=ticker_id,
+            new_data_start_date=new_data_start_date,
+            lookback_days=lookback_days,
         )
 
-        # 5. Combine historical and new data
+        # 4. Combine historical and new data
         if len(historical_df) > 0:
             combined_df = pd.concat([historical_df, new_data]).sort_index()
             # Remove duplicates, keeping the latest data
@@ -234,10 +315,10 @@ class CollectDataHandler:
         else:
             combined_df = new_data
 
-        # 6. Calculate indicators on combined data
+        # 5. Calculate indicators on combined data
         calc_result = self._indicator_service.calculate_all(combined_df)
 
-        # 7. Extract only the new data portion
+        # 6. Extract only the new data portion
         return calc_result.data.loc[new_data.index]
 
     def _save_to_database(
@@ -254,28 +335,33 @@ class CollectDataHandler:
 
         for symbol, df in result.data.items():
             try:
-                # Use cached ticker_id if available
-                ticker_id = ticker_cache.get(symbol)
-                if ticker_id is None:
-                    # Fallback: get or create ticker
-                    ticker_info = self._get_ticker_info_safe(symbol)
-                    name: str | None = None
-                    if ticker_info:
-                        name_value = ticker_info.get("name")
-                        if isinstance(name_value, str):
-                            name = name_value
-                    ticker = self._daily_price_repository.get_or_create_ticker(
-                        symbol=symbol,
-                        name=name,
+                # Each symbol is saved in its own savepoint so that a failure does
+                # not discard the symbols already written in this transaction
+                with self._daily_price_repository.savepoint():
+                    # Use cached ticker_id if available
+                    ticker_id = ticker_cache.get(symbol)
+                    if ticker_id is None:
+                        # Fallback: get or create ticker
+                        ticker_info = self._get_ticker_info_safe(symbol)
+                        name: str | None = None
+                        if ticker_info:
+                            name_value = ticker_info.get("name")
+                            if isinstance(name_value, str):
+                                name = name_value
+                        ticker = self._daily_price_repository.get_or_create_ticker(
+                            symbol=symbol,
+                            name=name,
+                        )
+                        ticker_id = cast("int", ticker.ticker_id)
+
+                    # Bulk upsert daily prices
+                    saved_count = (
+                        self._daily_price_repository.bulk_upsert_from_dataframe(
+                            ticker_id=ticker_id,
+                            df=df,
+                        )
                     )
-                    ticker_id = cast("int", ticker.ticker_id)
-
-                # Bulk upsert daily prices
-                saved_count = self._daily_price_repository.bulk_upsert_from_dataframe(
-                    ticker_id=ticker_id,
-                    df=df,
-                )
-                result.saved_records[symbol] = saved_count
+                    result.saved_records[symbol] = saved_count
 
             except Exception as e:
                 # Log error but don't fail the entire operation
@@ -4,8 +4,10 @@ YahooFinanceClientから取得したデータをDBに永続化する。
 また、DBから永続化データを取得してEventInputを構築する。
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
+from typing import Any
 
 from src.domain.models.event_calendar import EventInput
 from src.infrastructure.external.yahoo_finance import YahooFinanceClient
@@ -14,6 +16,9 @@ from src.infrastructure.persistence.repositories import (
     PostgresEarningsScheduleRepository,
 )
 
+# Concurrent Yahoo Finance requests in sync_symbols
+MAX_FETCH_WORKERS = 8
+
 
 @dataclass
 class SyncResult:
@@ -30,6 +35,16 @@ class SyncResult:
         return len(self.errors) == 0
 
 
+@dataclass
+class _FetchedEvents:
+    """1銘柄分の取得結果（取得に失敗した項目は例外を保持する）."""
+
+    earnings_dates: list[date] = field(default_factory=lambda: [])
+    dividend_info: dict[str, Any] = field(default_factory=lambda: {})
+    earnings_error: Exception | None = None
+    dividend_error: Exception | None = None
+
+
 def _estimate_fiscal_quarter(earnings_date: date) -> tuple[str, int]:
     """
     決算発表日から四半期と会計年度を推定する.
@@ -108,40 +123,67 @@ class EventScheduleSyncService:
         Returns:
             SyncResult: 同期結果
         """
+        fetched = self._fetch_events(symbol, earnings_limit)
+        return self._save_events(symbol, ticker_id, fetched)
+
+    def _fetch_events(self, symbol: str, earnings_limit: int) -> _FetchedEvents:
+        """決算日・配当情報をYahoo Financeから取得する（DBには書き込まない）."""
+        fetched = _FetchedEvents()
+        try:
+            fetched.earnings_dates = self._yahoo_client.fetch_earnings_dates(
+                symbol=symbol, limit=earnings_limit
+            )
+        except Exception as e:
+            fetched.earnings_error = e
+        try:
+            fetched.dividend_info = self._yahoo_client.fetch_dividend_info(
+                symbol=symbol
+            )
+        except Exception as e:
+            fetched.dividend_error = e
+        return fetched
+
+    def _save_events(
+        self, symbol: str, ticker_id: int, fetched: _FetchedEvents
+    ) -> SyncResult:
+        """取得済みの決算日・配当情報をDBに保存する."""
         result = SyncResult(symbol=symbol)
 
         # 決算日の同期
-        result = self._sync_earnings(symbol, ticker_id, earnings_limit, result)
+        result = self._sync_earnings(ticker_id, fetched, result)
 
         # 配当情報の同期
-        result = self._sync_dividend(symbol, ticker_id, result)
+        result = self._sync_dividend(ticker_id, fetched, result)
 
         return result
 
     def _sync_earnings(
         self,
-        symbol: str,
         ticker_id: int,
-        limit: int,
+        fetched: _FetchedEvents,
         result: SyncResult,
     ) -> SyncResult:
         """決算日を同期する."""
         try:
-            earnings_dates = self._yahoo_client.fetch_earnings_dates(
-                symbol=symbol, limit=limit
-            )
+            if fetched.earnings_error is not None:
+                raise fetched.earnings_error
 
-            for earnings_date in earnings_dates:
+            rows: list[dict[str, Any]] = []
+            for earnings_date in fetched.earnings_dates:
                 # 日付から四半期・会計年度を推定
                 fiscal_quarter, fiscal_year = _estimate_fiscal_quarter(earnings_date)
-
-                self._earnings_repo.upsert(
-                    ticker_id=ticker_id,
-                    earnings_date=earnings_date,
-                    fiscal_quarter=fiscal_quarter,
-                    fiscal_year=fiscal_year,
+                rows.append(
+                    {
+                        "ticker_id": ticker_id,
+                        "earnings_date": earnings_date,
+                        "fiscal_quarter": fiscal_quarter,
+                        "fiscal_year": fiscal_year,
+                    }
                 )
-                result.earnings_synced += 1
+
+            # 全決算日を1文でupsertする
+            self._earnings_repo.upsert_many(rows)
+            result.earnings_synced += len(rows)
 
         except Exception as e:
             result.errors.append(f"決算日取得エラー: {e}")
@@ -150,14 +192,16 @@ class EventScheduleSyncService:
 
     def _sync_dividend(
         self,
-        symbol: str,
         ticker_id: int,
+        fetched: _FetchedEvents,
         result: SyncResult,
     ) -> SyncResult:
         """配当情報を同期する."""
         try:
-            dividend_info = self._yahoo_client.fetch_dividend_info(symbol=symbol)
+            if fetched.dividend_error is not None:
+                raise fetched.dividend_error
 
+            dividend_info = fetched.dividend_info
             ex_dividend_date: date | None = dividend_info.get("ex_dividend_date")
             if ex_dividend_date is not None:
                 self._dividend_repo.upsert(
@@ -181,6 +225,9 @@ class EventScheduleSyncService:
         """
         複数銘柄の決算・配当スケジュールを同期する.
 
+        Yahoo Financeへのリクエストはスレッドプールで並行に発行し、
+        DBへの保存は呼び出し元スレッドで銘柄の指定順に行う。
+
         Args:
             symbols: (symbol, ticker_id) のタプルリスト
             earnings_limit: 各銘柄で取得する決算日の数
@@ -188,17 +235,21 @@ class EventScheduleSyncService:
         Returns:
             list[SyncResult]: 各銘柄の同期結果
         """
-        results: list[SyncResult] = []
-
-        for symbol, ticker_id in symbols:
-            result = self.sync_symbol(
-                symbol=symbol,
-                ticker_id=ticker_id,
-                earnings_limit=earnings_limit,
-            )
-            results.append(result)
-
-        return results
+        if not symbols:
+            return []
+
+        workers = min(MAX_FETCH_WORKERS, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._fetch_events, symbol, earnings_limit)
+                for symbol, _ in symbols
+            ]
+            fetched = [future.result() for future in futures]
+
+        return [
+            self._save_events(symbol, ticker_id, events)
+            for (symbol, ticker_id), events in zip(symbols, fetched, strict=True)
+        ]
 
     def get_upcoming_earnings_date(
         self,
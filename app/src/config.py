@@ -4,11 +4,31 @@ Provides database connection settings from environment variables.
 """
 
 import os
+from functools import lru_cache
+from pathlib import Path
 
 from dotenv import load_dotenv
 
-# .envファイルから環境変数を読み込む
-load_dotenv()
+# プロジェクトルートの.envファイル
+_env_path = Path(__file__).resolve().parents[1] / ".env"
+
+
+@lru_cache(maxsize=1)
+def get_database_url() -> str:
+    """
+    環境変数からデータベースURLを構築する.
+
+    環境変数はプロセス内で変わらないため、初回の結果をキャッシュする。
+
+    Returns:
+        PostgreSQLデータベースURL
+    """
+    host = os.getenv("DB_HOST", "localhost")
+    port = os.getenv("DB_PORT", "5432")
+    name = os.getenv("DB_NAME", "swing_trading")
+    user = os.getenv("DB_USER", "postgres")
+    password = os.getenv("DB_PASSWORD", "postgres")
+    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
 
 
 class Config:
@@ -22,9 +42,9 @@ class Config:
         Returns:
             PostgreSQLデータベースURL
         """
-        host = os.getenv("DB_HOST", "localhost")
-        port = os.getenv("DB_PORT", "5432")
-        name = os.getenv("DB_NAME", "swing_trading")
-        user = os.getenv("DB_USER", "postgres")
-        password = os.getenv("DB_PASSWORD", "postgres")
-        return f"postgresql://{user}:{password}@{host}:{port}/{name}"
+        return get_database_url()
+
+
+# .envファイルから環境変数を読み込む（CLI・Streamlit・マイグレーションで1回だけ）
+if _env_path.exists():
+    load_dotenv(_env_path)
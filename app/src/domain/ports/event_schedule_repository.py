@@ -76,6 +76,18 @@ class EarningsScheduleRepository(Protocol):
         """
         ...
 
+    def upsert_many(self, rows: list[dict[str, Any]]) -> int:
+        """
+        複数の決算スケジュールを1文でupsertする.
+
+        Args:
+            rows: upsertする行の辞書リスト（ticker_id, earnings_date必須）
+
+        Returns:
+            upsertされたレコード数
+        """
+        ...
+
     def delete_by_ticker(self, ticker_id: int) -> int:
         """
         Tickerの全決算スケジュールを削除する.
@@ -158,6 +170,18 @@ class DividendScheduleRepository(Protocol):
         """
         ...
 
+    def upsert_many(self, rows: list[dict[str, Any]]) -> int:
+        """
+        複数の配当スケジュールを1文でupsertする.
+
+        Args:
+            rows: upsertする行の辞書リスト（ticker_id, ex_dividend_date必須）
+
+        Returns:
+            upsertされたレコード数
+        """
+        ...
+
     def delete_by_ticker(self, ticker_id: int) -> int:
         """
         Tickerの全配当スケジュールを削除する.
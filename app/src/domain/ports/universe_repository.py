@@ -1,7 +1,7 @@
 """Universe repository port (interface)."""
 
 from datetime import date
-from typing import TYPE_CHECKING, Dict, List, Protocol
+from typing import TYPE_CHECKING, Dict, Iterable, List, Protocol, Tuple
 
 import pandas as pd
 
@@ -17,22 +17,28 @@ class UniverseRepository(Protocol):
     具体的な実装はinfrastructure層で提供される。
     """
 
-    def get_by_id(self, universe_id: int) -> "Universe | None":
-        """IDでUniverseを取得する."""
+    def get_by_id(
+        self, universe_id: int, load_symbols: bool = False
+    ) -> "Universe | None":
+        """IDでUniverseを取得する（load_symbols=Trueで所属シンボルも取得）."""
         ...
 
-    def get_by_name(self, name: str) -> "Universe | None":
-        """名前でUniverseを取得する."""
+    def get_by_name(self, name: str, load_symbols: bool = False) -> "Universe | None":
+        """名前でUniverseを取得する（load_symbols=Trueで所属シンボルも取得）."""
         ...
 
-    def get_latest(self) -> "Universe | None":
-        """最新のUniverseを取得する."""
+    def get_latest(self, load_symbols: bool = False) -> "Universe | None":
+        """最新のUniverseを取得する（load_symbols=Trueで所属シンボルも取得）."""
         ...
 
     def get_symbols(self, universe_id: int) -> List[str]:
         """Universe内の全シンボルを取得する."""
         ...
 
+    def get_symbol_ticker_pairs(self, universe_id: int) -> List[Tuple[str, int]]:
+        """Universe内の全銘柄の (シンボル, TickerID) をシンボル順に取得する."""
+        ...
+
     def get_universe_prices(
         self,
         universe_id: int,
@@ -51,3 +57,62 @@ class UniverseRepository(Protocol):
             銘柄別の価格DataFrame {symbol: DataFrame}
         """
         ...
+
+    def get_universe_close_matrix(
+        self,
+        universe_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> pd.DataFrame:
+        """
+        Universe内の全銘柄の終値を横持ちのDataFrameで取得する.
+
+        Args:
+            universe_id: UniverseのID
+            start_date: 取得開始日
+            end_date: 取得終了日
+
+        Returns:
+            DataFrame(index=date, columns=symbols, values=close)
+        """
+        ...
+
+    def get_advancing_declining_counts(
+        self,
+        universe_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> pd.DataFrame:
+        """
+        Universe内の日ごとの上昇・下落銘柄数を取得する.
+
+        Args:
+            universe_id: UniverseのID
+            start_date: 取得開始日
+            end_date: 取得終了日
+
+        Returns:
+            DataFrame(index=date, columns=['advancing', 'declining'])
+        """
+        ...
+
+    def get_price_data_version(
+        self,
+        universe_id: int,
+        start_date: date,
+        end_date: date,
+        extra_symbols: Iterable[str] = (),
+    ) -> str:
+        """
+        分析に使う価格データのバージョン文字列を取得する.
+
+        Args:
+            universe_id: UniverseのID
+            start_date: 対象期間の開始日
+            end_date: 対象期間の終了日
+            extra_symbols: Universe外で併せて参照するシンボル
+
+        Returns:
+            価格の追加・訂正やUniverseの構成変更で変わるバージョン文字列
+        """
+        ...
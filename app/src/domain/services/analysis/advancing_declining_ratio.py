@@ -7,8 +7,9 @@
 # NOTE: dataclass field default_factory type inference issue
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Union
 
+import numpy as np
 import pandas as pd
 
 from src.domain.models.market_regime import ADRDivergence
@@ -37,7 +38,7 @@ class AdvancingDecliningRatioService:
 
     def calculate(
         self,
-        universe_prices: Dict[str, pd.DataFrame],
+        universe_prices: Union[Dict[str, pd.DataFrame], pd.DataFrame],
         short_period: int = 5,
         medium_period: int = 25,
         divergence_threshold: float = 10.0,
@@ -48,6 +49,7 @@ class AdvancingDecliningRatioService:
         Args:
             universe_prices: 銘柄別の価格DataFrame
                 {symbol: DataFrame(index=date, columns=['close'])}
+                または終値の横持ちDataFrame(index=date, columns=symbols)
             short_period: 短期ADR期間（デフォルト5日）
             medium_period: 中期ADR期間（デフォルト25日）
             divergence_threshold: ダイバージェンス判定閾値
@@ -55,15 +57,12 @@ class AdvancingDecliningRatioService:
         Returns:
             ADRCalculationResult: 計算結果
         """
-        if not universe_prices:
-            return ADRCalculationResult(
-                short_term_adr=100.0,
-                medium_term_adr=100.0,
-                divergence=ADRDivergence.NEUTRAL,
-            )
-
-        # 全銘柄の終値を結合
-        close_prices = self._merge_close_prices(universe_prices)
+        if isinstance(universe_prices, pd.DataFrame):
+            # 横持ちの終値はそのまま使う
+            close_prices = universe_prices
+        else:
+            # 全銘柄の終値を結合
+            close_prices = self._merge_close_prices(universe_prices)
 
         if close_prices.empty:
             return ADRCalculationResult(
@@ -79,6 +78,44 @@ class AdvancingDecliningRatioService:
         daily_advancing = (daily_changes > 0).sum(axis=1).tolist()
         daily_declining = (daily_changes < 0).sum(axis=1).tolist()
 
+        return self.calculate_from_counts(
+            daily_advancing,
+            daily_declining,
+            short_period=short_period,
+            medium_period=medium_period,
+            divergence_threshold=divergence_threshold,
+        )
+
+    def calculate_from_counts(
+        self,
+        daily_advancing: List[int],
+        daily_declining: List[int],
+        short_period: int = 5,
+        medium_period: int = 25,
+        divergence_threshold: float = 10.0,
+    ) -> ADRCalculationResult:
+        """
+        集計済みの日ごとの上昇・下落銘柄数から騰落レシオを計算.
+
+        DB側で銘柄数を集計済みの場合に、終値の全系列を経由せずに使う。
+
+        Args:
+            daily_advancing: 日ごとの上昇銘柄数（日付昇順）
+            daily_declining: 日ごとの下落銘柄数（日付昇順）
+            short_period: 短期ADR期間（デフォルト5日）
+            medium_period: 中期ADR期間（デフォルト25日）
+            divergence_threshold: ダイバージェンス判定閾値
+
+        Returns:
+            ADRCalculationResult: 計算結果
+        """
+        if not daily_advancing:
+            return ADRCalculationResult(
+                short_term_adr=100.0,
+                medium_term_adr=100.0,
+                divergence=ADRDivergence.NEUTRAL,
+            )
+
         # 短期ADR（直近N日分）
         short_adv = sum(daily_advancing[-short_period:])
         short_dec = sum(daily_declining[-short_period:])
@@ -102,6 +139,63 @@ class AdvancingDecliningRatioService:
             daily_declining=daily_declining,
         )
 
+    def calculate_series(
+        self,
+        close_prices: pd.DataFrame,
+        short_period: int = 5,
+        medium_period: int = 25,
+        divergence_threshold: float = 10.0,
+        min_observations: int = 1,
+    ) -> pd.DataFrame:
+        """
+        終値の横持ちDataFrameから日ごとの騰落レシオを一括計算.
+
+        各日の値は、その日までの行だけでcalculateを呼んだ結果と一致する。
+        銘柄はその日までの終値がmin_observations件以上ある場合のみ集計する。
+
+        Args:
+            close_prices: 終値の横持ちDataFrame(index=date, columns=symbols)
+            short_period: 短期ADR期間（デフォルト5日）
+            medium_period: 中期ADR期間（デフォルト25日）
+            divergence_threshold: ダイバージェンス判定閾値
+            min_observations: 集計対象とする銘柄の最小データ件数
+
+        Returns:
+            DataFrame(index=date,
+                columns=['short_term_adr', 'medium_term_adr', 'divergence'])
+        """
+        daily_changes = close_prices.pct_change()
+        advancing = (daily_changes > 0).astype("int64")
+        declining = (daily_changes < 0).astype("int64")
+        # その日までにデータが揃った銘柄だけを対象にする
+        eligible = close_prices.notna().cumsum() >= min_observations
+
+        def window_adr(period: int) -> pd.Series:
+            adv = (advancing.rolling(period, min_periods=1).sum() * eligible).sum(
+                axis=1
+            )
+            dec = (declining.rolling(period, min_periods=1).sum() * eligible).sum(
+                axis=1
+            )
+            ratio = adv / dec.where(dec > 0) * 100
+            return ratio.where(dec > 0, np.where(adv > 0, 200.0, 100.0))
+
+        short_term = window_adr(short_period)
+        medium_term = window_adr(medium_period)
+        divergence = [
+            self._determine_divergence(short, medium, divergence_threshold)
+            for short, medium in zip(short_term, medium_term, strict=True)
+        ]
+
+        return pd.DataFrame(
+            {
+                "short_term_adr": short_term.astype("float64"),
+                "medium_term_adr": medium_term.astype("float64"),
+                "divergence": divergence,
+            },
+            index=close_prices.index,
+        )
+
     def _merge_close_prices(
         self, universe_prices: Dict[str, pd.DataFrame]
     ) -> pd.DataFrame:
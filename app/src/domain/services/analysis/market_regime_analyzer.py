@@ -4,7 +4,7 @@
 """
 
 from datetime import date
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
 import pandas as pd
 
@@ -66,8 +66,9 @@ class MarketRegimeAnalyzer:
         self,
         nikkei_df: pd.DataFrame,
         topix_df: pd.DataFrame,
-        universe_prices: Dict[str, pd.DataFrame],
+        universe_prices: Optional[Union[Dict[str, pd.DataFrame], pd.DataFrame]] = None,
         end_date: Optional[date] = None,
+        adr_counts: Optional[pd.DataFrame] = None,
     ) -> MarketRegime:
         """
         市場レジームを分析する.
@@ -76,7 +77,11 @@ class MarketRegimeAnalyzer:
             nikkei_df: 日経225 ETF (1321.T) OHLCV データ
             topix_df: TOPIX ETF (1306.T) OHLCV データ
             universe_prices: ユニバース全銘柄の価格データ（ADR計算用）
+                銘柄別DataFrameの辞書、または終値の横持ちDataFrame
             end_date: 分析基準日（Noneで最新日付）
+            adr_counts: DB側で集計済みの日ごとの上昇・下落銘柄数
+                DataFrame(columns=['advancing', 'declining'])。
+                指定時はuniverse_pricesより優先してADR計算に使う
 
         Returns:
             MarketRegime: 分析結果
@@ -101,12 +106,21 @@ class MarketRegimeAnalyzer:
         )
 
         # ADR計算
-        adr_result = self._adr_service.calculate(
-            universe_prices,
-            short_period=self._config.adr_short_period,
-            medium_period=self._config.adr_medium_period,
-            divergence_threshold=self._config.adr_divergence_threshold,
-        )
+        if adr_counts is not None:
+            adr_result = self._adr_service.calculate_from_counts(
+                adr_counts["advancing"].tolist(),
+                adr_counts["declining"].tolist(),
+                short_period=self._config.adr_short_period,
+                medium_period=self._config.adr_medium_period,
+                divergence_threshold=self._config.adr_divergence_threshold,
+            )
+        else:
+            adr_result = self._adr_service.calculate(
+                universe_prices if universe_prices is not None else {},
+                short_period=self._config.adr_short_period,
+                medium_period=self._config.adr_medium_period,
+                divergence_threshold=self._config.adr_divergence_threshold,
+            )
 
         adr = AdvancingDecliningRatio(
             short_term=adr_result.short_term_adr,
@@ -114,6 +128,116 @@ class MarketRegimeAnalyzer:
             divergence=adr_result.divergence,
         )
 
+        return self._build_regime(
+            analysis_date, nikkei_trend, volatility, sentiment, adr
+        )
+
+    def analyze_range(
+        self,
+        nikkei_df: pd.DataFrame,
+        topix_df: pd.DataFrame,
+        universe_prices: Optional[pd.DataFrame],
+        analysis_dates: Union[Sequence[date], pd.DatetimeIndex],
+        *,
+        min_history: int = 30,
+        min_symbol_history: int = 5,
+    ) -> List[MarketRegime]:
+        """
+        複数の基準日について市場レジームを一括で分析する.
+
+        指標は全期間で1回だけ計算し、各基準日ではその日までの最新値を参照する。
+        各日の結果は、その日までのデータに絞ってanalyzeを呼んだ結果と一致する。
+
+        Args:
+            nikkei_df: 日経225 ETF (1321.T) OHLCV データ（全期間）
+            topix_df: TOPIX ETF (1306.T) OHLCV データ（全期間）
+            universe_prices: ユニバース終値の横持ちDataFrame
+                (index=date, columns=symbols)
+            analysis_dates: 分析基準日のリスト（昇順）
+            min_history: 基準日までに必要な指数データの件数
+            min_symbol_history: ADR集計対象とする銘柄の最小データ件数
+
+        Returns:
+            基準日ごとのMarketRegimeリスト（データ不足の日は含まない）
+        """
+        nikkei_data = self._technical_service.calculate_all(nikkei_df).data
+        topix_data = self._technical_service.calculate_all(topix_df).data
+
+        # 各行時点での最新値（dropna後の末尾値）を前方補完で表す
+        adx = self._latest_series(nikkei_data, "adx_14")
+        atr = self._latest_series(nikkei_data, "atr_14")
+        close = self._latest_series(nikkei_data, "close")
+        bb_width = self._latest_series(nikkei_data, "bb_width")
+        nikkei_slope = self._slope_series(nikkei_data)
+        topix_slope = self._slope_series(topix_data)
+
+        adr_frame = self._adr_service.calculate_series(
+            universe_prices if universe_prices is not None else pd.DataFrame(),
+            short_period=self._config.adr_short_period,
+            medium_period=self._config.adr_medium_period,
+            divergence_threshold=self._config.adr_divergence_threshold,
+            min_observations=min_symbol_history,
+        )
+
+        # 各基準日について、その日以前の最終行の位置を求める
+        dates = pd.DatetimeIndex(list(analysis_dates))
+        nikkei_pos = nikkei_data.index.searchsorted(dates, side="right") - 1
+        topix_pos = topix_data.index.searchsorted(dates, side="right") - 1
+        adr_pos = adr_frame.index.searchsorted(dates, side="right") - 1
+
+        results: List[MarketRegime] = []
+        for i, target in enumerate(dates):
+            n, t, a = int(nikkei_pos[i]), int(topix_pos[i]), int(adr_pos[i])
+            if n + 1 < min_history or t + 1 < min_history:
+                continue
+
+            nikkei_trend = self._build_trend_analysis(
+                self._value_at(adx, n, 20.0),
+                self._direction_from_slope(float(nikkei_slope.iloc[n])),
+            )
+            topix_trend_direction = self._direction_from_slope(
+                float(topix_slope.iloc[t])
+            )
+            volatility = self._build_volatility_analysis(
+                self._value_at(atr, n, 0.0),
+                self._value_at(close, n, 1.0),
+                self._value_at(bb_width, n, 0.0),
+            )
+            sentiment = self._analyze_sentiment(
+                nikkei_trend.trend_direction, topix_trend_direction
+            )
+
+            if a >= 0:
+                row = adr_frame.iloc[a]
+                adr = AdvancingDecliningRatio(
+                    short_term=float(row["short_term_adr"]),
+                    medium_term=float(row["medium_term_adr"]),
+                    divergence=row["divergence"],
+                )
+            else:
+                adr = AdvancingDecliningRatio(
+                    short_term=100.0,
+                    medium_term=100.0,
+                    divergence=ADRDivergence.NEUTRAL,
+                )
+
+            results.append(
+                self._build_regime(
+                    target.date(), nikkei_trend, volatility, sentiment, adr
+                )
+            )
+
+        return results
+
+    def _build_regime(
+        self,
+        analysis_date: date,
+        nikkei_trend: TrendAnalysis,
+        volatility: VolatilityAnalysis,
+        sentiment: SentimentAnalysis,
+        adr: AdvancingDecliningRatio,
+    ) -> MarketRegime:
+        """分析結果から環境分類とリスク評価を行いMarketRegimeを組み立てる."""
         # 環境分類
         environment = self._classify_environment(nikkei_trend, volatility, adr)
 
@@ -156,6 +280,13 @@ class MarketRegimeAnalyzer:
         # ADX値の取得
         adx_value = self._get_latest_value(df, "adx_14", 20.0)
 
+        # トレンド方向の判定（SMA傾き）
+        return self._build_trend_analysis(adx_value, self._get_trend_direction(df))
+
+    def _build_trend_analysis(
+        self, adx_value: float, trend_direction: TrendDirection
+    ) -> TrendAnalysis:
+        """ADX値とトレンド方向からTrendAnalysisを作成."""
         # トレンド種別の判定
         if adx_value >= self._config.adx_trending_threshold:
             trend_type = TrendType.TRENDING
@@ -167,9 +298,6 @@ class MarketRegimeAnalyzer:
             trend_type = TrendType.RANGING
             adx_interpretation = "No Trend"
 
-        # トレンド方向の判定（SMA傾き）
-        trend_direction = self._get_trend_direction(df)
-
         return TrendAnalysis(
             trend_type=trend_type,
             trend_direction=trend_direction,
@@ -196,6 +324,10 @@ class MarketRegimeAnalyzer:
                 return TrendDirection.SIDEWAYS
             slope = (sma.iloc[-1] - sma.iloc[-5]) / sma.iloc[-5] * 100 / 5
 
+        return self._direction_from_slope(slope)
+
+    def _direction_from_slope(self, slope: float) -> TrendDirection:
+        """SMA傾き（%/日）からトレンド方向を判定."""
         if slope > self._config.sma_slope_uptrend:
             return TrendDirection.UPTREND
         elif slope < self._config.sma_slope_downtrend:
@@ -209,13 +341,21 @@ class MarketRegimeAnalyzer:
 
         ATR%とボリンジャーバンド幅から判定する。
         """
+        return self._build_volatility_analysis(
+            self._get_latest_value(df, "atr_14", 0.0),
+            self._get_latest_value(df, "close", 1.0),
+            self._get_latest_value(df, "bb_width", 0.0),
+        )
+
+    def _build_volatility_analysis(
+        self, atr: float, close: float, bb_width_ratio: float
+    ) -> VolatilityAnalysis:
+        """ATR・終値・BB幅からVolatilityAnalysisを作成."""
         # ATR%の計算
-        atr = self._get_latest_value(df, "atr_14", 0.0)
-        close = self._get_latest_value(df, "close", 1.0)
         atr_percent = (atr / close) * 100 if close > 0 else 0.0
 
         # ボリンジャーバンド幅
-        bb_width = self._get_latest_value(df, "bb_width", 0.0) * 100  # %に変換
+        bb_width = bb_width_ratio * 100  # %に変換
 
         # ボラティリティレベル判定
         if atr_percent < self._config.atr_low_threshold:
@@ -399,3 +539,36 @@ class MarketRegimeAnalyzer:
             return default
 
         return float(series.iloc[-1])
+
+    def _latest_series(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """各行時点での最新値（欠損は直前の値で補完）の系列を取得."""
+        if column not in df.columns:
+            return pd.Series(float("nan"), index=df.index)
+        return df[column].astype("float64").ffill()
+
+    def _slope_series(self, df: pd.DataFrame) -> pd.Series:
+        """
+        各行時点でのSMA傾き（%/日）の系列を取得.
+
+        各値は、その行までのデータで_get_trend_directionが使う傾きと一致する。
+        """
+        sma_col = f"sma_{self._config.sma_period}"
+
+        if sma_col not in df.columns:
+            if "close" not in df.columns:
+                return pd.Series(float("nan"), index=df.index)
+            close = df["close"].astype("float64")
+            base = close.shift(4)
+            return (close - base) / base * 100 / 5
+
+        sma = df[sma_col].astype("float64").dropna()
+        base = sma.shift(4)
+        slope = (sma - base) / base * 100 / 5
+        return slope.reindex(df.index).ffill()
+
+    def _value_at(self, series: pd.Series, position: int, default: float) -> float:
+        """系列の指定位置の値を取得（欠損時はデフォルト値）."""
+        value = series.iloc[position]
+        if pd.isna(value):
+            return default
+        return float(value)
@@ -0,0 +1,5 @@
+"""Local result caches."""
+
+from src.infrastructure.cache.regime_cache import RegimeCache, RegimesByDate
+
+__all__ = ["RegimeCache", "RegimesByDate"]
@@ -0,0 +1,111 @@
+"""Disk cache for market regime analysis results."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from src.domain.models.market_regime import MarketRegime
+
+# Default cache directory (<project root>/.cache/regime)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[3] / ".cache" / "regime"
+
+# Analysis date -> result (None when the date had too little history)
+RegimesByDate = dict[date, MarketRegime | None]
+
+
+class RegimeCache:
+    """
+    分析結果（基準日ごとのMarketRegime）のディスクキャッシュ.
+
+    Universeと入力データのバージョンごとに、基準日をキーとした結果を保持する。
+    キーにはデータバージョンを含めるため、価格データが更新されると
+    自動的に別キーとなり、古い結果は参照されなくなる。
+    Universeごとに最新のキーのファイルだけを残し、古いファイルはputで削除する。
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
+        """
+        キャッシュを初期化する.
+
+        Args:
+            cache_dir: キャッシュファイルの保存先ディレクトリ
+        """
+        self._cache_dir = cache_dir
+
+    @staticmethod
+    def build_key(universe_id: int, data_version: str) -> str:
+        """
+        Universeとデータバージョンからキャッシュキーを作成する.
+
+        Args:
+            universe_id: UniverseのID
+            data_version: 入力データのバージョン文字列
+
+        Returns:
+            キャッシュキー（"<universe_id>-<16進文字列>"）
+        """
+        digest = hashlib.blake2b(data_version.encode(), digest_size=16).hexdigest()
+        return f"{universe_id}-{digest}"
+
+    def get(self, key: str) -> RegimesByDate:
+        """
+        キャッシュされた分析結果を取得する.
+
+        Args:
+            key: build_keyで作成したキー
+
+        Returns:
+            基準日をキーとした分析結果（データ不足で結果が無い日はNone）。
+            キャッシュが無い・読めない場合は空の辞書
+        """
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            TypeError,
+        ):
+            # 破損したファイルや、クラス定義が変わった古いpickleはミス扱い
+            return {}
+
+    def put(self, key: str, regimes: RegimesByDate) -> None:
+        """
+        分析結果をキャッシュに保存する.
+
+        一時ファイルに書き込んでから置き換えるため、並行して読み込まれても
+        書きかけのファイルが見えることはない。
+        保存後、同じUniverseの古いバージョンのファイルは削除する。
+
+        Args:
+            key: build_keyで作成したキー
+            regimes: 保存する分析結果（getで取得した結果に追加したもの）
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(regimes, f, protocol=pickle.HIGHEST_PROTOCOL)
+            Path(tmp_name).replace(self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._prune(key)
+
+    def _prune(self, key: str) -> None:
+        """keyと同じUniverseの、置き換えられた古いキャッシュファイルを削除する."""
+        universe_part = key.split("-", 1)[0]
+        for path in self._cache_dir.glob(f"{universe_part}-*.pkl"):
+            if path.stem != key:
+                path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """キーに対応するキャッシュファイルのパス."""
+        return self._cache_dir / f"{key}.pkl"
@@ -1,6 +1,58 @@
 """Database configuration and session management."""
 
-from sqlalchemy.orm import DeclarativeBase
+import threading
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+
+# PostgreSQL bind parameter limit per statement (65535) with some headroom.
+# Multi-row INSERTs must keep rows * columns below this value.
+MAX_BIND_PARAMS = 65000
+
+# create_engine() options shared by every PostgreSQL entry point (CLI and
+# Streamlit). executemany INSERTs are sent as multi-row VALUES pages and other
+# executemany statements (UPDATE/DELETE) through psycopg2's execute_batch.
+ENGINE_OPTIONS: dict[str, Any] = {
+    "query_cache_size": 1200,
+    "insertmanyvalues_page_size": 10000,
+    "executemany_mode": "values_plus_batch",
+    "executemany_batch_page_size": 200,
+}
+
+# Connection pool settings. Connections are health-checked on checkout and
+# recycled before server/firewall idle timeouts drop them.
+POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+# One engine (and therefore one connection pool) per URL for the process
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(database_url: str) -> Engine:
+    """
+    Return the process-wide engine for a database URL.
+
+    The engine is created on first use with ENGINE_OPTIONS and POOL_OPTIONS
+    and reused afterwards, so repeated CLI commands and Streamlit reruns share
+    pooled connections instead of reconnecting.
+    """
+    with _engines_lock:
+        engine = _engines.get(database_url)
+        if engine is None:
+            engine = create_engine(database_url, **ENGINE_OPTIONS, **POOL_OPTIONS)
+            _engines[database_url] = engine
+        return engine
+
+
+def create_session(database_url: str) -> Session:
+    """Create a new session bound to the shared engine for a database URL."""
+    return sessionmaker(bind=get_engine(database_url))()
 
 
 class Base(DeclarativeBase):
@@ -0,0 +1,101 @@
+"""Dialect-aware SQL expressions shared by the repositories."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportIncompatibleVariableOverride=false
+# NOTE: SQLAlchemy compiler extension hooks are untyped
+
+from typing import Any
+
+from sqlalchemy import ARRAY, Boolean, ColumnElement, LargeBinary, bindparam
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import BindParameter
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+class AnyOf(ColumnElement[bool]):
+    """
+    ``column = ANY(:values)`` on PostgreSQL, ``column IN (...)`` elsewhere.
+
+    PostgreSQL receives the whole list as a single array parameter, so the
+    statement text and plan do not grow with the number of values.
+    """
+
+    __visit_name__ = "any_of"
+    inherit_cache = True
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("array", InternalTraversal.dp_clauseelement),
+        ("expanding", InternalTraversal.dp_clauseelement),
+    ]
+    type = Boolean()
+
+    def __init__(
+        self,
+        column: ColumnElement[Any],
+        array: BindParameter[Any],
+        expanding: BindParameter[Any],
+    ) -> None:
+        self.column = column
+        self.array = array
+        self.expanding = expanding
+
+
+def any_of(column: ColumnElement[Any], values: Any) -> AnyOf:
+    """
+    Match ``column`` against a list of values bound as one parameter.
+
+    Args:
+        column: Column to compare.
+        values: The values, or a ``bindparam`` whose value is supplied at
+            execution time.
+    """
+    if isinstance(values, BindParameter):
+        key, value = values.key, values.value
+    else:
+        key, value = None, list(values)
+    # Both forms share the caller's key (if any), so either one is filled by the
+    # same execution argument; only the form for the current dialect is rendered
+    array = bindparam(key, value, type_=ARRAY(column.type))
+    expanding = bindparam(key, value, expanding=True)
+    return AnyOf(column, array, expanding)
+
+
+@compiles(AnyOf, "postgresql")
+def _compile_any_of_postgresql(element: AnyOf, compiler: SQLCompiler, **kw: Any) -> str:
+    column = compiler.process(element.column, **kw)
+    array = compiler.process(element.array, **kw)
+    return f"{column} = ANY({array})"
+
+
+@compiles(AnyOf)
+def _compile_any_of_default(element: AnyOf, compiler: SQLCompiler, **kw: Any) -> str:
+    return compiler.process(element.column.in_(element.expanding), **kw)
+
+
+class Md5Digest(FunctionElement[bytes]):
+    """
+    The 16-byte MD5 digest of a text expression.
+
+    PostgreSQL renders ``decode(md5(text), 'hex')``. Other dialects call a
+    ``md5_digest(text)`` function, which the SQLite test engine registers.
+    """
+
+    name = "md5_digest"
+    type = LargeBinary(16)
+    inherit_cache = True
+
+
+@compiles(Md5Digest, "postgresql")
+def _compile_md5_digest_postgresql(
+    element: Md5Digest, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return f"decode(md5({compiler.process(element.clauses, **kw)}), 'hex')"
+
+
+@compiles(Md5Digest)
+def _compile_md5_digest_default(
+    element: Md5Digest, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return f"md5_digest({compiler.process(element.clauses, **kw)})"
@@ -8,11 +8,13 @@ from various analyst firms.
 import enum
 
 from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
     Column,
     Date,
     DateTime,
-    Enum,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Numeric,
@@ -53,7 +55,11 @@ class AnalystRating(Base):
     __tablename__ = "analyst_ratings"
 
     # Primary Key
-    rating_id = Column(Integer, primary_key=True, autoincrement=True)
+    rating_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Key
     ticker_id = Column(
@@ -62,14 +68,9 @@ class AnalystRating(Base):
 
     # Rating Information
     rating_date = Column(Date, nullable=False, index=True)
-    rating = Column(
-        Enum(Rating, name="rating_enum", create_type=True),
-        nullable=False,
-    )
+    rating = Column(String(12), nullable=False)  # Rating.value
     firm = Column(String(100))  # Analyst firm name (nullable - not always provided)
-    action = Column(
-        Enum(RatingAction, name="rating_action_enum", create_type=True)
-    )  # Rating action (nullable)
+    action = Column(String(12))  # RatingAction.value (nullable)
     target_price = Column(Numeric(10, 2))  # Price target
 
     # Metadata
@@ -78,8 +79,18 @@ class AnalystRating(Base):
     # Relationship
     ticker = relationship("Ticker", back_populates="analyst_ratings")
 
-    # Indexes
+    # Constraints & Indexes
     __table_args__ = (
+        # Plain VARCHAR + CHECK instead of a PostgreSQL ENUM type so that adding
+        # a value does not require ALTER TYPE outside of a transaction
+        CheckConstraint(
+            "rating IN ('strong_buy', 'buy', 'hold', 'sell', 'strong_sell')",
+            name="chk_rating_valid",
+        ),
+        CheckConstraint(
+            "action IN ('upgrade', 'downgrade', 'maintain', 'initiate')",
+            name="chk_rating_action_valid",
+        ),
         # Composite index for efficient time-based queries
         Index(
             "idx_rating_ticker_date",
@@ -103,6 +114,6 @@ class AnalystRating(Base):
     def __repr__(self):
         return (
             f"<AnalystRating(ticker_id={self.ticker_id}, "
-            f"rating_date={self.rating_date}, rating={self.rating.value}, "
+            f"rating_date={self.rating_date}, rating={self.rating}, "
             f"firm={self.firm})>"
         )
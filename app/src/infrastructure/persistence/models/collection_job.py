@@ -6,11 +6,13 @@ CollectionJob ORM model for tracking data collection operations.
 # NOTE: Above suppresses false positives for SQLAlchemy Column types in to_dict()
 
 from sqlalchemy import (
+    BigInteger,
     CheckConstraint,
     Column,
     Date,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     String,
@@ -44,7 +46,11 @@ class CollectionJob(Base):
 
     __tablename__ = "collection_jobs"
 
-    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
     ticker_id = Column(
         Integer,
         ForeignKey("tickers.ticker_id", ondelete="SET NULL"),
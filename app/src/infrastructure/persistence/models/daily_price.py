@@ -13,6 +13,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Numeric,
@@ -35,13 +36,19 @@ class DailyPrice(Base):
     __tablename__ = "daily_prices"
 
     # Primary Key
-    price_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    price_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Keys
     ticker_id = Column(
         Integer, ForeignKey("tickers.ticker_id", ondelete="CASCADE"), nullable=False
     )
-    date = Column(Date, nullable=False)
+    # Part of the primary key: TimescaleDB requires the partitioning column in
+    # every unique index of a hypertable
+    date = Column(Date, primary_key=True)
 
     # OHLCV Data
     open = Column(Numeric(12, 4))
@@ -96,18 +103,19 @@ class DailyPrice(Base):
 
     # Constraints
     __table_args__ = (
-        UniqueConstraint("ticker_id", "date", name="uq_ticker_date"),
+        # Also the ON CONFLICT arbiter; INCLUDE makes range reads of
+        # close/volume index-only scans without a second (ticker_id, date) btree
+        UniqueConstraint(
+            "ticker_id",
+            "date",
+            name="uq_ticker_date",
+            postgresql_include=["close", "adj_close", "volume"],
+        ),
         CheckConstraint(
             "open > 0 AND high >= low AND high >= open "
             "AND high >= close AND low <= open AND low <= close",
             name="chk_ohlc_valid",
         ),
-        Index(
-            "idx_daily_prices_ticker_date",
-            "ticker_id",
-            "date",
-            postgresql_using="btree",
-        ),
         Index("idx_daily_prices_date", "date"),
     )
 
@@ -11,10 +11,12 @@ Stores dividend ex-dividend dates for event calendar evaluation.
 from typing import Any
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     Date,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Numeric,
@@ -34,7 +36,11 @@ class DividendSchedule(Base):
     __tablename__ = "dividend_schedule"
 
     # Primary Key
-    schedule_id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Key
     ticker_id = Column(
@@ -58,14 +64,8 @@ class DividendSchedule(Base):
 
     # Indexes
     __table_args__ = (
-        # Composite index for efficient date-based queries
-        Index(
-            "idx_dividend_schedule_ticker_date",
-            "ticker_id",
-            "ex_dividend_date",
-            postgresql_using="btree",
-        ),
         # Unique constraint on ticker + ex_dividend_date
+        # (also serves ticker/date lookups, no separate composite index needed)
         Index(
             "uq_dividend_schedule",
             "ticker_id",
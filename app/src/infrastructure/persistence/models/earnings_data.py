@@ -11,6 +11,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Numeric,
@@ -32,7 +33,11 @@ class EarningsData(Base):
     __tablename__ = "earnings_data"
 
     # Primary Key
-    earnings_id = Column(Integer, primary_key=True, autoincrement=True)
+    earnings_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Key
     ticker_id = Column(
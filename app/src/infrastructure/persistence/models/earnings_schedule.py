@@ -11,11 +11,13 @@ Separate from EarningsData which stores quarterly results (EPS, revenue, etc.).
 from typing import Any
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     Date,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     String,
@@ -36,7 +38,11 @@ class EarningsSchedule(Base):
     __tablename__ = "earnings_schedule"
 
     # Primary Key
-    schedule_id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Key
     ticker_id = Column(
@@ -61,14 +67,8 @@ class EarningsSchedule(Base):
 
     # Indexes
     __table_args__ = (
-        # Composite index for efficient date-based queries
-        Index(
-            "idx_earnings_schedule_ticker_date",
-            "ticker_id",
-            "earnings_date",
-            postgresql_using="btree",
-        ),
         # Unique constraint on ticker + earnings_date
+        # (also serves ticker/date lookups, no separate composite index needed)
         Index(
             "uq_earnings_schedule",
             "ticker_id",
@@ -9,10 +9,11 @@ import enum
 
 from sqlalchemy import (
     BigInteger,
+    CheckConstraint,
     Column,
     DateTime,
-    Enum,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     String,
@@ -41,7 +42,11 @@ class FinancialStatement(Base):
     __tablename__ = "financial_statements"
 
     # Primary Key
-    statement_id = Column(Integer, primary_key=True, autoincrement=True)
+    statement_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Key
     ticker_id = Column(
@@ -49,10 +54,7 @@ class FinancialStatement(Base):
     )
 
     # Statement Classification
-    statement_type = Column(
-        Enum(StatementType, name="statement_type_enum", create_type=True),
-        nullable=False,
-    )
+    statement_type = Column(String(20), nullable=False)  # StatementType.value
 
     # Fiscal Period Identification
     fiscal_quarter = Column(String(10), nullable=False)  # Format: "Q1 2024"
@@ -71,8 +73,12 @@ class FinancialStatement(Base):
     # Relationship
     ticker = relationship("Ticker", back_populates="financial_statements")
 
-    # Indexes
+    # Constraints & Indexes
     __table_args__ = (
+        CheckConstraint(
+            "statement_type IN ('income_statement', 'balance_sheet', 'cash_flow')",
+            name="chk_statement_type_valid",
+        ),
         # Composite index for efficient statement queries
         Index(
             "idx_statement_ticker_type_quarter",
@@ -100,6 +106,6 @@ class FinancialStatement(Base):
     def __repr__(self):
         return (
             f"<FinancialStatement(ticker_id={self.ticker_id}, "
-            f"statement_type={self.statement_type.value}, "
+            f"statement_type={self.statement_type}, "
             f"fiscal_quarter={self.fiscal_quarter}, line_item={self.line_item})>"
         )
@@ -9,7 +9,9 @@ from sqlalchemy import (
     BigInteger,
     Column,
     DateTime,
+    Float,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     Numeric,
@@ -30,34 +32,38 @@ class FundamentalData(Base):
     __tablename__ = "fundamental_data"
 
     # Primary Key
-    fundamental_id = Column(Integer, primary_key=True, autoincrement=True)
+    fundamental_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Key
     ticker_id = Column(
         Integer, ForeignKey("tickers.ticker_id", ondelete="CASCADE"), nullable=False
     )
 
-    # Timestamp
-    retrieved_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Timestamp (part of the primary key: TimescaleDB requires the partitioning
+    # column in every unique index of a hypertable)
+    retrieved_at = Column(DateTime(timezone=True), primary_key=True)
 
     # Earnings Per Share
     eps_trailing = Column(Numeric(20, 4))  # Trailing 12-month EPS (can be negative)
     eps_forward = Column(Numeric(20, 4))  # Forward EPS estimate
 
     # Price-to-Earnings Ratios
-    per_trailing = Column(Numeric(10, 2))  # Trailing P/E ratio
-    per_forward = Column(Numeric(10, 2))  # Forward P/E ratio
+    per_trailing = Column(Float(asdecimal=False))  # Trailing P/E ratio
+    per_forward = Column(Float(asdecimal=False))  # Forward P/E ratio
 
     # Other Valuation Metrics
-    peg_ratio = Column(Numeric(10, 2))  # Price/Earnings-to-Growth ratio
+    peg_ratio = Column(Float(asdecimal=False))  # Price/Earnings-to-Growth ratio
     market_cap = Column(BigInteger)  # Market capitalization
 
     # Income and Growth Metrics
-    dividend_yield = Column(
-        Numeric(5, 4)
-    )  # Dividend yield as decimal (e.g., 0.0215 for 2.15%)
-    profit_margin = Column(Numeric(5, 4))  # Profit margin as decimal
-    earnings_growth = Column(Numeric(6, 4))  # YoY earnings growth as decimal
+    # Dividend yield as decimal (e.g., 0.0215 for 2.15%)
+    dividend_yield = Column(Float(asdecimal=False))
+    profit_margin = Column(Float(asdecimal=False))  # Profit margin as decimal
+    earnings_growth = Column(Float(asdecimal=False))  # YoY earnings growth as decimal
 
     # Relationship
     ticker = relationship("Ticker", back_populates="fundamental_data")
@@ -71,9 +77,17 @@ class FundamentalData(Base):
             "retrieved_at",
             postgresql_using="btree",
             postgresql_ops={"retrieved_at": "DESC"},
+            postgresql_include=["eps_trailing", "per_trailing"],
         ),
         # Unique constraint to prevent duplicate snapshots
         Index("uq_fundamental_ticker_date", "ticker_id", "retrieved_at", unique=True),
+        # BRIN for unscoped time-range scans (snapshots are appended daily)
+        Index(
+            "idx_fundamental_retrieved_at_brin",
+            "retrieved_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
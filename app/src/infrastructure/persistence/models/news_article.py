@@ -5,18 +5,30 @@ Stores recent news articles with publication metadata.
 Maintains windowed retention (50 most recent articles per ticker).
 """
 
+import hashlib
+
 from sqlalchemy import (
+    BigInteger,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
 )
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.persistence.database import Base
+from src.infrastructure.persistence.expressions import Md5Digest
+
+
+def url_hash(url: str) -> bytes:
+    """Return the 16-byte MD5 digest used to de-duplicate article URLs."""
+    return hashlib.md5(url.encode()).digest()
 
 
 class NewsArticle(Base):
@@ -30,7 +42,11 @@ class NewsArticle(Base):
     __tablename__ = "news_articles"
 
     # Primary Key
-    article_id = Column(Integer, primary_key=True, autoincrement=True)
+    article_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True, cache=1000),
+        primary_key=True,
+    )
 
     # Foreign Key
     ticker_id = Column(
@@ -40,10 +56,13 @@ class NewsArticle(Base):
     # Article Content
     title = Column(Text, nullable=False)  # Article headline
     url = Column(Text, nullable=False)  # Article URL
+    # MD5 of url; keeps the duplicate check index small for long URLs.
+    # Generated by the database so it follows every INSERT and UPDATE of url.
+    url_hash = Column(LargeBinary(16), Computed(Md5Digest(url), persisted=True))
     publisher = Column(String(100))  # Publisher name (nullable)
 
     # Timestamps
-    published_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    published_at = Column(DateTime(timezone=True), nullable=False)
     retrieved_at = Column(DateTime(timezone=True), nullable=False)
 
     # Relationship
@@ -59,8 +78,15 @@ class NewsArticle(Base):
             postgresql_using="btree",
             postgresql_ops={"published_at": "DESC"},
         ),
-        # Unique constraint on ticker + URL to prevent duplicates
-        Index("uq_news_ticker_url", "ticker_id", "url", unique=True),
+        # Unique constraint on ticker + URL hash to prevent duplicates
+        Index("uq_news_ticker_urlhash", "ticker_id", "url_hash", unique=True),
+        # BRIN for unscoped time-range scans (rows arrive in published_at order)
+        Index(
+            "idx_news_published_at_brin",
+            "published_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
@@ -5,7 +5,17 @@ Ticker ORM model representing publicly traded securities.
 # pyright: reportUnnecessaryComparison=false
 # NOTE: Above suppresses false positives for SQLAlchemy Column types in to_dict()
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, Numeric, String, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.persistence.database import Base
@@ -37,7 +47,7 @@ class Ticker(Base):
     currency = Column(String(10))
     sector = Column(String(100), index=True)
     industry = Column(String(100), index=True)
-    beta = Column(Numeric(6, 3))  # Market beta (volatility indicator)
+    beta = Column(Float(asdecimal=False))  # Market beta (volatility indicator)
     fifty_two_week_high = Column(Numeric(10, 2))  # 52-week high price
     fifty_two_week_low = Column(Numeric(10, 2))  # 52-week low price
     is_active = Column(Boolean, default=True, nullable=False)
@@ -51,36 +61,88 @@ class Ticker(Base):
         nullable=False,
     )
 
-    # Relationships
+    __table_args__ = (
+        # Trigram index for substring search (ILIKE '%query%') on symbol/name
+        Index(
+            "idx_tickers_symbol_name_trgm",
+            "symbol",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"symbol": "gin_trgm_ops", "name": "gin_trgm_ops"},
+        ),
+    )
+
+    # Relationships (load explicitly with selectinload; rows are removed by the
+    # ON DELETE rules of the foreign keys rather than loaded for cascading)
     daily_prices = relationship(
-        "DailyPrice", back_populates="ticker", cascade="all, delete-orphan"
+        "DailyPrice",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     collection_jobs = relationship(
-        "CollectionJob", back_populates="ticker", cascade="all, delete-orphan"
+        "CollectionJob",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     watchlist_associations = relationship(
-        "WatchlistTicker", back_populates="ticker", cascade="all, delete-orphan"
+        "WatchlistTicker",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     fundamental_data = relationship(
-        "FundamentalData", back_populates="ticker", cascade="all, delete-orphan"
+        "FundamentalData",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     earnings_data = relationship(
-        "EarningsData", back_populates="ticker", cascade="all, delete-orphan"
+        "EarningsData",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     earnings_schedule = relationship(
-        "EarningsSchedule", back_populates="ticker", cascade="all, delete-orphan"
+        "EarningsSchedule",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     dividend_schedule = relationship(
-        "DividendSchedule", back_populates="ticker", cascade="all, delete-orphan"
+        "DividendSchedule",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     financial_statements = relationship(
-        "FinancialStatement", back_populates="ticker", cascade="all, delete-orphan"
+        "FinancialStatement",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     analyst_ratings = relationship(
-        "AnalystRating", back_populates="ticker", cascade="all, delete-orphan"
+        "AnalystRating",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     news_articles = relationship(
-        "NewsArticle", back_populates="ticker", cascade="all, delete-orphan"
+        "NewsArticle",
+        back_populates="ticker",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self):
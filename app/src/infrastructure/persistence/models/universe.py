@@ -48,9 +48,14 @@ class Universe(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
-    # Relationships
+    # Relationships (load explicitly with selectinload; rows are removed by the
+    # ON DELETE rules of the foreign keys rather than loaded for cascading)
     symbol_associations = relationship(
-        "UniverseSymbol", back_populates="universe", cascade="all, delete-orphan"
+        "UniverseSymbol",
+        back_populates="universe",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self):
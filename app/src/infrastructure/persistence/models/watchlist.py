@@ -5,7 +5,7 @@ Watchlist ORM model for user-defined ticker collections.
 # pyright: reportUnnecessaryComparison=false
 # NOTE: Above suppresses false positives for SQLAlchemy Column types in to_dict()
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.persistence.database import Base
@@ -26,7 +26,7 @@ class Watchlist(Base):
     __tablename__ = "watchlists"
 
     watchlist_id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(100), unique=True, nullable=False)
+    name = Column(String(100), nullable=False)
     description = Column(Text)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -38,12 +38,26 @@ class Watchlist(Base):
         nullable=False,
     )
 
-    # Relationships
+    __table_args__ = (
+        # Names are unique regardless of case; also serves lower(name) lookups
+        Index("uq_watchlists_name_ci", func.lower(name), unique=True),
+    )
+
+    # Relationships (load explicitly with selectinload; rows are removed by the
+    # ON DELETE rules of the foreign keys rather than loaded for cascading)
     ticker_associations = relationship(
-        "WatchlistTicker", back_populates="watchlist", cascade="all, delete-orphan"
+        "WatchlistTicker",
+        back_populates="watchlist",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     collection_schedules = relationship(
-        "CollectionSchedule", back_populates="watchlist", cascade="all, delete-orphan"
+        "CollectionSchedule",
+        back_populates="watchlist",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -2,15 +2,21 @@
 
 # pyright: reportAttributeAccessIssue=false, reportUnknownVariableType=false
 # pyright: reportArgumentType=false, reportUnnecessaryComparison=false
-# NOTE: SQLAlchemy ORM Column assignment and pandas iterrows() typing issues
+# pyright: reportUnknownArgumentType=false
+# NOTE: SQLAlchemy ORM Column access and pandas to_dict() typing issues
 
+import io
 from datetime import date
-from decimal import Decimal
-from typing import Any
+from typing import Any, cast
 
 import pandas as pd
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, func, select, table, text
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, SessionTransaction
 
+from src.infrastructure.persistence.database import MAX_BIND_PARAMS
+from src.infrastructure.persistence.expressions import any_of
 from src.infrastructure.persistence.models import DailyPrice, Ticker
 
 # Indicator columns that can be saved from DataFrame
@@ -42,6 +48,72 @@ INDICATOR_COLUMNS: list[str] = [
 # Columns that should be stored as integers
 INTEGER_COLUMNS: set[str] = {"obv", "volume_ma_20"}
 
+# OHLCV columns, always overwritten on upsert
+PRICE_COLUMNS: list[str] = ["open", "high", "low", "close", "volume"]
+
+# All value columns written by bulk_upsert_from_dataframe
+UPSERT_COLUMNS: list[str] = [*PRICE_COLUMNS, "adj_close", *INDICATOR_COLUMNS]
+
+# OHLCV columns selected for DataFrame reads. Prices are cast to float8 in SQL
+# so pandas gets float64 columns instead of Decimal objects.
+OHLCV_SELECT_COLUMNS = (
+    DailyPrice.date,
+    DailyPrice.open.cast(Float).label("open"),
+    DailyPrice.high.cast(Float).label("high"),
+    DailyPrice.low.cast(Float).label("low"),
+    DailyPrice.close.cast(Float).label("close"),
+    DailyPrice.volume,
+    DailyPrice.adj_close.cast(Float).label("adj_close"),
+)
+
+# Row count from which bulk_upsert_from_dataframe switches to COPY
+COPY_THRESHOLD = 10_000
+
+# Session-local staging table for bulk_copy_from_dataframe
+STAGING_TABLE = "staging_daily_prices"
+
+# Columns loaded through COPY, in CSV order
+COPY_COLUMNS: list[str] = ["ticker_id", "date", *UPSERT_COLUMNS]
+
+# The staging table holds only the COPY columns, with their daily_prices types.
+# LIKE daily_prices would also copy NOT NULL on price_id, an identity column
+# whose value is never supplied by COPY.
+STAGING_TABLE_DDL = (
+    f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} ON COMMIT DROP AS "
+    f"SELECT {', '.join(COPY_COLUMNS)} FROM daily_prices WITH NO DATA"
+)
+
+
+def _on_conflict_upsert(stmt: Insert) -> Insert:
+    """daily_prices向けのON CONFLICT DO UPDATE句を付与する."""
+    # OHLCVは常に上書き、その他は新しい値がNULLなら既存値を保持する
+    return stmt.on_conflict_do_update(
+        index_elements=["ticker_id", "date"],
+        set_={
+            col: (
+                stmt.excluded[col]
+                if col in PRICE_COLUMNS
+                else func.coalesce(stmt.excluded[col], DailyPrice.__table__.c[col])
+            )
+            for col in UPSERT_COLUMNS
+        },
+    )
+
+
+# Built once and executed with executemany parameters (compiled SQL is cached)
+UPSERT_STATEMENT = _on_conflict_upsert(pg_insert(DailyPrice.__table__))
+
+# Merges the COPY staging table into daily_prices with the same semantics
+STAGING_UPSERT_STATEMENT = _on_conflict_upsert(
+    pg_insert(DailyPrice.__table__).from_select(
+        COPY_COLUMNS,
+        select(text(", ".join(COPY_COLUMNS))).select_from(table(STAGING_TABLE)),
+    )
+)
+
+# Process-local symbol -> ticker_id cache (IDs are stable, ORM objects are not)
+_ticker_id_cache: dict[str, int] = {}
+
 
 class PostgresDailyPriceRepository:
     """
@@ -50,14 +122,16 @@ class PostgresDailyPriceRepository:
     SQLAlchemyセッションを使用してDailyPriceエンティティの永続化を行う。
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, batch_size: int = 1000) -> None:
         """
         リポジトリを初期化する.
 
         Args:
             session: SQLAlchemyセッション
+            batch_size: bulk_upsert_from_dataframeで1文あたりに書き込む最大行数
         """
         self._session = session
+        self._batch_size = batch_size
 
     def get_by_ticker_and_date(
         self, ticker_id: int, target_date: date
@@ -87,6 +161,88 @@ class PostgresDailyPriceRepository:
             .all()
         )
 
+    def get_dataframe_by_ticker_and_date_range(
+        self,
+        ticker_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> pd.DataFrame:
+        """
+        TickerIDと日付範囲でOHLCVをDataFrameとして取得する.
+
+        ORMオブジェクトを生成せずに必要なカラムだけを読み込む分析向けの経路。
+        get_by_ticker_and_date_range + daily_prices_to_dataframeと同じ形式を返す。
+
+        Args:
+            ticker_id: TickerID
+            start_date: 開始日（この日を含む）
+            end_date: 終了日（この日を含む）
+
+        Returns:
+            OHLCV形式のDataFrame（DatetimeIndex、日付昇順）
+        """
+        stmt = (
+            select(*OHLCV_SELECT_COLUMNS)
+            .where(
+                DailyPrice.ticker_id == ticker_id,
+                DailyPrice.date >= start_date,
+                DailyPrice.date <= end_date,
+            )
+            .order_by(DailyPrice.date)
+        )
+        return self._read_ohlcv_frame(stmt)
+
+    def _read_ohlcv_frame(self, stmt: Any) -> pd.DataFrame:
+        """OHLCV_SELECT_COLUMNSを選択するSELECTをDataFrameとして読み込む."""
+        # セッションの接続を使い、未コミットの書き込みも参照できるようにする
+        df = pd.read_sql(
+            stmt, self._session.connection(), index_col="date", parse_dates=["date"]
+        )
+        # adj_closeが1件も無い場合はdaily_prices_to_dataframeと同様に列を持たない
+        if df["adj_close"].isna().all():
+            df = df.drop(columns=["adj_close"])
+        return df
+
+    def get_dataframes_by_symbols_and_date_range(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        複数シンボルのOHLCVを1クエリで取得し、シンボルごとのDataFrameに分割する.
+
+        Args:
+            symbols: ティッカーシンボルのリスト
+            start_date: 開始日（この日を含む）
+            end_date: 終了日（この日を含む）
+
+        Returns:
+            {symbol: OHLCV形式のDataFrame}（価格データの無いシンボルは含まない）
+        """
+        if not symbols:
+            return {}
+        stmt = (
+            select(Ticker.symbol, *OHLCV_SELECT_COLUMNS)
+            .join(Ticker, Ticker.ticker_id == DailyPrice.ticker_id)
+            .where(
+                any_of(Ticker.symbol, symbols),
+                DailyPrice.date >= start_date,
+                DailyPrice.date <= end_date,
+            )
+            .order_by(Ticker.symbol, DailyPrice.date)
+        )
+        df = pd.read_sql(
+            stmt, self._session.connection(), index_col="date", parse_dates=["date"]
+        )
+        result: dict[str, pd.DataFrame] = {}
+        for symbol, group in df.groupby("symbol", sort=False):
+            frame = group.drop(columns=["symbol"])
+            if frame["adj_close"].isna().all():
+                frame = frame.drop(columns=["adj_close"])
+            result[str(symbol)] = frame
+        return result
+
     def save(self, daily_price: DailyPrice) -> DailyPrice:
         """
         DailyPriceを保存する.
@@ -101,6 +257,15 @@ class PostgresDailyPriceRepository:
         self._session.flush()
         return daily_price
 
+    def savepoint(self) -> SessionTransaction:
+        """
+        SAVEPOINTを開始する（with文で使用）.
+
+        ブロック内で例外が発生した場合はSAVEPOINTまでロールバックされ、
+        それ以前の書き込みと外側のトランザクションは維持される。
+        """
+        return self._session.begin_nested()
+
     def bulk_upsert_from_dataframe(
         self,
         ticker_id: int,
@@ -119,72 +284,113 @@ class PostgresDailyPriceRepository:
         Returns:
             保存されたレコード数
         """
-        count = 0
+        if df.empty:
+            return 0
+        if len(df) >= COPY_THRESHOLD:
+            return self.bulk_copy_from_dataframe(ticker_id, df)
+
+        rows = self._dataframe_to_rows(ticker_id, df)
+
+        # バインドパラメータ上限を超えないよう行数を分割する
+        batch_size = max(1, min(self._batch_size, MAX_BIND_PARAMS // len(rows[0])))
+        with self._session.begin_nested():
+            for start in range(0, len(rows), batch_size):
+                self._session.execute(
+                    UPSERT_STATEMENT, rows[start : start + batch_size]
+                )
+        return len(rows)
+
+    def bulk_copy_from_dataframe(
+        self,
+        ticker_id: int,
+        df: pd.DataFrame,
+    ) -> int:
+        """
+        DataFrameをCOPYで一時テーブルに投入し、daily_pricesへupsertする.
+
+        大量の履歴データ向けの高速経路。ORMとexecutemanyを経由せず、
+        psycopg2のcopy_expertでCSVを流し込んでから1文でマージする。
+        upsertの挙動はbulk_upsert_from_dataframeと同じ。
+
+        Args:
+            ticker_id: TickerID
+            df: 価格データを含むDataFrame（bulk_upsert_from_dataframeと同じ形式）
+
+        Returns:
+            保存されたレコード数
+        """
+        if df.empty:
+            return 0
 
-        for idx, row in df.iterrows():
-            # idx is DatetimeIndex, extract date
-            price_date: date = (
-                idx.date() if hasattr(idx, "date") else idx  # type: ignore[union-attr,assignment]
+        buffer = io.StringIO()
+        self._dataframe_to_frame(ticker_id, df).to_csv(
+            buffer, index=False, header=False, na_rep="\\N"
+        )
+        buffer.seek(0)
+
+        # 同一トランザクション内で複数回呼ばれても再利用できるよう空にしておく
+        self._session.execute(text(STAGING_TABLE_DDL))
+        self._session.execute(text(f"TRUNCATE {STAGING_TABLE}"))
+
+        # セッションと同じDBAPI接続（同じトランザクション）でCOPYする
+        cursor = self._session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE} ({', '.join(COPY_COLUMNS)}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
             )
+        finally:
+            cursor.close()
 
-            # Check if record already exists
-            existing = self.get_by_ticker_and_date(ticker_id, price_date)
-
-            if existing:
-                # Update existing record - OHLCV
-                existing.open = Decimal(str(row["open"]))
-                existing.high = Decimal(str(row["high"]))
-                existing.low = Decimal(str(row["low"]))
-                existing.close = Decimal(str(row["close"]))
-                existing.volume = int(row["volume"])
-                if "adj_close" in row:
-                    existing.adj_close = Decimal(str(row["adj_close"]))
-
-                # Update indicator columns
-                for col in INDICATOR_COLUMNS:
-                    if col in row and pd.notna(row[col]):
-                        setattr(existing, col, self._convert_value(col, row[col]))
-            else:
-                # Create new record - prepare indicator data
-                indicator_data: dict[str, Any] = {}
-                for col in INDICATOR_COLUMNS:
-                    if col in row and pd.notna(row[col]):
-                        indicator_data[col] = self._convert_value(col, row[col])
-
-                daily_price = DailyPrice(
-                    ticker_id=ticker_id,
-                    date=price_date,
-                    open=Decimal(str(row["open"])),
-                    high=Decimal(str(row["high"])),
-                    low=Decimal(str(row["low"])),
-                    close=Decimal(str(row["close"])),
-                    volume=int(row["volume"]),
-                    adj_close=(
-                        Decimal(str(row["adj_close"])) if "adj_close" in row else None
-                    ),
-                    **indicator_data,
-                )
-                self._session.add(daily_price)
+        self._session.execute(STAGING_UPSERT_STATEMENT)
+        return len(df)
 
-            count += 1
+    def _dataframe_to_rows(
+        self, ticker_id: int, df: pd.DataFrame
+    ) -> list[dict[str, Any]]:
+        """
+        DataFrameをINSERT用の行辞書リストに変換する.
 
-        self._session.flush()
-        return count
+        Args:
+            ticker_id: TickerID
+            df: 価格データを含むDataFrame（index: DatetimeIndex）
+
+        Returns:
+            daily_pricesテーブルのカラム名をキーとする辞書のリスト
+        """
+        frame = self._dataframe_to_frame(ticker_id, df)
+        return cast("list[dict[str, Any]]", frame.to_dict(orient="records"))
 
-    def _convert_value(self, column: str, value: float) -> Decimal | int:
+    def _dataframe_to_frame(self, ticker_id: int, df: pd.DataFrame) -> pd.DataFrame:
         """
-        カラムに応じた適切な型に値を変換する.
+        DataFrameをCOPY_COLUMNSの列構成に揃えて型変換する.
+
+        カラム単位でまとめて型変換し、NaNや存在しないカラムはNoneにする。
 
         Args:
-            column: カラム名
-            value: 変換する値
+            ticker_id: TickerID
+            df: 価格データを含むDataFrame（index: DatetimeIndex）
 
         Returns:
-            変換された値（Decimalまたはint）
+            ticker_id, date, UPSERT_COLUMNSの順に並んだDataFrame
         """
-        if column in INTEGER_COLUMNS:
-            return int(value)
-        return Decimal(str(value))
+        # 全行を同じキー構成にする（DataFrameに無いカラムはNULL）
+        frame = df.reindex(columns=UPSERT_COLUMNS).reset_index(drop=True)
+
+        # 整数カラムはint()と同じくゼロ方向に切り捨て、NaNはNAのまま残す
+        for col in UPSERT_COLUMNS:
+            if col == "volume" or col in INTEGER_COLUMNS:
+                values = frame[col]
+                frame[col] = (
+                    values.fillna(0).astype("int64").astype("Int64").mask(values.isna())
+                )
+
+        # 数値カラムはfloatのまま渡し、NUMERICへの変換はPostgreSQL側に任せる
+        frame = frame.astype(object).where(frame.notna(), None)
+        frame.insert(0, "date", pd.DatetimeIndex(df.index).date)
+        frame.insert(0, "ticker_id", ticker_id)
+        return frame
 
     def delete_by_ticker(self, ticker_id: int) -> int:
         """
@@ -214,13 +420,44 @@ class PostgresDailyPriceRepository:
         Returns:
             Tickerエンティティ
         """
+        # キャッシュ済みならPKで取得（identity mapにあればSQLは発行されない）
+        cached_id = _ticker_id_cache.get(symbol)
+        if cached_id is not None:
+            ticker = self._session.get(Ticker, cached_id)
+            if ticker is not None and cast("str", ticker.symbol) == symbol:
+                return ticker
+            # 削除・ロールバック済み、またはIDが別シンボルに再利用されたTicker
+            del _ticker_id_cache[symbol]
+
         ticker = self._session.query(Ticker).filter(Ticker.symbol == symbol).first()
         if ticker is None:
             ticker = Ticker(symbol=symbol, name=name)
             self._session.add(ticker)
             self._session.flush()
+        _ticker_id_cache[symbol] = ticker.ticker_id
         return ticker
 
+    def get_ticker_ids_by_symbols(self, symbols: list[str]) -> dict[str, int]:
+        """
+        複数シンボルの既存TickerIDを1クエリで取得する.
+
+        Args:
+            symbols: ティッカーシンボルのリスト
+
+        Returns:
+            {symbol: ticker_id} の辞書（未登録のシンボルは含まない）
+        """
+        if not symbols:
+            return {}
+        results = (
+            self._session.query(Ticker.symbol, Ticker.ticker_id)
+            .filter(any_of(Ticker.symbol, symbols))
+            .all()
+        )
+        ticker_ids = {symbol: ticker_id for symbol, ticker_id in results}
+        _ticker_id_cache.update(ticker_ids)
+        return ticker_ids
+
     def get_historical_for_indicator_calculation(
         self,
         ticker_id: int,
@@ -255,6 +492,39 @@ class PostgresDailyPriceRepository:
         # 日付昇順に並び替えて返却
         return list(reversed(results))
 
+    def get_indicator_lookback_dataframe(
+        self,
+        ticker_id: int,
+        new_data_start_date: date,
+        lookback_days: int = 75,
+    ) -> pd.DataFrame:
+        """
+        テクニカル指標計算に必要な過去データをDataFrameとして取得する.
+
+        get_historical_for_indicator_calculation + daily_prices_to_dataframeと
+        同じ内容を、ORMオブジェクトを生成せずに1クエリで読み込む。
+
+        Args:
+            ticker_id: TickerID
+            new_data_start_date: 新規データの開始日（この日は含まない）
+            lookback_days: 遡って取得する日数（デフォルト75）
+
+        Returns:
+            OHLCV形式のDataFrame（DatetimeIndex、日付昇順）
+        """
+        latest = (
+            select(*OHLCV_SELECT_COLUMNS)
+            .where(
+                DailyPrice.ticker_id == ticker_id,
+                DailyPrice.date < new_data_start_date,
+            )
+            .order_by(DailyPrice.date.desc())
+            .limit(lookback_days)
+            .subquery()
+        )
+        stmt = select(latest).order_by(latest.c.date)
+        return self._read_ohlcv_frame(stmt)
+
     def daily_prices_to_dataframe(
         self,
         daily_prices: list[DailyPrice],
@@ -6,12 +6,97 @@
 
 from datetime import date, datetime, timezone
 from decimal import Decimal
+from typing import Any
 
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from src.infrastructure.persistence.models import DividendSchedule, EarningsSchedule
 
 
+def _build_earnings_upsert_statement() -> Insert:
+    """earnings_schedule向けのINSERT ... ON CONFLICT DO UPDATE文を生成する."""
+    stmt = pg_insert(EarningsSchedule)
+    # 決算期・年度は新しい値がNULLなら既存値を保持する
+    return stmt.on_conflict_do_update(
+        index_elements=["ticker_id", "earnings_date"],
+        set_={
+            "fiscal_quarter": func.coalesce(
+                stmt.excluded.fiscal_quarter, EarningsSchedule.fiscal_quarter
+            ),
+            "fiscal_year": func.coalesce(
+                stmt.excluded.fiscal_year, EarningsSchedule.fiscal_year
+            ),
+            "is_confirmed": stmt.excluded.is_confirmed,
+            "retrieved_at": stmt.excluded.retrieved_at,
+        },
+    )
+
+
+def _build_dividend_upsert_statement() -> Insert:
+    """dividend_schedule向けのINSERT ... ON CONFLICT DO UPDATE文を生成する."""
+    stmt = pg_insert(DividendSchedule)
+    # 配当額・利回りは新しい値がNULLなら既存値を保持する
+    return stmt.on_conflict_do_update(
+        index_elements=["ticker_id", "ex_dividend_date"],
+        set_={
+            "dividend_rate": func.coalesce(
+                stmt.excluded.dividend_rate, DividendSchedule.dividend_rate
+            ),
+            "dividend_yield": func.coalesce(
+                stmt.excluded.dividend_yield, DividendSchedule.dividend_yield
+            ),
+            "retrieved_at": stmt.excluded.retrieved_at,
+        },
+    )
+
+
+# Built once and reused for every call (compiled SQL is cached)
+EARNINGS_UPSERT_STATEMENT = _build_earnings_upsert_statement()
+DIVIDEND_UPSERT_STATEMENT = _build_dividend_upsert_statement()
+
+
+# Lookups built once with bind parameters so every call reuses the cached
+# compiled SQL
+EARNINGS_BY_TICKER = (
+    select(EarningsSchedule)
+    .where(EarningsSchedule.ticker_id == bindparam("ticker_id"))
+    .order_by(EarningsSchedule.earnings_date)
+    .limit(bindparam("limit"))
+)
+EARNINGS_UPCOMING_BY_TICKER = (
+    select(EarningsSchedule)
+    .where(
+        EarningsSchedule.ticker_id == bindparam("ticker_id"),
+        EarningsSchedule.earnings_date >= bindparam("from_date"),
+    )
+    .order_by(EarningsSchedule.earnings_date)
+    .limit(1)
+)
+DIVIDEND_BY_TICKER = (
+    select(DividendSchedule)
+    .where(DividendSchedule.ticker_id == bindparam("ticker_id"))
+    .order_by(DividendSchedule.ex_dividend_date)
+    .limit(bindparam("limit"))
+)
+DIVIDEND_UPCOMING_BY_TICKER = (
+    select(DividendSchedule)
+    .where(
+        DividendSchedule.ticker_id == bindparam("ticker_id"),
+        DividendSchedule.ex_dividend_date >= bindparam("from_date"),
+    )
+    .order_by(DividendSchedule.ex_dividend_date)
+    .limit(1)
+)
+
+
+def _to_decimal(value: float | None) -> Decimal | None:
+    """floatをNUMERIC用のDecimalに変換する（Noneはそのまま）."""
+    return Decimal(str(value)) if value is not None else None
+
+
 class PostgresEarningsScheduleRepository:
     """
     PostgreSQL実装 - 決算スケジュールの永続化を行う.
@@ -40,11 +125,9 @@ class PostgresEarningsScheduleRepository:
             決算スケジュールのリスト
         """
         return list(
-            self._session.query(EarningsSchedule)
-            .filter(EarningsSchedule.ticker_id == ticker_id)
-            .order_by(EarningsSchedule.earnings_date)
-            .limit(limit)
-            .all()
+            self._session.scalars(
+                EARNINGS_BY_TICKER, {"ticker_id": ticker_id, "limit": limit}
+            )
         )
 
     def get_upcoming_by_ticker(
@@ -60,15 +143,10 @@ class PostgresEarningsScheduleRepository:
         Returns:
             次回の決算スケジュール、なければNone
         """
-        return (
-            self._session.query(EarningsSchedule)
-            .filter(
-                EarningsSchedule.ticker_id == ticker_id,
-                EarningsSchedule.earnings_date >= from_date,
-            )
-            .order_by(EarningsSchedule.earnings_date)
-            .first()
-        )
+        return self._session.scalars(
+            EARNINGS_UPCOMING_BY_TICKER,
+            {"ticker_id": ticker_id, "from_date": from_date},
+        ).first()
 
     def save(self, schedule: EarningsSchedule) -> EarningsSchedule:
         """
@@ -81,7 +159,6 @@ class PostgresEarningsScheduleRepository:
             保存されたスケジュール
         """
         self._session.add(schedule)
-        self._session.flush()
         return schedule
 
     def upsert(
@@ -95,6 +172,8 @@ class PostgresEarningsScheduleRepository:
         """
         決算スケジュールをupsertする.
 
+        INSERT ... ON CONFLICT DO UPDATEの1文で処理し、事前のSELECTは行わない。
+
         Args:
             ticker_id: TickerID
             earnings_date: 決算発表日
@@ -105,40 +184,53 @@ class PostgresEarningsScheduleRepository:
         Returns:
             upsertされたスケジュール
         """
-        existing = (
-            self._session.query(EarningsSchedule)
-            .filter(
-                EarningsSchedule.ticker_id == ticker_id,
-                EarningsSchedule.earnings_date == earnings_date,
-            )
-            .first()
+        rows = self._prepare_rows(
+            [
+                {
+                    "ticker_id": ticker_id,
+                    "earnings_date": earnings_date,
+                    "fiscal_quarter": fiscal_quarter,
+                    "fiscal_year": fiscal_year,
+                    "is_confirmed": is_confirmed,
+                }
+            ]
         )
+        return self._session.scalars(
+            EARNINGS_UPSERT_STATEMENT.returning(EarningsSchedule),
+            rows,
+            execution_options={"populate_existing": True},
+        ).one()
 
-        now = datetime.now(tz=timezone.utc)
+    def upsert_many(self, rows: list[dict[str, Any]]) -> int:
+        """
+        複数の決算スケジュールを1文でupsertする.
 
-        if existing:
-            # Update existing record
-            if fiscal_quarter is not None:
-                existing.fiscal_quarter = fiscal_quarter
-            if fiscal_year is not None:
-                existing.fiscal_year = fiscal_year
-            existing.is_confirmed = is_confirmed
-            existing.retrieved_at = now
-            self._session.flush()
-            return existing
-        else:
-            # Create new record
-            schedule = EarningsSchedule(
-                ticker_id=ticker_id,
-                earnings_date=earnings_date,
-                fiscal_quarter=fiscal_quarter,
-                fiscal_year=fiscal_year,
-                is_confirmed=is_confirmed,
-                retrieved_at=now,
-            )
-            self._session.add(schedule)
-            self._session.flush()
-            return schedule
+        Args:
+            rows: upsertする行の辞書リスト
+                必須キー: ticker_id, earnings_date
+                オプションキー: fiscal_quarter, fiscal_year, is_confirmed
+
+        Returns:
+            upsertされたレコード数
+        """
+        if not rows:
+            return 0
+        self._session.execute(EARNINGS_UPSERT_STATEMENT, self._prepare_rows(rows))
+        return len(rows)
+
+    def _prepare_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """全行を同じキー構成に揃え、取得日時を付与する."""
+        now = datetime.now(tz=timezone.utc)
+        return [
+            {
+                "fiscal_quarter": None,
+                "fiscal_year": None,
+                "is_confirmed": False,
+                **row,
+                "retrieved_at": row.get("retrieved_at") or now,
+            }
+            for row in rows
+        ]
 
     def delete_by_ticker(self, ticker_id: int) -> int:
         """
@@ -186,11 +278,9 @@ class PostgresDividendScheduleRepository:
             配当スケジュールのリスト
         """
         return list(
-            self._session.query(DividendSchedule)
-            .filter(DividendSchedule.ticker_id == ticker_id)
-            .order_by(DividendSchedule.ex_dividend_date)
-            .limit(limit)
-            .all()
+            self._session.scalars(
+                DIVIDEND_BY_TICKER, {"ticker_id": ticker_id, "limit": limit}
+            )
         )
 
     def get_upcoming_by_ticker(
@@ -206,15 +296,10 @@ class PostgresDividendScheduleRepository:
         Returns:
             次回の配当スケジュール、なければNone
         """
-        return (
-            self._session.query(DividendSchedule)
-            .filter(
-                DividendSchedule.ticker_id == ticker_id,
-                DividendSchedule.ex_dividend_date >= from_date,
-            )
-            .order_by(DividendSchedule.ex_dividend_date)
-            .first()
-        )
+        return self._session.scalars(
+            DIVIDEND_UPCOMING_BY_TICKER,
+            {"ticker_id": ticker_id, "from_date": from_date},
+        ).first()
 
     def save(self, schedule: DividendSchedule) -> DividendSchedule:
         """
@@ -227,7 +312,6 @@ class PostgresDividendScheduleRepository:
             保存されたスケジュール
         """
         self._session.add(schedule)
-        self._session.flush()
         return schedule
 
     def upsert(
@@ -240,6 +324,8 @@ class PostgresDividendScheduleRepository:
         """
         配当スケジュールをupsertする.
 
+        INSERT ... ON CONFLICT DO UPDATEの1文で処理し、事前のSELECTは行わない。
+
         Args:
             ticker_id: TickerID
             ex_dividend_date: 配当落ち日
@@ -249,42 +335,51 @@ class PostgresDividendScheduleRepository:
         Returns:
             upsertされたスケジュール
         """
-        existing = (
-            self._session.query(DividendSchedule)
-            .filter(
-                DividendSchedule.ticker_id == ticker_id,
-                DividendSchedule.ex_dividend_date == ex_dividend_date,
-            )
-            .first()
+        rows = self._prepare_rows(
+            [
+                {
+                    "ticker_id": ticker_id,
+                    "ex_dividend_date": ex_dividend_date,
+                    "dividend_rate": dividend_rate,
+                    "dividend_yield": dividend_yield,
+                }
+            ]
         )
+        return self._session.scalars(
+            DIVIDEND_UPSERT_STATEMENT.returning(DividendSchedule),
+            rows,
+            execution_options={"populate_existing": True},
+        ).one()
 
-        now = datetime.now(tz=timezone.utc)
+    def upsert_many(self, rows: list[dict[str, Any]]) -> int:
+        """
+        複数の配当スケジュールを1文でupsertする.
 
-        if existing:
-            # Update existing record
-            if dividend_rate is not None:
-                existing.dividend_rate = Decimal(str(dividend_rate))
-            if dividend_yield is not None:
-                existing.dividend_yield = Decimal(str(dividend_yield))
-            existing.retrieved_at = now
-            self._session.flush()
-            return existing
-        else:
-            # Create new record
-            schedule = DividendSchedule(
-                ticker_id=ticker_id,
-                ex_dividend_date=ex_dividend_date,
-                dividend_rate=Decimal(str(dividend_rate))
-                if dividend_rate is not None
-                else None,
-                dividend_yield=Decimal(str(dividend_yield))
-                if dividend_yield is not None
-                else None,
-                retrieved_at=now,
-            )
-            self._session.add(schedule)
-            self._session.flush()
-            return schedule
+        Args:
+            rows: upsertする行の辞書リスト
+                必須キー: ticker_id, ex_dividend_date
+                オプションキー: dividend_rate, dividend_yield
+
+        Returns:
+            upsertされたレコード数
+        """
+        if not rows:
+            return 0
+        self._session.execute(DIVIDEND_UPSERT_STATEMENT, self._prepare_rows(rows))
+        return len(rows)
+
+    def _prepare_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """全行を同じキー構成に揃え、金額をDecimalに変換して取得日時を付与する."""
+        now = datetime.now(tz=timezone.utc)
+        return [
+            {
+                **row,
+                "dividend_rate": _to_decimal(row.get("dividend_rate")),
+                "dividend_yield": _to_decimal(row.get("dividend_yield")),
+                "retrieved_at": row.get("retrieved_at") or now,
+            }
+            for row in rows
+        ]
 
     def delete_by_ticker(self, ticker_id: int) -> int:
         """
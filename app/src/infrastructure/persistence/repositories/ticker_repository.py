@@ -1,9 +1,25 @@
 """PostgreSQL implementation of TickerRepository."""
 
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, bindparam, func, or_, select
 from sqlalchemy.orm import Session
 
 from src.infrastructure.persistence.models import Ticker
 
+# Built once with bind parameters so every call reuses the cached compiled SQL
+SELECT_BY_SYMBOL = select(Ticker).where(Ticker.symbol == bindparam("symbol")).limit(1)
+
+
+def _matches(query: str) -> ColumnElement[bool]:
+    """シンボルまたは銘柄名にqueryを含む条件（ILIKE、ワイルドカードはエスケープ）."""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    return or_(
+        Ticker.symbol.ilike(pattern, escape="\\"),
+        Ticker.name.ilike(pattern, escape="\\"),
+    )
+
 
 class PostgresTickerRepository:
     """
@@ -27,12 +43,53 @@ class PostgresTickerRepository:
 
     def get_by_symbol(self, symbol: str) -> Ticker | None:
         """シンボルでTickerを取得する."""
-        return self._session.query(Ticker).filter(Ticker.symbol == symbol).first()
+        return self._session.scalars(SELECT_BY_SYMBOL, {"symbol": symbol}).first()
 
     def get_all(self) -> list[Ticker]:
         """全てのTickerを取得する."""
         return list(self._session.query(Ticker).all())
 
+    def search(self, query: str | None = None, limit: int = 100) -> list[Row[Any]]:
+        """
+        シンボルまたは銘柄名の部分一致で銘柄を検索する.
+
+        絞り込みと件数制限をSQL側で行い、ORMオブジェクトを生成せずに
+        一覧表示に必要な列だけを読み込む。
+
+        Args:
+            query: 検索文字列（大文字小文字を区別しない。未指定なら全件が対象）
+            limit: 取得する最大件数
+
+        Returns:
+            (ticker_id, symbol, name, sector) の行リスト（シンボル順、
+            name・sectorの欠損は空文字）
+        """
+        stmt = select(
+            Ticker.ticker_id,
+            Ticker.symbol,
+            func.coalesce(Ticker.name, "").label("name"),
+            func.coalesce(Ticker.sector, "").label("sector"),
+        )
+        if query:
+            stmt = stmt.where(_matches(query))
+        stmt = stmt.order_by(Ticker.symbol).limit(limit)
+        return list(self._session.execute(stmt).all())
+
+    def count(self, query: str | None = None) -> int:
+        """
+        検索条件に一致する銘柄数を取得する.
+
+        Args:
+            query: 検索文字列（searchと同じ条件。未指定なら全件数）
+
+        Returns:
+            一致する銘柄数
+        """
+        stmt = select(func.count()).select_from(Ticker)
+        if query:
+            stmt = stmt.where(_matches(query))
+        return self._session.execute(stmt).scalar_one()
+
     def save(self, ticker: Ticker) -> Ticker:
         """
         Tickerを保存する（新規作成または更新）.
@@ -41,10 +98,9 @@ class PostgresTickerRepository:
             ticker: 保存するTickerエンティティ
 
         Returns:
-            保存されたTickerエンティティ（IDが設定済み）
+            保存されたTickerエンティティ（IDはflush後に設定される）
         """
         self._session.add(ticker)
-        self._session.flush()
         return ticker
 
     def delete(self, ticker_id: int) -> bool:
@@ -57,8 +113,9 @@ class PostgresTickerRepository:
         Returns:
             削除成功時はTrue、対象が存在しない場合はFalse
         """
-        ticker = self.get_by_id(ticker_id)
-        if ticker is None:
-            return False
-        self._session.delete(ticker)
-        return True
+        # 事前SELECTを行わずDELETE 1文で削除する。関連テーブルはすべて
+        # FKのON DELETE CASCADE/SET NULLでDB側が処理する（passive_deletes）
+        deleted = (
+            self._session.query(Ticker).filter(Ticker.ticker_id == ticker_id).delete()
+        )
+        return deleted > 0
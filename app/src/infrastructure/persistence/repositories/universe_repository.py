@@ -2,13 +2,16 @@
 
 # pyright: reportAttributeAccessIssue=false, reportUnknownVariableType=false
 # pyright: reportArgumentType=false
-# NOTE: SQLAlchemy ORM typing issues
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false
+# NOTE: SQLAlchemy ORM typing issues, pandas read_sql chunk iterator typing
 
+import io
 from datetime import date
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 import pandas as pd
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, Row, case, func, insert, select
+from sqlalchemy.orm import Query, Session, selectinload
 
 from src.infrastructure.persistence.models import (
     DailyPrice,
@@ -17,6 +20,12 @@ from src.infrastructure.persistence.models import (
     UniverseSymbol,
 )
 
+# Rows fetched per server-side cursor round-trip in get_universe_prices
+PRICE_CHUNK_SIZE = 10_000
+
+# add_symbols_bulk loads more rows than this with COPY instead of INSERT
+COPY_THRESHOLD = 500
+
 
 class PostgresUniverseRepository:
     """
@@ -35,23 +44,52 @@ class PostgresUniverseRepository:
         """
         self._session = session
 
-    def get_by_id(self, universe_id: int) -> Universe | None:
-        """IDでUniverseを取得する."""
+    def _query(self, load_symbols: bool) -> Query[Universe]:
+        """Universeのクエリを生成する（必要なら所属シンボルを一括ロードする）."""
+        query = self._session.query(Universe)
+        if load_symbols:
+            # symbol_associationsは遅延ロード禁止のため、使う場合はここで取得する
+            query = query.options(selectinload(Universe.symbol_associations))
+        return query
+
+    def get_by_id(
+        self, universe_id: int, load_symbols: bool = False
+    ) -> Universe | None:
+        """IDでUniverseを取得する（load_symbols=Trueで所属シンボルも取得）."""
         return (
-            self._session.query(Universe)
+            self._query(load_symbols)
             .filter(Universe.universe_id == universe_id)
             .first()
         )
 
-    def get_by_name(self, name: str) -> Universe | None:
-        """名前でUniverseを取得する."""
-        return self._session.query(Universe).filter(Universe.name == name).first()
+    def get_by_name(self, name: str, load_symbols: bool = False) -> Universe | None:
+        """名前でUniverseを取得する（load_symbols=Trueで所属シンボルも取得）."""
+        return self._query(load_symbols).filter(Universe.name == name).first()
 
-    def get_latest(self) -> Universe | None:
-        """最新のUniverseを取得する（作成日時が最も新しいもの）."""
-        return (
-            self._session.query(Universe).order_by(Universe.created_at.desc()).first()
-        )
+    def get_latest(self, load_symbols: bool = False) -> Universe | None:
+        """
+        最新のUniverseを取得する（作成日時が最も新しいもの）.
+
+        load_symbols=Trueで所属シンボルも取得する。
+        """
+        return self._query(load_symbols).order_by(Universe.created_at.desc()).first()
+
+    def list_summaries(self) -> List[Row[Any]]:
+        """
+        全Universeの一覧表示用の列だけを取得する（作成日時の新しい順）.
+
+        ORMオブジェクトを生成せず、選択肢の表示に必要な列のみを読み込む。
+
+        Returns:
+            (universe_id, name, total_symbols, as_of_date) の行リスト
+        """
+        stmt = select(
+            Universe.universe_id,
+            Universe.name,
+            Universe.total_symbols,
+            Universe.as_of_date,
+        ).order_by(Universe.created_at.desc())
+        return list(self._session.execute(stmt).all())
 
     def get_symbols(self, universe_id: int) -> List[str]:
         """
@@ -63,13 +101,36 @@ class PostgresUniverseRepository:
         Returns:
             シンボルのリスト
         """
-        results = (
-            self._session.query(Ticker.symbol)
+        # 所属銘柄をたどらず、JOIN 1回でシンボル列だけを取得する
+        stmt = (
+            select(Ticker.symbol)
             .join(UniverseSymbol, Ticker.ticker_id == UniverseSymbol.ticker_id)
-            .filter(UniverseSymbol.universe_id == universe_id)
-            .all()
+            .where(UniverseSymbol.universe_id == universe_id)
         )
-        return [row[0] for row in results]
+        return list(self._session.scalars(stmt))
+
+    def get_symbol_ticker_pairs(self, universe_id: int) -> List[Tuple[str, int]]:
+        """
+        Universe内の全銘柄の (シンボル, TickerID) を取得する.
+
+        シンボルとTickerIDを別々に取得して突き合わせる必要がないよう、
+        1回のクエリで対応付けたまま取得する。
+
+        Args:
+            universe_id: UniverseのID
+
+        Returns:
+            シンボル順の (symbol, ticker_id) のリスト
+        """
+        stmt = (
+            select(Ticker.symbol, Ticker.ticker_id)
+            .join(UniverseSymbol, Ticker.ticker_id == UniverseSymbol.ticker_id)
+            .where(UniverseSymbol.universe_id == universe_id)
+            .order_by(Ticker.symbol)
+        )
+        return [
+            (symbol, ticker_id) for symbol, ticker_id in self._session.execute(stmt)
+        ]
 
     def get_ticker_ids(self, universe_id: int) -> List[int]:
         """
@@ -88,6 +149,47 @@ class PostgresUniverseRepository:
         )
         return [row[0] for row in results]
 
+    def _read_universe_closes(
+        self,
+        universe_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> pd.DataFrame:
+        """Universe内の全銘柄の終値を縦持ち（symbol, date, close）で読み込む."""
+        stmt = (
+            select(
+                Ticker.symbol,
+                DailyPrice.date,
+                # DB側でdouble precisionに変換し、Decimalを経由せずfloatで受け取る
+                DailyPrice.close.cast(Float).label("close"),
+            )
+            .join(UniverseSymbol, Ticker.ticker_id == UniverseSymbol.ticker_id)
+            .join(DailyPrice, Ticker.ticker_id == DailyPrice.ticker_id)
+            .where(
+                UniverseSymbol.universe_id == universe_id,
+                DailyPrice.date >= start_date,
+                DailyPrice.date <= end_date,
+            )
+            .order_by(Ticker.symbol, DailyPrice.date)
+            # サーバーサイドカーソルでチャンクごとに列データへ変換し、
+            # 全行のPythonオブジェクトを一度に保持しない
+            .execution_options(stream_results=True, yield_per=PRICE_CHUNK_SIZE)
+        )
+        chunks: list[pd.DataFrame] = list(
+            pd.read_sql(
+                stmt,
+                self._session.connection(),
+                parse_dates=["date"],
+                chunksize=PRICE_CHUNK_SIZE,
+            )
+        )
+        if chunks:
+            return pd.concat(chunks, ignore_index=True)
+        df = pd.DataFrame(columns=["symbol", "date", "close"])
+        # 空の場合のみ列型が決まらないため明示する
+        df["close"] = df["close"].astype("float64")
+        return df
+
     def get_universe_prices(
         self,
         universe_id: int,
@@ -105,46 +207,149 @@ class PostgresUniverseRepository:
         Returns:
             銘柄別の価格DataFrame {symbol: DataFrame(columns=['close'])}
         """
-        # ユニバース内の全銘柄の価格データを一括取得
-        results = (
-            self._session.query(
-                Ticker.symbol,
-                DailyPrice.date,
-                DailyPrice.close,
-            )
-            .join(UniverseSymbol, Ticker.ticker_id == UniverseSymbol.ticker_id)
-            .join(DailyPrice, Ticker.ticker_id == DailyPrice.ticker_id)
-            .filter(
+        df = self._read_universe_closes(universe_id, start_date, end_date)
+        df = df.set_index("date")
+
+        # シンボルごとに分割
+        universe_prices: Dict[str, pd.DataFrame] = {
+            str(symbol): group[["close"]]
+            for symbol, group in df.groupby("symbol", sort=False)
+        }
+        return universe_prices
+
+    def get_universe_close_matrix(
+        self,
+        universe_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> pd.DataFrame:
+        """
+        Universe内の全銘柄の終値を横持ちの1つのDataFrameで取得する.
+
+        銘柄ごとのDataFrameを作らず、日付×銘柄の行列として返すため、
+        日付ごとの集計をベクトル演算で行える。
+
+        Args:
+            universe_id: UniverseのID
+            start_date: 取得開始日
+            end_date: 取得終了日
+
+        Returns:
+            DataFrame(index=date, columns=symbols, values=close)（日付昇順、
+            データの無い日はNaN）
+        """
+        df = self._read_universe_closes(universe_id, start_date, end_date)
+        return df.pivot(index="date", columns="symbol", values="close").sort_index()
+
+    def get_advancing_declining_counts(
+        self,
+        universe_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> pd.DataFrame:
+        """
+        Universe内の日ごとの上昇・下落銘柄数をDB側で集計して取得する.
+
+        前日終値との比較（LAG）と日付ごとの集計をSQLで行い、
+        銘柄数×日数ではなく日数分の行だけを返す。
+
+        Args:
+            universe_id: UniverseのID
+            start_date: 取得開始日
+            end_date: 取得終了日
+
+        Returns:
+            DataFrame(index=date, columns=['advancing', 'declining'])（日付昇順）
+        """
+        prev_close = (
+            func.lag(DailyPrice.close)
+            .over(partition_by=DailyPrice.ticker_id, order_by=DailyPrice.date)
+            .label("prev_close")
+        )
+        changes = (
+            select(DailyPrice.date, DailyPrice.close, prev_close)
+            .join(UniverseSymbol, UniverseSymbol.ticker_id == DailyPrice.ticker_id)
+            .where(
                 UniverseSymbol.universe_id == universe_id,
                 DailyPrice.date >= start_date,
                 DailyPrice.date <= end_date,
             )
-            .order_by(Ticker.symbol, DailyPrice.date)
-            .all()
+            .subquery()
         )
-
-        # シンボルごとにグループ化
-        symbol_data: Dict[str, List[Dict[str, Any]]] = {}
-        for symbol, price_date, close in results:
-            if symbol not in symbol_data:
-                symbol_data[symbol] = []
-            symbol_data[symbol].append(
-                {
-                    "date": price_date,
-                    "close": float(close),
-                }
+        stmt = (
+            select(
+                changes.c.date,
+                func.sum(
+                    case((changes.c.close > changes.c.prev_close, 1), else_=0)
+                ).label("advancing"),
+                func.sum(
+                    case((changes.c.close < changes.c.prev_close, 1), else_=0)
+                ).label("declining"),
             )
+            .group_by(changes.c.date)
+            .order_by(changes.c.date)
+        )
+        df = pd.read_sql(
+            stmt, self._session.connection(), index_col="date", parse_dates=["date"]
+        )
+        return df.astype("int64")
 
-        # DataFrameに変換
-        universe_prices: Dict[str, pd.DataFrame] = {}
-        for symbol, data in symbol_data.items():
-            df = pd.DataFrame(data)
-            if not df.empty:
-                df["date"] = pd.to_datetime(df["date"])
-                df = df.set_index("date")
-                universe_prices[symbol] = df
+    def get_price_data_version(
+        self,
+        universe_id: int,
+        start_date: date,
+        end_date: date,
+        extra_symbols: Iterable[str] = (),
+    ) -> str:
+        """
+        分析に使う価格データのバージョン文字列を1クエリで取得する.
 
-        return universe_prices
+        Universe内の銘柄とextra_symbols（市場指数ETFなど）の期間内の価格について、
+        件数・最終日付・最終登録日時・価格カラムの合計（チェックサム）と、
+        Universeの銘柄数を連結した値を返す。価格の追加・既存行の訂正
+        （upsertによる上書き）・Universeの構成変更があると値が変わる。
+
+        Args:
+            universe_id: UniverseのID
+            start_date: 対象期間の開始日
+            end_date: 対象期間の終了日
+            extra_symbols: Universe外で併せて参照するシンボル
+
+        Returns:
+            バージョン文字列
+        """
+        universe_ticker_ids = select(UniverseSymbol.ticker_id).where(
+            UniverseSymbol.universe_id == universe_id
+        )
+        extra_ticker_ids = select(Ticker.ticker_id).where(
+            Ticker.symbol.in_(list(extra_symbols))
+        )
+        symbol_count = (
+            select(func.count())
+            .select_from(UniverseSymbol)
+            .where(UniverseSymbol.universe_id == universe_id)
+            .scalar_subquery()
+        )
+        stmt = select(
+            symbol_count,
+            func.count(),
+            func.max(DailyPrice.date),
+            func.max(DailyPrice.created_at),
+            # created_at is set on insert only; the sums change when an upsert
+            # corrects existing rows
+            func.sum(DailyPrice.open),
+            func.sum(DailyPrice.high),
+            func.sum(DailyPrice.low),
+            func.sum(DailyPrice.close),
+            func.sum(DailyPrice.adj_close),
+            func.sum(DailyPrice.volume),
+        ).where(
+            DailyPrice.date >= start_date,
+            DailyPrice.date <= end_date,
+            DailyPrice.ticker_id.in_(universe_ticker_ids.union(extra_ticker_ids)),
+        )
+        row = self._session.execute(stmt).one()
+        return "|".join(str(value) for value in row)
 
     def save(self, universe: Universe) -> Universe:
         """
@@ -157,7 +362,6 @@ class PostgresUniverseRepository:
             保存されたUniverseエンティティ
         """
         self._session.add(universe)
-        self._session.flush()
         return universe
 
     def add_symbol(self, universe_id: int, ticker_id: int) -> UniverseSymbol:
@@ -176,9 +380,54 @@ class PostgresUniverseRepository:
             ticker_id=ticker_id,
         )
         self._session.add(universe_symbol)
-        self._session.flush()
         return universe_symbol
 
+    def add_symbols_bulk(self, universe_id: int, ticker_ids: Iterable[int]) -> int:
+        """
+        UniverseにTickerをまとめて追加する.
+
+        1回のexecutemanyでINSERTするため、銘柄ごとにadd_symbolを呼ぶより
+        ラウンドトリップが少ない。COPY_THRESHOLD件を超える場合は
+        COPY FROM STDINで投入する。
+
+        Args:
+            universe_id: UniverseのID
+            ticker_ids: 追加するTickerのIDリスト
+
+        Returns:
+            追加した件数
+        """
+        ids = list(ticker_ids)
+        if not ids:
+            return 0
+        if len(ids) > COPY_THRESHOLD:
+            self._copy_symbols(universe_id, ids)
+            return len(ids)
+
+        values = [
+            {"universe_id": universe_id, "ticker_id": ticker_id} for ticker_id in ids
+        ]
+        self._session.execute(insert(UniverseSymbol), values)
+        return len(values)
+
+    def _copy_symbols(self, universe_id: int, ticker_ids: List[int]) -> None:
+        """universe_symbolsへCOPY FROM STDIN（テキスト形式）で投入する."""
+        buffer = io.StringIO(
+            "".join(f"{universe_id}\t{ticker_id}\n" for ticker_id in ticker_ids)
+        )
+
+        # ORM経由の変更をCOPYより先にDBへ送る
+        self._session.flush()
+
+        # セッションと同じDBAPI接続（同じトランザクション）でCOPYする
+        cursor = self._session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                "COPY universe_symbols (universe_id, ticker_id) FROM STDIN", buffer
+            )
+        finally:
+            cursor.close()
+
     def remove_symbol(self, universe_id: int, ticker_id: int) -> bool:
         """
         UniverseからシンボルをTickerを削除する.
@@ -6,16 +6,14 @@
 # NOTE: pandas type stubs are incomplete, SQLAlchemy ORM Column typing issues
 
 import json
-import os
 from datetime import date, timedelta
-from pathlib import Path
 from typing import Annotated, Any
 
 import typer
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.config import get_database_url
 from src.domain.models.market_regime import (
     EnvironmentCode,
     MarketRegime,
@@ -26,6 +24,7 @@ from src.domain.models.market_regime import (
     VolatilityLevel,
 )
 from src.domain.services.analysis.market_regime_analyzer import MarketRegimeAnalyzer
+from src.infrastructure.persistence.database import get_engine
 from src.infrastructure.persistence.repositories.daily_price_repository import (
     PostgresDailyPriceRepository,
 )
@@ -33,10 +32,6 @@ from src.infrastructure.persistence.repositories.universe_repository import (
     PostgresUniverseRepository,
 )
 
-# Load .env file from project root
-_env_path = Path(__file__).resolve().parents[3] / ".env"
-load_dotenv(_env_path)
-
 app = typer.Typer(help="Analysis commands - 市場分析コマンド")
 
 # 日本語表示名マッピング
@@ -83,91 +78,103 @@ RISK_LEVEL_NAMES: dict[RiskLevel, str] = {
     RiskLevel.EXTREME: "極めて高リスク",
 }
 
+# market-regimeのテーブル出力レイアウト（_format_table_outputで一度に埋める）
+TABLE_TEMPLATE = """\
+{sep}
+                          市場レジーム分析結果
+{sep}
+分析日: {analysis_date}
+
+■ 環境分類
+  コード: {env_code}（{env_name}）
+  トレード可否: {tradeable}
+
+■ トレンド分析
+  種別: {trend_type}（{trend_type_name}）
+  方向: {trend_dir}（{trend_dir_name}）
+  ADX: {adx_value:.1f} - {adx_interpretation}
+
+■ ボラティリティ分析
+  水準: {vol_level}（{vol_name}）
+  ATR%: {atr_percent:.2f}%
+  BB幅: {bb_width:.1f}%
+  一致度: {consensus}
+
+■ センチメント分析
+  判定: {sentiment}（{sent_name}）
+  日経225: {nikkei_trend}（{nikkei_dir}）
+  TOPIX: {topix_trend}（{topix_dir}）
+
+■ 騰落レシオ (ADR)
+  短期(5日): {short_adr:.1f}
+  中期(25日): {medium_adr:.1f}
+  乖離: {adr_divergence}
+
+■ リスク評価
+  スコア: {risk_score} / 100
+  レベル: {risk_level}（{risk_name}）
+{sep}"""
+
 # 市場指数ETFシンボル
 NIKKEI_ETF_SYMBOL = "1321.T"
 TOPIX_ETF_SYMBOL = "1306.T"
 
 
-def _get_database_url() -> str:
-    """環境変数からデータベースURLを構築する."""
-    host = os.getenv("DB_HOST", "localhost")
-    port = os.getenv("DB_PORT", "5432")
-    name = os.getenv("DB_NAME", "swing_trading")
-    user = os.getenv("DB_USER", "postgres")
-    password = os.getenv("DB_PASSWORD", "postgres")
-    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
+def _get_engine() -> Engine:
+    """
+    データベースエンジンを取得する.
+
+    プロセス内で共有するエンジンを使い、接続プールとSQLキャッシュを再利用する。
+    """
+    return get_engine(get_database_url())
 
 
 def _format_table_output(regime: MarketRegime) -> str:
     """MarketRegimeをテーブル形式で整形する."""
-    lines = []
-    sep = "=" * 80
-
-    lines.append(sep)
-    lines.append("                          市場レジーム分析結果")
-    lines.append(sep)
-    lines.append(f"分析日: {regime.analysis_date}")
-    lines.append("")
-
-    # 環境分類
-    env_name = ENVIRONMENT_NAMES.get(regime.environment_code, "不明")
-    tradeable = "✓ 可能" if regime.is_tradeable else "✗ 不可"
-    lines.append("■ 環境分類")
-    lines.append(f"  コード: {regime.environment_code.value}（{env_name}）")
-    lines.append(f"  トレード可否: {tradeable}")
-    lines.append("")
-
-    # トレンド分析
     trend = regime.trend_analysis
-    trend_type_name = TREND_TYPE_NAMES.get(trend.trend_type, "不明")
-    trend_dir_name = TREND_DIRECTION_NAMES.get(trend.trend_direction, "不明")
-    lines.append("■ トレンド分析")
-    lines.append(f"  種別: {trend.trend_type.value}（{trend_type_name}）")
-    lines.append(f"  方向: {trend.trend_direction.value}（{trend_dir_name}）")
-    lines.append(f"  ADX: {trend.adx_value:.1f} - {trend.adx_interpretation}")
-    lines.append("")
-
-    # ボラティリティ分析
     vol = regime.volatility_analysis
-    vol_name = VOLATILITY_NAMES.get(vol.volatility_level, "不明")
-    consensus = "✓" if vol.volatility_consensus else "✗"
-    lines.append("■ ボラティリティ分析")
-    lines.append(f"  水準: {vol.volatility_level.value}（{vol_name}）")
-    lines.append(f"  ATR%: {vol.atr_percent:.2f}%")
-    lines.append(f"  BB幅: {vol.bollinger_band_width:.1f}%")
-    lines.append(f"  一致度: {consensus}")
-    lines.append("")
-
-    # センチメント分析
     sent = regime.sentiment_analysis
-    sent_name = SENTIMENT_NAMES.get(sent.sentiment, "不明")
-    nikkei_dir = TREND_DIRECTION_NAMES.get(sent.nikkei_trend, "不明")
-    topix_dir = TREND_DIRECTION_NAMES.get(sent.topix_trend, "不明")
-    lines.append("■ センチメント分析")
-    lines.append(f"  判定: {sent.sentiment.value}（{sent_name}）")
-    lines.append(f"  日経225: {sent.nikkei_trend.value}（{nikkei_dir}）")
-    lines.append(f"  TOPIX: {sent.topix_trend.value}（{topix_dir}）")
-    lines.append("")
-
-    # 騰落レシオ
     breadth = regime.market_breadth
-    short_adr = breadth.advancing_declining_ratios.get("short_term", 0.0)
-    medium_adr = breadth.advancing_declining_ratios.get("medium_term", 0.0)
-    lines.append("■ 騰落レシオ (ADR)")
-    lines.append(f"  短期(5日): {short_adr:.1f}")
-    lines.append(f"  中期(25日): {medium_adr:.1f}")
-    lines.append(f"  乖離: {breadth.adr_divergence.value}")
-    lines.append("")
-
-    # リスク評価
     risk = regime.risk_assessment
-    risk_name = RISK_LEVEL_NAMES.get(risk.risk_level, "不明")
-    lines.append("■ リスク評価")
-    lines.append(f"  スコア: {risk.risk_score} / 100")
-    lines.append(f"  レベル: {risk.risk_level.value}（{risk_name}）")
-    lines.append(sep)
 
-    return "\n".join(lines)
+    return TABLE_TEMPLATE.format_map(
+        {
+            "sep": "=" * 80,
+            "analysis_date": regime.analysis_date,
+            # 環境分類
+            "env_code": regime.environment_code.value,
+            "env_name": ENVIRONMENT_NAMES.get(regime.environment_code, "不明"),
+            "tradeable": "✓ 可能" if regime.is_tradeable else "✗ 不可",
+            # トレンド分析
+            "trend_type": trend.trend_type.value,
+            "trend_type_name": TREND_TYPE_NAMES.get(trend.trend_type, "不明"),
+            "trend_dir": trend.trend_direction.value,
+            "trend_dir_name": TREND_DIRECTION_NAMES.get(trend.trend_direction, "不明"),
+            "adx_value": trend.adx_value,
+            "adx_interpretation": trend.adx_interpretation,
+            # ボラティリティ分析
+            "vol_level": vol.volatility_level.value,
+            "vol_name": VOLATILITY_NAMES.get(vol.volatility_level, "不明"),
+            "atr_percent": vol.atr_percent,
+            "bb_width": vol.bollinger_band_width,
+            "consensus": "✓" if vol.volatility_consensus else "✗",
+            # センチメント分析
+            "sentiment": sent.sentiment.value,
+            "sent_name": SENTIMENT_NAMES.get(sent.sentiment, "不明"),
+            "nikkei_trend": sent.nikkei_trend.value,
+            "nikkei_dir": TREND_DIRECTION_NAMES.get(sent.nikkei_trend, "不明"),
+            "topix_trend": sent.topix_trend.value,
+            "topix_dir": TREND_DIRECTION_NAMES.get(sent.topix_trend, "不明"),
+            # 騰落レシオ
+            "short_adr": breadth.advancing_declining_ratios.get("short_term", 0.0),
+            "medium_adr": breadth.advancing_declining_ratios.get("medium_term", 0.0),
+            "adr_divergence": breadth.adr_divergence.value,
+            # リスク評価
+            "risk_score": risk.risk_score,
+            "risk_level": risk.risk_level.value,
+            "risk_name": RISK_LEVEL_NAMES.get(risk.risk_level, "不明"),
+        }
+    )
 
 
 def _format_json_output(regime: MarketRegime) -> str:
@@ -207,43 +214,44 @@ def _format_json_output(regime: MarketRegime) -> str:
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
-def _get_index_ohlcv(
+def _get_index_ohlcvs(
     session: Session,
-    symbol: str,
+    symbols: list[str],
     end_date: date,
     days: int = 60,
 ) -> tuple[bool, Any]:
     """
-    市場指数ETFのOHLCVデータを取得する.
+    複数の市場指数ETFのOHLCVデータを1クエリで取得する.
+
+    Args:
+        session: SQLAlchemyセッション
+        symbols: ティッカーシンボルのリスト
+        end_date: 取得終了日
+        days: 必要な営業日数の目安
 
     Returns:
-        (成功フラグ, DataFrame or エラーメッセージ)
+        (成功フラグ, {symbol: DataFrame} or エラーメッセージ)
     """
-    repo = PostgresDailyPriceRepository(session)
-
-    # Tickerを取得
-    ticker = repo.get_or_create_ticker(symbol)
-    if ticker is None:
-        return (False, f"シンボル {symbol} が見つかりません")
-
     # 日付範囲を計算（営業日を考慮して余裕を持って取得）
     start_date = end_date - timedelta(days=days * 2)
 
     # 価格データ取得
-    daily_prices = repo.get_by_ticker_and_date_range(
-        ticker.ticker_id, start_date, end_date
+    repo = PostgresDailyPriceRepository(session)
+    frames = repo.get_dataframes_by_symbols_and_date_range(
+        symbols, start_date, end_date
     )
 
-    if not daily_prices:
-        return (False, f"シンボル {symbol} の価格データがありません")
-
-    # DataFrameに変換
-    df = repo.daily_prices_to_dataframe(daily_prices)
-
-    if len(df) < 20:
-        return (False, f"シンボル {symbol} のデータが不足しています（{len(df)}日分）")
+    for symbol in symbols:
+        df = frames.get(symbol)
+        if df is None or df.empty:
+            return (False, f"シンボル {symbol} の価格データがありません")
+        if len(df) < 20:
+            return (
+                False,
+                f"シンボル {symbol} のデータが不足しています（{len(df)}日分）",
+            )
 
-    return (True, df)
+    return (True, frames)
 
 
 @app.command(name="market-regime")
@@ -312,9 +320,7 @@ def market_regime(
 
     # DB接続
     try:
-        database_url = _get_database_url()
-        engine = create_engine(database_url)
-        session_factory = sessionmaker(bind=engine)
+        session_factory = sessionmaker(bind=_get_engine())
         session = session_factory()
     except Exception as e:
         typer.echo(f"Error: データベース接続に失敗しました: {e}", err=True)
@@ -345,37 +351,26 @@ def market_regime(
         # 市場指数ETF価格データ取得
         typer.echo("市場データを取得中...")
 
-        success, nikkei_result = _get_index_ohlcv(
-            session, NIKKEI_ETF_SYMBOL, target_date
+        success, index_result = _get_index_ohlcvs(
+            session, [NIKKEI_ETF_SYMBOL, TOPIX_ETF_SYMBOL], target_date
         )
         if not success:
-            typer.echo(
-                f"Error: 日経225 ETF ({NIKKEI_ETF_SYMBOL}): {nikkei_result}",
-                err=True,
-            )
-            raise typer.Exit(code=1)
-        nikkei_df = nikkei_result
-
-        success, topix_result = _get_index_ohlcv(session, TOPIX_ETF_SYMBOL, target_date)
-        if not success:
-            typer.echo(
-                f"Error: TOPIX ETF ({TOPIX_ETF_SYMBOL}): {topix_result}",
-                err=True,
-            )
+            typer.echo(f"Error: 市場指数ETF: {index_result}", err=True)
             raise typer.Exit(code=1)
-        topix_df = topix_result
+        nikkei_df = index_result[NIKKEI_ETF_SYMBOL]
+        topix_df = index_result[TOPIX_ETF_SYMBOL]
 
         typer.echo(f"  日経225 ETF: {len(nikkei_df)}日分")
         typer.echo(f"  TOPIX ETF: {len(topix_df)}日分")
 
-        # ユニバース銘柄価格データ取得（ADR計算用）
+        # ユニバース銘柄の騰落数をDB側で集計（ADR計算用）
         start_for_adr = target_date - timedelta(days=50)
-        universe_prices = universe_repo.get_universe_prices(
+        adr_counts = universe_repo.get_advancing_declining_counts(
             universe_obj.universe_id,
             start_for_adr,
             target_date,
         )
-        typer.echo(f"  ユニバース銘柄: {len(universe_prices)}銘柄")
+        typer.echo(f"  ユニバース騰落数: {len(adr_counts)}日分")
         typer.echo("")
 
         # 分析実行
@@ -384,8 +379,8 @@ def market_regime(
         result = analyzer.analyze(
             nikkei_df=nikkei_df,
             topix_df=topix_df,
-            universe_prices=universe_prices,
             end_date=target_date,
+            adr_counts=adr_counts,
         )
         typer.echo("")
 
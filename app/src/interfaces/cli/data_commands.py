@@ -1,44 +1,27 @@
 """CLI commands for data operations."""
 
-import os
-from datetime import date
-from pathlib import Path
 from typing import Annotated
 
 import typer
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from src.application.commands.collect_data import (
     CollectDataHandler,
     FetchStockDataCommand,
 )
+from src.config import get_database_url
 from src.domain.services.analysis.technical_indicators import (
     TechnicalIndicatorService,
 )
 from src.infrastructure.external.yahoo_finance import YahooFinanceClient
+from src.infrastructure.persistence.database import create_session
 from src.infrastructure.persistence.repositories.daily_price_repository import (
     PostgresDailyPriceRepository,
 )
-
-# Load .env file from project root
-_env_path = Path(__file__).resolve().parents[3] / ".env"
-load_dotenv(_env_path)
+from src.shared.exceptions import ValidationError
 
 app = typer.Typer(help="Data fetching and management commands")
 
 
-def _get_database_url() -> str:
-    """環境変数からデータベースURLを構築する."""
-    host = os.getenv("DB_HOST", "localhost")
-    port = os.getenv("DB_PORT", "5432")
-    name = os.getenv("DB_NAME", "swing_trading")
-    user = os.getenv("DB_USER", "postgres")
-    password = os.getenv("DB_PASSWORD", "postgres")
-    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
-
-
 @app.command()
 def fetch(
     symbols: Annotated[
@@ -88,52 +71,24 @@ def fetch(
         uv run python -m src.interfaces.cli.main data fetch -s 7203.T -s 9984.T \
 --period 3mo
     """
-    # Validate parameters
-    if not symbols:
-        typer.echo("Error: At least one symbol is required", err=True)
-        raise typer.Exit(code=1)
-
-    if period and (start_date or end_date):
-        typer.echo(
-            "Error: Cannot use --period with --start-date/--end-date",
-            err=True,
-        )
-        raise typer.Exit(code=1)
-
-    if not period and not start_date:
-        typer.echo(
-            "Error: Must specify --period or --start-date",
-            err=True,
+    # Parse and validate parameters
+    try:
+        command = FetchStockDataCommand.from_strings(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
         )
-        raise typer.Exit(code=1)
-
-    # Parse dates
-    parsed_start_date: date | None = None
-    parsed_end_date: date | None = None
-
-    if start_date:
-        try:
-            parsed_start_date = date.fromisoformat(start_date)
-        except ValueError:
-            typer.echo(f"Error: Invalid start date format: {start_date}", err=True)
-            raise typer.Exit(code=1) from None
-
-    if end_date:
-        try:
-            parsed_end_date = date.fromisoformat(end_date)
-        except ValueError:
-            typer.echo(f"Error: Invalid end date format: {end_date}", err=True)
-            raise typer.Exit(code=1) from None
+    except ValidationError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from None
 
     # Create dependencies
     data_source = YahooFinanceClient()
 
     # Create database session
     try:
-        database_url = _get_database_url()
-        engine = create_engine(database_url)
-        session_factory = sessionmaker(bind=engine)
-        session = session_factory()
+        session = create_session(get_database_url())
     except Exception as e:
         typer.echo(f"Error: Failed to connect to database: {e}", err=True)
         raise typer.Exit(code=1) from None
@@ -147,39 +102,28 @@ def fetch(
             indicator_service=indicator_service,
         )
 
-        # Execute command
-        command = FetchStockDataCommand(
-            symbols=list(symbols),
-            start_date=parsed_start_date,
-            end_date=parsed_end_date,
-            period=period,
-        )
-
+        # Execute command; the transaction commits on success and rolls back
+        # on any error, so output below never runs with it still open
         typer.echo(f"Fetching data for: {', '.join(symbols)}...")
-
-        result = handler.handle(command)
-
-        # Commit transaction
-        session.commit()
-
-        # Display results
-        if result.errors:
-            typer.echo(f"\nWarnings: {len(result.errors)} symbol(s) had errors:")
-            for symbol, error in result.errors.items():
-                typer.echo(f"  - {symbol}: {error}", err=True)
-
-        if result.success_count > 0:
-            typer.echo(f"\nSuccessfully fetched {result.success_count} symbol(s):")
-            for symbol, df in result.data.items():
-                saved = result.saved_records.get(symbol, 0)
-                typer.echo(f"  - {symbol}: {len(df)} rows fetched, {saved} rows saved")
-        else:
-            typer.echo("No data was fetched.", err=True)
-            raise typer.Exit(code=1)
-
+        with session.begin():
+            result = handler.handle(command)
     except Exception as e:
-        session.rollback()
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1) from None
     finally:
         session.close()
+
+    # Display results
+    if result.errors:
+        typer.echo(f"\nWarnings: {len(result.errors)} symbol(s) had errors:")
+        for symbol, error in result.errors.items():
+            typer.echo(f"  - {symbol}: {error}", err=True)
+
+    if result.success_count > 0:
+        typer.echo(f"\nSuccessfully fetched {result.success_count} symbol(s):")
+        for symbol, df in result.data.items():
+            saved = result.saved_records.get(symbol, 0)
+            typer.echo(f"  - {symbol}: {len(df)} rows fetched, {saved} rows saved")
+    else:
+        typer.echo("No data was fetched.", err=True)
+        raise typer.Exit(code=1)
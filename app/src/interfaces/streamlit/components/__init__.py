@@ -0,0 +1,19 @@
+"""Reusable Streamlit page components."""
+
+from src.interfaces.streamlit.components.ticker_picker import (
+    clear_ticker_caches,
+    get_ticker_count,
+    get_universe_options,
+    render_ticker_picker,
+    render_universe_picker,
+    search_tickers,
+)
+
+__all__ = [
+    "clear_ticker_caches",
+    "get_ticker_count",
+    "get_universe_options",
+    "render_ticker_picker",
+    "render_universe_picker",
+    "search_tickers",
+]
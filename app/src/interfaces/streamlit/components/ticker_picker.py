@@ -0,0 +1,139 @@
+"""銘柄選択コンポーネント.
+
+データ取得・イベント同期ページで共通のユニバース選択とTicker検索選択UIを提供する。
+"""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportAttributeAccessIssue=false
+# NOTE: Streamlit/SQLAlchemy type stubs are incomplete
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.repositories.ticker_repository import (
+    PostgresTickerRepository,
+)
+from src.infrastructure.persistence.repositories.universe_repository import (
+    PostgresUniverseRepository,
+)
+
+# Ticker検索で表示する最大件数
+TICKER_SEARCH_LIMIT = 200
+
+
+@st.cache_data(ttl=60)
+def get_universe_options(_session: Session) -> dict[str, int]:
+    """ユニバース選択肢（表示ラベル → universe_id）を取得（キャッシュ）."""
+    universes = PostgresUniverseRepository(_session).list_summaries()
+    return {f"{u.name} ({u.total_symbols}銘柄)": u.universe_id for u in universes}
+
+
+@st.cache_data(ttl=60)
+def get_ticker_count(_session: Session) -> int:
+    """登録銘柄数を取得（キャッシュ）."""
+    return PostgresTickerRepository(_session).count()
+
+
+@st.cache_data(ttl=60)
+def search_tickers(
+    _session: Session, query: str, limit: int
+) -> tuple[list[tuple[int, str, str]], int]:
+    """銘柄を検索し、(ticker_id, シンボル, 銘柄名) と一致件数を取得（キャッシュ）."""
+    ticker_repo = PostgresTickerRepository(_session)
+    rows = ticker_repo.search(query, limit=limit)
+    candidates = [(row.ticker_id, row.symbol, row.name) for row in rows]
+    return candidates, ticker_repo.count(query)
+
+
+def clear_ticker_caches() -> None:
+    """銘柄の登録・更新後にTicker検索のキャッシュを破棄する."""
+    get_ticker_count.clear()
+    search_tickers.clear()
+
+
+def render_universe_picker(session: Session, key_prefix: str) -> list[tuple[str, int]]:
+    """
+    ユニバースを選択し、所属銘柄を一覧表示する.
+
+    Args:
+        session: DBセッション
+        key_prefix: ウィジェットキーの接頭辞（ページ間・タブ間の衝突回避）
+
+    Returns:
+        選択されたユニバースの (シンボル, ticker_id) のリスト
+    """
+    universe_options = get_universe_options(session)
+
+    if not universe_options:
+        st.warning("ユニバースが登録されていません")
+        return []
+
+    selected_universe_label = st.selectbox(
+        "ユニバースを選択",
+        options=list(universe_options.keys()),
+        key=f"{key_prefix}universe_selectbox",
+    )
+    if not selected_universe_label:
+        return []
+
+    universe_repo = PostgresUniverseRepository(session)
+    symbol_pairs = universe_repo.get_symbol_ticker_pairs(
+        universe_options[selected_universe_label]
+    )
+
+    if symbol_pairs:
+        st.info(f"含まれる銘柄: {len(symbol_pairs)}件")
+
+        # 銘柄一覧を表示（展開可能）。銘柄ごとに要素を描画せず、1つの表にする
+        with st.expander("銘柄一覧を表示"):
+            st.dataframe(
+                pd.DataFrame({"銘柄": [symbol for symbol, _ in symbol_pairs]}),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+    return symbol_pairs
+
+
+def render_ticker_picker(session: Session, key_prefix: str) -> list[tuple[str, int]]:
+    """
+    登録済みTickerを検索して複数選択する.
+
+    Args:
+        session: DBセッション
+        key_prefix: ウィジェットキーの接頭辞（ページ間・タブ間の衝突回避）
+
+    Returns:
+        選択された銘柄の (シンボル, ticker_id) のリスト
+    """
+    total_count = get_ticker_count(session)
+
+    if total_count == 0:
+        st.warning("Tickerテーブルに銘柄が登録されていません")
+        return []
+
+    # 検索フィルタ
+    search_query = st.text_input(
+        "銘柄検索",
+        placeholder="シンボルまたは銘柄名で検索...",
+        key=f"{key_prefix}ticker_search",
+    )
+
+    # 絞り込みと件数制限はSQL側で行う
+    candidates, match_count = search_tickers(session, search_query, TICKER_SEARCH_LIMIT)
+    ticker_options = {
+        f"{symbol} - {name}": (symbol, ticker_id)
+        for ticker_id, symbol, name in candidates
+    }
+
+    st.write(f"表示中: {match_count}銘柄 / 全{total_count}銘柄")
+
+    # マルチセレクト
+    selected_ticker_labels = st.multiselect(
+        "銘柄を選択",
+        options=list(ticker_options.keys()),
+        key=f"{key_prefix}ticker_multiselect",
+    )
+
+    return [ticker_options[label] for label in selected_ticker_labels]
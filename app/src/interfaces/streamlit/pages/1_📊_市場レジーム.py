@@ -5,25 +5,28 @@
 # pyright: reportUnnecessaryComparison=false, reportAttributeAccessIssue=false
 # NOTE: Streamlit/pandas/plotly type stubs are incomplete
 
-import os
+import contextlib
+import json
+from collections import Counter
 from datetime import date, timedelta
-from pathlib import Path
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
-from dotenv import load_dotenv
 from plotly.subplots import make_subplots
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
 
+from src.config import get_database_url
 from src.domain.models.market_regime import (
     EnvironmentCode,
     MarketRegime,
     RiskLevel,
 )
 from src.domain.services.analysis.market_regime_analyzer import MarketRegimeAnalyzer
-from src.infrastructure.persistence.models import Universe
+from src.infrastructure.cache import RegimeCache, RegimesByDate
+from src.infrastructure.persistence.database import create_session
 from src.infrastructure.persistence.repositories.daily_price_repository import (
     PostgresDailyPriceRepository,
 )
@@ -31,10 +34,6 @@ from src.infrastructure.persistence.repositories.universe_repository import (
     PostgresUniverseRepository,
 )
 
-# Load .env file from project root
-_env_path = Path(__file__).resolve().parents[3] / ".env"
-load_dotenv(_env_path)
-
 # 日本語表示名マッピング
 ENVIRONMENT_NAMES: dict[EnvironmentCode, str] = {
     EnvironmentCode.STABLE_UPTREND: "健全な上昇",
@@ -69,52 +68,43 @@ RISK_LEVEL_NAMES: dict[RiskLevel, str] = {
 NIKKEI_ETF_SYMBOL = "1321.T"
 TOPIX_ETF_SYMBOL = "1306.T"
 
+# 価格チャートに描画するローソク足・環境バーの最大本数（超える期間は間引く）
+MAX_CHART_POINTS = 500
+
+# 市場指数の分析に必要な遡り期間（日数）。ユニバース価格はこれより短い
+INDEX_LOOKBACK_DAYS = 100
 
-def get_database_url() -> str:
-    """環境変数からデータベースURLを構築する."""
-    host = os.getenv("DB_HOST", "localhost")
-    port = os.getenv("DB_PORT", "5432")
-    name = os.getenv("DB_NAME", "swing_trading")
-    user = os.getenv("DB_USER", "postgres")
-    password = os.getenv("DB_PASSWORD", "postgres")
-    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
+# 期間分析結果のディスクキャッシュ（サーバー再起動後も再利用する）
+REGIME_CACHE = RegimeCache()
 
 
-@st.cache_resource
 def get_db_session() -> Session:
-    """DBセッションを取得（キャッシュ）."""
-    database_url = get_database_url()
-    engine = create_engine(database_url)
-    session_factory = sessionmaker(bind=engine)
-    return session_factory()
+    """DBセッションを取得（エンジンと接続プールはプロセス内で共有）."""
+    return create_session(get_database_url())
 
 
-def get_all_universes(session: Session) -> list[Universe]:
-    """全ユニバースを取得."""
-    return list(session.query(Universe).order_by(Universe.created_at.desc()).all())
+@st.cache_data(ttl=60)
+def get_universe_options(_session: Session) -> dict[str, int]:
+    """ユニバース選択肢（表示ラベル → universe_id）を取得（キャッシュ）."""
+    universes = PostgresUniverseRepository(_session).list_summaries()
+    return {f"{u.name} ({u.total_symbols}銘柄)": u.universe_id for u in universes}
 
 
+@st.cache_data(ttl=3600)
 def get_index_prices(
-    session: Session,
-    symbol: str,
+    _session: Session,
     start_date: date,
     end_date: date,
-) -> pd.DataFrame | None:
-    """市場指数ETFの価格データを取得."""
-    repo = PostgresDailyPriceRepository(session)
-    ticker = repo.get_or_create_ticker(symbol)
+) -> dict[str, pd.DataFrame]:
+    """市場指数ETF（日経225・TOPIX）の価格データを1クエリで取得."""
+    repo = PostgresDailyPriceRepository(_session)
 
     # 分析に必要な遡り期間を含めて取得
-    extended_start = start_date - timedelta(days=100)
-    daily_prices = repo.get_by_ticker_and_date_range(
-        ticker.ticker_id, extended_start, end_date
+    extended_start = start_date - timedelta(days=INDEX_LOOKBACK_DAYS)
+    return repo.get_dataframes_by_symbols_and_date_range(
+        [NIKKEI_ETF_SYMBOL, TOPIX_ETF_SYMBOL], extended_start, end_date
     )
 
-    if not daily_prices:
-        return None
-
-    return repo.daily_prices_to_dataframe(daily_prices)
-
 
 @st.cache_data(ttl=3600)
 def analyze_period(
@@ -123,62 +113,136 @@ def analyze_period(
     start_date: date,
     end_date: date,
 ) -> list[MarketRegime]:
-    """期間内の各日の市場レジームを分析."""
+    """期間内の各日の市場レジームを分析（計算済みの日はキャッシュを使う）."""
+    universe_repo = PostgresUniverseRepository(_session)
+
+    # 分析が読む範囲（遡り期間を含む）の価格だけでバージョンを求める。
+    # 範囲か価格が変わると別キーになり、古いキーのファイルは保存時に削除される
+    version_start = start_date - timedelta(days=INDEX_LOOKBACK_DAYS)
+    data_version = universe_repo.get_price_data_version(
+        universe_id, version_start, end_date, [NIKKEI_ETF_SYMBOL, TOPIX_ETF_SYMBOL]
+    )
+    cache_key = RegimeCache.build_key(
+        universe_id, f"{version_start}|{end_date}|{data_version}"
+    )
+    known = REGIME_CACHE.get(cache_key)
+
+    # 分析対象日のうち未計算の日だけを分析する
+    analysis_dates = [
+        d.date() for d in pd.date_range(start=start_date, end=end_date, freq="B")
+    ]
+    missing = [d for d in analysis_dates if d not in known]
+    if missing:
+        computed = analyze_dates(_session, universe_id, missing)
+        if computed:
+            known.update(computed)
+            # キャッシュに保存できなくても分析結果はそのまま返す
+            with contextlib.suppress(OSError):
+                REGIME_CACHE.put(cache_key, known)
+
+    return [
+        regime
+        for regime in (known.get(d) for d in analysis_dates)
+        if regime is not None
+    ]
+
+
+def analyze_dates(
+    session: Session,
+    universe_id: int,
+    analysis_dates: list[date],
+) -> RegimesByDate:
+    """
+    指定した基準日（昇順）の市場レジームを一括で分析.
+
+    データ不足で分析できなかった日はNoneとして返す。
+    価格データが揃っていない場合や分析に失敗した場合は空の辞書を返す。
+    """
+    start_date, end_date = analysis_dates[0], analysis_dates[-1]
+
     # 価格データ取得
-    nikkei_df = get_index_prices(_session, NIKKEI_ETF_SYMBOL, start_date, end_date)
-    topix_df = get_index_prices(_session, TOPIX_ETF_SYMBOL, start_date, end_date)
+    index_prices = get_index_prices(session, start_date, end_date)
+    nikkei_df = index_prices.get(NIKKEI_ETF_SYMBOL)
+    topix_df = index_prices.get(TOPIX_ETF_SYMBOL)
 
     if nikkei_df is None or topix_df is None:
-        return []
+        return {}
 
     # ユニバース価格取得
-    universe_repo = PostgresUniverseRepository(_session)
     extended_start = start_date - timedelta(days=50)
-    universe_prices = universe_repo.get_universe_prices(
+    # 日付×銘柄の終値行列として取得する
+    close_matrix = PostgresUniverseRepository(session).get_universe_close_matrix(
         universe_id, extended_start, end_date
     )
 
-    # 分析実行
+    # 指標は全期間で1回だけ計算し、各日の値は対象日時点の最新値を参照する
     analyzer = MarketRegimeAnalyzer()
-    results: list[MarketRegime] = []
-
-    # 分析対象日のリスト
-    analysis_dates = pd.date_range(start=start_date, end=end_date, freq="B")
-
-    for target_date in analysis_dates:
-        target = target_date.date()
-
-        # 対象日までのデータでフィルタ
-        nikkei_subset = nikkei_df[nikkei_df.index <= target_date]
-        topix_subset = topix_df[topix_df.index <= target_date]
+    try:
+        results = analyzer.analyze_range(
+            nikkei_df, topix_df, close_matrix, analysis_dates
+        )
+    except Exception:
+        return {}
+
+    computed: RegimesByDate = dict.fromkeys(analysis_dates)
+    computed.update((regime.analysis_date, regime) for regime in results)
+    return computed
+
+
+def regimes_to_arrays(regimes: list[MarketRegime]) -> dict[str, list[Any]]:
+    """チャート描画に使う値を分析結果から1回の走査で取り出す."""
+    arrays: dict[str, list[Any]] = {
+        "dates": [],
+        "colors": [],
+        "env_names": [],
+        "scores": [],
+        "short_adr": [],
+        "medium_adr": [],
+    }
+    for r in regimes:
+        ratios = r.market_breadth.advancing_declining_ratios
+        arrays["dates"].append(r.analysis_date)
+        arrays["colors"].append(ENVIRONMENT_COLORS.get(r.environment_code, "#999"))
+        arrays["env_names"].append(ENVIRONMENT_NAMES.get(r.environment_code, "不明"))
+        arrays["scores"].append(r.risk_assessment.risk_score)
+        arrays["short_adr"].append(ratios.get("short_term", 100))
+        arrays["medium_adr"].append(ratios.get("medium_term", 100))
+    return arrays
 
-        if len(nikkei_subset) < 30 or len(topix_subset) < 30:
-            continue
 
-        # ユニバース価格もフィルタ
-        universe_subset = {}
-        for symbol, df in universe_prices.items():
-            filtered = df[df.index <= target_date]
-            if len(filtered) >= 5:
-                universe_subset[symbol] = filtered
+@st.cache_data(ttl=3600)
+def build_chart_json(
+    nikkei_df: pd.DataFrame | None,
+    arrays: dict[str, list[Any]],
+    start_date: date,
+    end_date: date,
+) -> dict[str, str]:
+    """
+    チャートを組み立ててJSON文字列で返す（キャッシュ）.
+
+    描画対象の値が同じなら、無関係なウィジェット操作による再実行で
+    figureを組み立て直さない。
+    """
+    charts = {
+        "risk": _figure_json(create_risk_chart(arrays)),
+        "adr": _figure_json(create_adr_chart(arrays)),
+    }
+    if nikkei_df is not None:
+        charts["price"] = _figure_json(
+            create_price_chart(nikkei_df, arrays, start_date, end_date)
+        )
+    return charts
 
-        try:
-            result = analyzer.analyze(
-                nikkei_df=nikkei_subset,
-                topix_df=topix_subset,
-                universe_prices=universe_subset,
-                end_date=target,
-            )
-            results.append(result)
-        except Exception:
-            continue
 
-    return results
+def _figure_json(fig: go.Figure) -> str:
+    """figureをJSON文字列に変換."""
+    # ファイル出力先を渡さない場合、to_jsonは常に文字列を返す
+    return cast("str", fig.to_json())
 
 
 def create_price_chart(
     nikkei_df: pd.DataFrame,
-    regimes: list[MarketRegime],
+    arrays: dict[str, list[Any]],
     start_date: date,
     end_date: date,
 ) -> go.Figure:
@@ -192,11 +256,11 @@ def create_price_chart(
         subplot_titles=("日経225 ETF", "市場環境"),
     )
 
-    # 期間でフィルタ
+    # 期間でフィルタし、長期間ならローソク足をまとめて本数を抑える
     mask = (nikkei_df.index >= pd.Timestamp(start_date)) & (
         nikkei_df.index <= pd.Timestamp(end_date)
     )
-    filtered_df = nikkei_df[mask]
+    filtered_df = downsample_ohlc(nikkei_df[mask])
 
     # ローソク足チャート
     fig.add_trace(
@@ -213,11 +277,8 @@ def create_price_chart(
     )
 
     # 環境コードのバー表示
-    if regimes:
-        dates = [r.analysis_date for r in regimes]
-        colors = [ENVIRONMENT_COLORS.get(r.environment_code, "#999") for r in regimes]
-        env_names = [ENVIRONMENT_NAMES.get(r.environment_code, "不明") for r in regimes]
-
+    dates, colors, env_names = downsample_regimes(arrays)
+    if dates:
         fig.add_trace(
             go.Bar(
                 x=dates,
@@ -242,13 +303,64 @@ def create_price_chart(
     return fig
 
 
-def create_risk_chart(regimes: list[MarketRegime]) -> go.Figure:
+def _bucket_size(n: int, max_points: int) -> int:
+    """n件をmax_points件以下にまとめるときの1区間あたりの件数."""
+    return -(-n // max_points)
+
+
+def downsample_ohlc(
+    df: pd.DataFrame, max_points: int = MAX_CHART_POINTS
+) -> pd.DataFrame:
+    """
+    ローソク足をmax_points本以下にまとめる.
+
+    連続する行を同じ本数ずつ区切り、区間の始値・高値・安値・終値（出来高は合計）
+    を1本とする。日付は区間の先頭日を使う。
+    """
+    if len(df) <= max_points:
+        return df
+
+    bucket = _bucket_size(len(df), max_points)
+    agg = {"open": "first", "high": "max", "low": "min", "close": "last"}
+    if "volume" in df.columns:
+        agg["volume"] = "sum"
+    resampled = df.groupby(np.arange(len(df)) // bucket).agg(agg)
+    resampled.index = df.index[::bucket]
+    return resampled
+
+
+def downsample_regimes(
+    arrays: dict[str, list[Any]], max_points: int = MAX_CHART_POINTS
+) -> tuple[list[Any], list[Any], list[Any]]:
+    """
+    環境バーの日付・色・名称をmax_points本以下にまとめる.
+
+    各区間では最も多く出現した環境を代表とし、日付は区間の先頭日を使う。
+    """
+    dates, colors, names = arrays["dates"], arrays["colors"], arrays["env_names"]
+    if len(dates) <= max_points:
+        return dates, colors, names
+
+    bucket = _bucket_size(len(dates), max_points)
+    out_dates: list[Any] = []
+    out_colors: list[Any] = []
+    out_names: list[Any] = []
+    for start in range(0, len(dates), bucket):
+        bucket_names = names[start : start + bucket]
+        dominant = Counter(bucket_names).most_common(1)[0][0]
+        out_dates.append(dates[start])
+        out_colors.append(colors[start + bucket_names.index(dominant)])
+        out_names.append(dominant)
+    return out_dates, out_colors, out_names
+
+
+def create_risk_chart(arrays: dict[str, list[Any]]) -> go.Figure:
     """リスクスコアの推移チャート."""
-    if not regimes:
+    if not arrays["dates"]:
         return go.Figure()
 
-    dates = [r.analysis_date for r in regimes]
-    scores = [r.risk_assessment.risk_score for r in regimes]
+    dates = arrays["dates"]
+    scores = arrays["scores"]
 
     fig = go.Figure()
 
@@ -279,20 +391,14 @@ def create_risk_chart(regimes: list[MarketRegime]) -> go.Figure:
     return fig
 
 
-def create_adr_chart(regimes: list[MarketRegime]) -> go.Figure:
+def create_adr_chart(arrays: dict[str, list[Any]]) -> go.Figure:
     """ADR（騰落レシオ）の推移チャート."""
-    if not regimes:
+    if not arrays["dates"]:
         return go.Figure()
 
-    dates = [r.analysis_date for r in regimes]
-    short_adr = [
-        r.market_breadth.advancing_declining_ratios.get("short_term", 100)
-        for r in regimes
-    ]
-    medium_adr = [
-        r.market_breadth.advancing_declining_ratios.get("medium_term", 100)
-        for r in regimes
-    ]
+    dates = arrays["dates"]
+    short_adr = arrays["short_adr"]
+    medium_adr = arrays["medium_adr"]
 
     fig = go.Figure()
 
@@ -355,22 +461,30 @@ def main() -> None:
         st.error(f"データベース接続エラー: {e}")
         return
 
+    try:
+        _render_page(session)
+    finally:
+        # 再実行ごとに接続をプールへ返却する
+        session.close()
+
+
+def _render_page(session: Session) -> None:
+    """ページ本体を描画."""
     # 全ユニバース取得
-    universes = get_all_universes(session)
+    universe_options = get_universe_options(session)
 
-    if not universes:
+    if not universe_options:
         st.error("ユニバースが登録されていません")
         return
 
     # ユニバース選択UI
-    universe_options = {f"{u.name} ({u.total_symbols}銘柄)": u for u in universes}
 
     selected_label = st.sidebar.selectbox(
         "分析対象ユニバース",
         options=list(universe_options.keys()),
     )
 
-    selected_universe = universe_options[selected_label]
+    selected_universe_id = universe_options[selected_label]
 
     # 期間選択
     col1, col2 = st.sidebar.columns(2)
@@ -395,7 +509,7 @@ def main() -> None:
     with st.spinner("分析中..."):
         regimes = analyze_period(
             session,
-            selected_universe.universe_id,
+            selected_universe_id,
             start_date,
             end_date,
         )
@@ -442,23 +556,23 @@ def main() -> None:
 
     st.divider()
 
-    # チャート
-    nikkei_df = get_index_prices(session, NIKKEI_ETF_SYMBOL, start_date, end_date)
+    # チャート（analyze_periodで取得済みの価格データをキャッシュから再利用）
+    nikkei_df = get_index_prices(session, start_date, end_date).get(NIKKEI_ETF_SYMBOL)
+    charts = build_chart_json(
+        nikkei_df, regimes_to_arrays(regimes), start_date, end_date
+    )
 
-    if nikkei_df is not None:
-        st.plotly_chart(
-            create_price_chart(nikkei_df, regimes, start_date, end_date),
-            use_container_width=True,
-        )
+    if "price" in charts:
+        st.plotly_chart(json.loads(charts["price"]), use_container_width=True)
 
     # 下段のチャート
     col1, col2 = st.columns(2)
 
     with col1:
-        st.plotly_chart(create_risk_chart(regimes), use_container_width=True)
+        st.plotly_chart(json.loads(charts["risk"]), use_container_width=True)
 
     with col2:
-        st.plotly_chart(create_adr_chart(regimes), use_container_width=True)
+        st.plotly_chart(json.loads(charts["adr"]), use_container_width=True)
 
     # 環境コードの凡例
     st.sidebar.divider()
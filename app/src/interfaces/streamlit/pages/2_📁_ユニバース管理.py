@@ -6,62 +6,60 @@
 # pyright: reportGeneralTypeIssues=false
 # NOTE: Streamlit/SQLAlchemy type stubs are incomplete
 
-import os
+from collections.abc import Generator
+from contextlib import contextmanager
 from datetime import date
-from pathlib import Path
 
+import pandas as pd
 import streamlit as st
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
 
+from src.config import get_database_url
+from src.infrastructure.persistence.database import create_session
 from src.infrastructure.persistence.models import Universe, UniverseMode
-from src.infrastructure.persistence.repositories.ticker_repository import (
-    PostgresTickerRepository,
-)
 from src.infrastructure.persistence.repositories.universe_repository import (
     PostgresUniverseRepository,
 )
+from src.interfaces.streamlit.components import get_ticker_count, search_tickers
 
-# Load .env file from project root
-_env_path = Path(__file__).resolve().parents[4] / ".env"
-load_dotenv(_env_path)
 
+def get_db_session() -> Session:
+    """DBセッションを取得（エンジンと接続プールはプロセス内で共有）."""
+    return create_session(get_database_url())
 
-def get_database_url() -> str:
-    """環境変数からデータベースURLを構築する."""
-    host = os.getenv("DB_HOST", "localhost")
-    port = os.getenv("DB_PORT", "5432")
-    name = os.getenv("DB_NAME", "swing_trading")
-    user = os.getenv("DB_USER", "postgres")
-    password = os.getenv("DB_PASSWORD", "postgres")
-    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
 
+@contextmanager
+def write_session() -> Generator[Session, None, None]:
+    """
+    書き込み用のセッションをトランザクション付きで開く.
 
-@st.cache_resource
-def get_db_session() -> Session:
-    """DBセッションを取得（キャッシュ）."""
-    database_url = get_database_url()
-    engine = create_engine(database_url)
-    session_factory = sessionmaker(bind=engine)
-    return session_factory()
+    ブロックを正常に抜けるとコミット、例外で抜けるとロールバックし、
+    いずれの場合も接続をプールへ返却する。
+    """
+    with create_session(get_database_url()) as session, session.begin():
+        yield session
 
 
-def get_all_universes(session: Session) -> list[Universe]:
-    """全ユニバースを取得."""
-    return list(session.query(Universe).order_by(Universe.created_at.desc()).all())
+@st.cache_data(ttl=60)
+def get_universe_options(_session: Session) -> dict[str, int]:
+    """ユニバース選択肢（表示ラベル → universe_id）を取得（キャッシュ）."""
+    universes = PostgresUniverseRepository(_session).list_summaries()
+    return {
+        f"{u.name} ({u.total_symbols}銘柄) - {u.as_of_date}": u.universe_id
+        for u in universes
+    }
 
 
-def delete_universe(session: Session, universe_id: int) -> bool:
-    """ユニバースを削除."""
-    universe = (
-        session.query(Universe).filter(Universe.universe_id == universe_id).first()
-    )
-    if universe:
+def delete_universe(universe_id: int) -> bool:
+    """ユニバースを削除（成功時はコミット、失敗時はロールバック）."""
+    with write_session() as session:
+        universe = (
+            session.query(Universe).filter(Universe.universe_id == universe_id).first()
+        )
+        if universe is None:
+            return False
         session.delete(universe)
-        session.commit()
         return True
-    return False
 
 
 def main() -> None:
@@ -75,7 +73,15 @@ def main() -> None:
         st.error(f"データベース接続エラー: {e}")
         return
 
-    ticker_repo = PostgresTickerRepository(session)
+    try:
+        _render_page(session)
+    finally:
+        # 再実行ごとに接続をプールへ返却する
+        session.close()
+
+
+def _render_page(session: Session) -> None:
+    """ページ本体を描画."""
     universe_repo = PostgresUniverseRepository(session)
 
     # タブ
@@ -92,10 +98,10 @@ def main() -> None:
         with col2:
             universe_desc = st.text_input("説明（任意）", placeholder="説明を入力")
 
-        # 銘柄一覧取得
-        all_tickers = ticker_repo.get_all()
+        # 銘柄数取得
+        total_count = get_ticker_count(session)
 
-        if not all_tickers:
+        if total_count == 0:
             st.warning("Tickerテーブルに銘柄が登録されていません")
             return
 
@@ -105,40 +111,20 @@ def main() -> None:
             placeholder="シンボルまたは銘柄名で検索...",
         )
 
-        # フィルタリング
-        filtered_tickers = all_tickers
-        if search_query:
-            query_lower = search_query.lower()
-            filtered_tickers = [
-                t
-                for t in all_tickers
-                if query_lower in (t.symbol or "").lower()
-                or query_lower in (t.name or "").lower()
-            ]
+        # 絞り込みと件数制限はSQL側で行う（最大100件）
+        visible, match_count = search_tickers(session, search_query, 100)
 
         # セッションステートで選択を管理
         if "selected_ticker_ids" not in st.session_state:
             st.session_state.selected_ticker_ids = set()
 
         # 銘柄選択UI
-        st.write(f"表示中: {len(filtered_tickers)}銘柄 / 全{len(all_tickers)}銘柄")
-
-        # データフレーム形式で表示
-        ticker_data = []
-        for t in filtered_tickers[:100]:  # 最大100件表示
-            ticker_data.append(
-                {
-                    "ticker_id": t.ticker_id,
-                    "symbol": t.symbol,
-                    "name": t.name or "",
-                    "sector": t.sector or "",
-                }
-            )
+        st.write(f"表示中: {match_count}銘柄 / 全{total_count}銘柄")
 
-        if ticker_data:
+        if visible:
             # マルチセレクト
             options = {
-                f"{t['symbol']} - {t['name']}": t["ticker_id"] for t in ticker_data
+                f"{symbol} - {name}": ticker_id for ticker_id, symbol, name in visible
             }
 
             selected_labels = st.multiselect(
@@ -166,25 +152,31 @@ def main() -> None:
                 st.error("銘柄を1つ以上選択してください")
             else:
                 try:
-                    # ユニバース作成
-                    new_universe = Universe(
-                        name=universe_name,
-                        mode=UniverseMode.PRODUCTION,
-                        as_of_date=date.today(),
-                        config_name="streamlit_ui",
-                        description=universe_desc or None,
-                        total_symbols=len(st.session_state.selected_ticker_ids),
-                    )
-                    universe_repo.save(new_universe)
+                    with write_session() as tx_session:
+                        tx_repo = PostgresUniverseRepository(tx_session)
+
+                        # ユニバース作成
+                        new_universe = Universe(
+                            name=universe_name,
+                            mode=UniverseMode.PRODUCTION,
+                            as_of_date=date.today(),
+                            config_name="streamlit_ui",
+                            description=universe_desc or None,
+                            total_symbols=len(st.session_state.selected_ticker_ids),
+                        )
+                        tx_repo.save(new_universe)
+                        # universe_idを採番させる
+                        tx_session.flush()
 
-                    # シンボル追加
-                    for ticker_id in st.session_state.selected_ticker_ids:
-                        universe_repo.add_symbol(
+                        # シンボル追加（1回のバルクINSERT）
+                        tx_repo.add_symbols_bulk(
                             new_universe.universe_id,
-                            ticker_id,
+                            st.session_state.selected_ticker_ids,
                         )
-
-                    session.commit()
+                except Exception as e:
+                    st.error(f"作成に失敗しました: {e}")
+                else:
+                    get_universe_options.clear()
 
                     st.success(
                         f"ユニバース '{universe_name}' を作成しました "
@@ -195,25 +187,17 @@ def main() -> None:
                     st.session_state.selected_ticker_ids = set()
                     st.rerun()
 
-                except Exception as e:
-                    session.rollback()
-                    st.error(f"作成に失敗しました: {e}")
-
     # ========== 既存を表示タブ ==========
     with tab2:
         st.subheader("既存ユニバース一覧")
 
-        universes = get_all_universes(session)
+        universe_options = get_universe_options(session)
 
-        if not universes:
+        if not universe_options:
             st.info("ユニバースがまだ作成されていません")
             return
 
         # ユニバース選択
-        universe_options = {
-            f"{u.name} ({u.total_symbols}銘柄) - {u.as_of_date}": u.universe_id
-            for u in universes
-        }
 
         selected_universe_label = st.selectbox(
             "ユニバースを選択",
@@ -244,17 +228,20 @@ def main() -> None:
                 symbols = universe_repo.get_symbols(selected_universe_id)
 
                 if symbols:
-                    # 3列で表示
-                    cols = st.columns(3)
-                    for i, symbol in enumerate(symbols):
-                        cols[i % 3].write(f"• {symbol}")
+                    # 銘柄ごとに要素を描画せず、1つの表として表示する
+                    st.dataframe(
+                        pd.DataFrame({"銘柄": symbols}),
+                        hide_index=True,
+                        use_container_width=True,
+                    )
                 else:
                     st.write("銘柄がありません")
 
                 # 削除ボタン
                 st.divider()
                 if st.button("このユニバースを削除", type="secondary"):
-                    if delete_universe(session, selected_universe_id):
+                    if delete_universe(selected_universe_id):
+                        get_universe_options.clear()
                         name = selected_universe.name
                         st.success(f"ユニバース '{name}' を削除しました")
                         st.rerun()
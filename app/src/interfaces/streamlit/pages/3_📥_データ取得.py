@@ -6,39 +6,32 @@
 # pyright: reportGeneralTypeIssues=false, reportAssignmentType=false
 # NOTE: Streamlit/SQLAlchemy type stubs are incomplete
 
-import os
 import re
 from datetime import date, timedelta
-from pathlib import Path
 
+import pandas as pd
 import streamlit as st
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
 
 from src.application.commands.collect_data import (
     CollectDataHandler,
     FetchStockDataCommand,
     FetchStockDataResult,
 )
+from src.config import get_database_url
 from src.domain.services.analysis.technical_indicators import (
     TechnicalIndicatorService,
 )
 from src.infrastructure.external.yahoo_finance import YahooFinanceClient
-from src.infrastructure.persistence.models import Universe
+from src.infrastructure.persistence.database import create_session
 from src.infrastructure.persistence.repositories.daily_price_repository import (
     PostgresDailyPriceRepository,
 )
-from src.infrastructure.persistence.repositories.ticker_repository import (
-    PostgresTickerRepository,
+from src.interfaces.streamlit.components import (
+    clear_ticker_caches,
+    render_ticker_picker,
+    render_universe_picker,
 )
-from src.infrastructure.persistence.repositories.universe_repository import (
-    PostgresUniverseRepository,
-)
-
-# Load .env file from project root
-_env_path = Path(__file__).resolve().parents[4] / ".env"
-load_dotenv(_env_path)
 
 # 期間プリセット
 PERIOD_OPTIONS = {
@@ -54,30 +47,15 @@ PERIOD_OPTIONS = {
     "年初来": "ytd",
     "全期間": "max",
 }
+PERIOD_LABELS = tuple(PERIOD_OPTIONS)
 
+# シンボル入力の区切り文字（カンマ・空白・改行）
+_SYMBOL_SPLIT_RE = re.compile(r"[,\s]+")
 
-def get_database_url() -> str:
-    """環境変数からデータベースURLを構築する."""
-    host = os.getenv("DB_HOST", "localhost")
-    port = os.getenv("DB_PORT", "5432")
-    name = os.getenv("DB_NAME", "swing_trading")
-    user = os.getenv("DB_USER", "postgres")
-    password = os.getenv("DB_PASSWORD", "postgres")
-    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
 
-
-@st.cache_resource
 def get_db_session() -> Session:
-    """DBセッションを取得（キャッシュ）."""
-    database_url = get_database_url()
-    engine = create_engine(database_url)
-    session_factory = sessionmaker(bind=engine)
-    return session_factory()
-
-
-def get_all_universes(session: Session) -> list[Universe]:
-    """全ユニバースを取得."""
-    return list(session.query(Universe).order_by(Universe.created_at.desc()).all())
+    """DBセッションを取得（エンジンと接続プールはプロセス内で共有）."""
+    return create_session(get_database_url())
 
 
 def parse_symbols(input_text: str) -> list[str]:
@@ -86,25 +64,13 @@ def parse_symbols(input_text: str) -> list[str]:
 
     カンマ、改行、スペースで分割し、空白をトリム。
     .Tサフィックスがない場合は自動付与（数字のみの場合）。
+    重複したシンボルは最初の1件のみ残す。
     """
-    if not input_text.strip():
-        return []
-
-    # カンマ、改行、スペースで分割
-    symbols = re.split(r"[,\s\n]+", input_text.strip())
-
-    # 空白トリムとフィルタ
-    symbols = [s.strip().upper() for s in symbols if s.strip()]
-
-    # 数字のみの場合は.Tを付与
-    processed = []
-    for s in symbols:
-        if s.isdigit():
-            processed.append(f"{s}.T")
-        else:
-            processed.append(s)
-
-    return processed
+    # カンマ、改行、スペースで分割し、数字のみの場合は.Tを付与
+    tokens = (token.upper() for token in _SYMBOL_SPLIT_RE.split(input_text.strip()))
+    symbols = (f"{s}.T" if s.isdigit() else s for s in tokens if s)
+    # 重複は入力順を保って除く（7203 と 7203.T なども同一銘柄として扱う）
+    return list(dict.fromkeys(symbols))
 
 
 def execute_data_fetch(
@@ -147,9 +113,15 @@ def main() -> None:
         st.error(f"データベース接続エラー: {e}")
         return
 
-    ticker_repo = PostgresTickerRepository(session)
-    universe_repo = PostgresUniverseRepository(session)
+    try:
+        _render_page(session)
+    finally:
+        # 再実行ごとに接続をプールへ返却する
+        session.close()
+
 
+def _render_page(session: Session) -> None:
+    """ページ本体を描画."""
     # セッションステートで選択銘柄を管理
     if "data_fetch_symbols" not in st.session_state:
         st.session_state.data_fetch_symbols = []
@@ -167,81 +139,20 @@ def main() -> None:
     with tab1:
         st.subheader("登録済みTickerから選択")
 
-        all_tickers = ticker_repo.get_all()
-
-        if not all_tickers:
-            st.warning("Tickerテーブルに銘柄が登録されていません")
-        else:
-            # 検索フィルタ
-            search_query = st.text_input(
-                "銘柄検索",
-                placeholder="シンボルまたは銘柄名で検索...",
-                key="ticker_search",
-            )
-
-            # フィルタリング
-            filtered_tickers = all_tickers
-            if search_query:
-                query_lower = search_query.lower()
-                filtered_tickers = [
-                    t
-                    for t in all_tickers
-                    if query_lower in (t.symbol or "").lower()
-                    or query_lower in (t.name or "").lower()
-                ]
-
-            st.write(f"表示中: {len(filtered_tickers)}銘柄 / 全{len(all_tickers)}銘柄")
-
-            # マルチセレクト
-            ticker_options = {
-                f"{t.symbol} - {t.name or ''}": t.symbol
-                for t in filtered_tickers[:200]  # 最大200件
-            }
-
-            selected_ticker_labels = st.multiselect(
-                "銘柄を選択",
-                options=list(ticker_options.keys()),
-                key="ticker_multiselect",
-            )
+        symbols_from_ticker = [
+            symbol for symbol, _ in render_ticker_picker(session, key_prefix="")
+        ]
 
-            symbols_from_ticker = [
-                ticker_options[label] for label in selected_ticker_labels
-            ]
-
-            if symbols_from_ticker:
-                st.info(f"選択中: {len(symbols_from_ticker)}銘柄")
+        if symbols_from_ticker:
+            st.info(f"選択中: {len(symbols_from_ticker)}銘柄")
 
     # ---------- タブ2: ユニバースから選択 ----------
     with tab2:
         st.subheader("ユニバースから選択")
 
-        universes = get_all_universes(session)
-
-        if not universes:
-            st.warning("ユニバースが登録されていません")
-        else:
-            universe_options = {
-                f"{u.name} ({u.total_symbols}銘柄)": u.universe_id for u in universes
-            }
-
-            selected_universe_label = st.selectbox(
-                "ユニバースを選択",
-                options=list(universe_options.keys()),
-                key="universe_selectbox",
-            )
-
-            if selected_universe_label:
-                selected_universe_id = universe_options[selected_universe_label]
-                symbols_from_universe = universe_repo.get_symbols(selected_universe_id)
-
-                if symbols_from_universe:
-                    st.info(f"含まれる銘柄: {len(symbols_from_universe)}件")
-
-                    # 銘柄一覧を表示（展開可能）
-                    with st.expander("銘柄一覧を表示"):
-                        cols = st.columns(4)
-                        for i, symbol in enumerate(symbols_from_universe):
-                            cols[i % 4].write(f"• {symbol}")
+        symbols_from_universe = [
+            symbol for symbol, _ in render_universe_picker(session, key_prefix="")
+        ]
 
     # ---------- タブ3: 新規シンボル入力 ----------
     with tab3:
@@ -286,7 +197,7 @@ def main() -> None:
         with col1:
             selected_period_label = st.selectbox(
                 "期間",
-                options=list(PERIOD_OPTIONS.keys()),
+                options=PERIOD_LABELS,
                 index=3,  # デフォルト: 3ヶ月
                 key="period_select",
             )
@@ -327,6 +238,9 @@ def main() -> None:
         all_selected_symbols = symbols_from_input
         source_description = "新規シンボル"
 
+    # 確定した取得対象は再実行後も参照できるよう保持する
+    st.session_state.data_fetch_symbols = all_selected_symbols
+
     # 取得対象の表示
     if all_selected_symbols:
         count = len(all_selected_symbols)
@@ -364,6 +278,8 @@ def main() -> None:
 
                     # コミット
                     session.commit()
+                    # 新規登録された銘柄を検索候補に反映する
+                    clear_ticker_caches()
 
                     # 結果表示
                     if result.success_count > 0:
@@ -372,11 +288,19 @@ def main() -> None:
                             f"✓ {result.success_count}銘柄のデータを取得しました"
                         )
 
-                        # 詳細結果
+                        # 詳細結果（銘柄ごとに要素を描画せず、1つの表として表示する）
                         st.subheader("取得結果")
-                        for symbol, df in result.data.items():
-                            saved = result.saved_records.get(symbol, 0)
-                            st.write(f"• **{symbol}**: {len(df)}行取得, {saved}行保存")
+                        summary = pd.DataFrame(
+                            {
+                                "銘柄": list(result.data),
+                                "取得行数": [len(df) for df in result.data.values()],
+                                "保存行数": [
+                                    result.saved_records.get(symbol, 0)
+                                    for symbol in result.data
+                                ],
+                            }
+                        )
+                        st.dataframe(summary, hide_index=True)
                     else:
                         status.update(label="データなし", state="error")
                         st.warning("データを取得できませんでした")
@@ -15,6 +15,8 @@ class StockDataFetchError(StockAnalysisError):
         symbol: The ticker symbol that failed to fetch (optional).
     """
 
+    __slots__ = ("symbol",)
+
     def __init__(self, message: str, symbol: str | None = None) -> None:
         """
         Initialize the exception.
@@ -26,6 +28,10 @@ class StockDataFetchError(StockAnalysisError):
         self.symbol = symbol
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[type["StockDataFetchError"], tuple[object, ...]]:
+        """Keep the slot values when pickling (slots are not in ``__dict__``)."""
+        return (type(self), (*self.args, self.symbol))
+
 
 class ValidationError(StockAnalysisError):
     """Exception raised for validation errors."""
@@ -48,6 +54,8 @@ class IndicatorCalculationError(StockAnalysisError):
         symbol: The ticker symbol that failed (optional).
     """
 
+    __slots__ = ("indicator", "symbol")
+
     def __init__(
         self,
         message: str,
@@ -66,6 +74,12 @@ class IndicatorCalculationError(StockAnalysisError):
         self.symbol = symbol
         super().__init__(message)
 
+    def __reduce__(
+        self,
+    ) -> tuple[type["IndicatorCalculationError"], tuple[object, ...]]:
+        """Keep the slot values when pickling (slots are not in ``__dict__``)."""
+        return (type(self), (*self.args, self.indicator, self.symbol))
+
 
 class MarketRegimeAnalysisError(StockAnalysisError):
     """
@@ -75,6 +89,8 @@ class MarketRegimeAnalysisError(StockAnalysisError):
         reason: The reason for the analysis failure (optional).
     """
 
+    __slots__ = ("reason",)
+
     def __init__(
         self,
         message: str,
@@ -89,3 +105,9 @@ class MarketRegimeAnalysisError(StockAnalysisError):
         """
         self.reason = reason
         super().__init__(message)
+
+    def __reduce__(
+        self,
+    ) -> tuple[type["MarketRegimeAnalysisError"], tuple[object, ...]]:
+        """Keep the slot values when pickling (slots are not in ``__dict__``)."""
+        return (type(self), (*self.args, self.reason))
@@ -3,16 +3,77 @@
 # pyright: reportUnusedImport=false
 
 from datetime import date
-from unittest.mock import MagicMock
+from functools import cache
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
-import pytest  # noqa: F401
+import pytest
 
 from src.application.commands.collect_data import (
     CollectDataHandler,
     FetchStockDataCommand,
 )
-from src.shared.exceptions import StockDataFetchError
+from src.domain.ports.stock_data_source import StockDataSource
+from src.infrastructure.persistence.repositories.daily_price_repository import (
+    PostgresDailyPriceRepository,
+)
+from src.shared.exceptions import StockDataFetchError, ValidationError
+
+# Every test here builds its own mocks and in-memory frames
+pytestmark = pytest.mark.fast
+
+# Read-only ticker info shared by the tests; the handler only reads "name"
+_APPLE_INFO = MappingProxyType({"name": "Apple Inc."})
+
+
+@cache
+def _dti(*dates: str) -> pd.DatetimeIndex:
+    """Parse each date list once; Index objects are immutable and safe to share."""
+    return pd.DatetimeIndex(dates)
+
+
+def _make_df(
+    opens: npt.ArrayLike,
+    highs: npt.ArrayLike,
+    lows: npt.ArrayLike,
+    closes: npt.ArrayLike,
+    volumes: npt.ArrayLike,
+    *,
+    dates: list[str],
+) -> pd.DataFrame:
+    """Build an OHLCV frame from typed arrays (no per-column dtype inference)."""
+    return pd.DataFrame(
+        {
+            "open": np.asarray(opens, dtype=np.float64),
+            "high": np.asarray(highs, dtype=np.float64),
+            "low": np.asarray(lows, dtype=np.float64),
+            "close": np.asarray(closes, dtype=np.float64),
+            "volume": np.asarray(volumes, dtype=np.int64),
+        },
+        index=_dti(*dates),
+    )
+
+
+@pytest.fixture(scope="module")
+def ohlcv_1row() -> pd.DataFrame:
+    """One day of OHLCV data shared by the tests in this module."""
+    return _make_df([100.0], [110.0], [95.0], [105.0], [1000], dates=["2024-01-01"])
+
+
+@pytest.fixture(scope="module")
+def ohlcv_2row() -> pd.DataFrame:
+    """Two days of OHLCV data shared by the tests in this module."""
+    return _make_df(
+        [100.0, 101.0],
+        [110.0, 111.0],
+        [95.0, 96.0],
+        [105.0, 106.0],
+        [1000, 1100],
+        dates=["2024-01-01", "2024-01-02"],
+    )
 
 
 class TestFetchStockDataCommand:
@@ -41,73 +102,102 @@ class TestFetchStockDataCommand:
         assert command.end_date == date(2024, 12, 31)
         assert command.period is None
 
+    def test_rejects_empty_symbols(self) -> None:
+        """Test that at least one symbol is required."""
+        with pytest.raises(ValidationError, match="symbol"):
+            FetchStockDataCommand(symbols=[], period="1mo")
+
+    def test_rejects_period_with_dates(self) -> None:
+        """Test that period cannot be combined with a date range."""
+        with pytest.raises(ValidationError, match="Cannot use period"):
+            FetchStockDataCommand(
+                symbols=["AAPL"], start_date=date(2024, 1, 1), period="1mo"
+            )
+
+    def test_requires_period_or_start_date(self) -> None:
+        """Test that either period or start_date must be given."""
+        with pytest.raises(ValidationError, match="Must specify"):
+            FetchStockDataCommand(symbols=["AAPL"], end_date=date(2024, 12, 31))
+
+    def test_from_strings_parses_dates(self) -> None:
+        """Test that ISO date strings are parsed into dates."""
+        command = FetchStockDataCommand.from_strings(
+            symbols=["AAPL"], start_date="2024-01-01", end_date="2024-12-31"
+        )
+        assert command.start_date == date(2024, 1, 1)
+        assert command.end_date == date(2024, 12, 31)
+        assert command.period is None
+
+    def test_from_strings_rejects_invalid_date(self) -> None:
+        """Test that malformed dates raise ValidationError."""
+        with pytest.raises(ValidationError, match="Invalid start date format"):
+            FetchStockDataCommand.from_strings(
+                symbols=["AAPL"], start_date="2024/01/01"
+            )
+
 
 class TestCollectDataHandler:
     """Test cases for CollectDataHandler."""
 
-    def test_handle_single_symbol_success(self) -> None:
-        """Test fetching single symbol successfully."""
+    @pytest.mark.parametrize(
+        ("symbols", "returned", "failed"),
+        [
+            (["7203.T"], ["7203.T"], []),
+            (["AAPL", "MSFT"], ["AAPL", "MSFT"], []),
+            (["AAPL", "INVALID"], ["AAPL"], ["INVALID"]),
+        ],
+        ids=["single_symbol", "multiple_symbols", "partial_failure"],
+    )
+    def test_handle_bulk_fetch(
+        self,
+        ohlcv_2row: pd.DataFrame,
+        symbols: list[str],
+        returned: list[str],
+        failed: list[str],
+    ) -> None:
+        """Test that symbols missing from the bulk fetch are counted as errors."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_df = pd.DataFrame(
-            {
-                "open": [100.0, 101.0],
-                "high": [110.0, 111.0],
-                "low": [95.0, 96.0],
-                "close": [105.0, 106.0],
-                "volume": [1000, 1100],
-            },
-            index=pd.DatetimeIndex(["2024-01-01", "2024-01-02"]),
+        mock_data_source = Mock(spec=StockDataSource)
+        mock_data_source.fetch_multiple_daily_prices.return_value = dict.fromkeys(
+            returned, ohlcv_2row
         )
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"7203.T": mock_df}
 
         handler = CollectDataHandler(data_source=mock_data_source)
-        command = FetchStockDataCommand(
-            symbols=["7203.T"],
-            period="1mo",
-        )
+        command = FetchStockDataCommand(symbols=symbols, period="1mo")
 
         # Act
         result = handler.handle(command)
 
         # Assert
-        assert result.success_count == 1
-        assert result.error_count == 0
-        assert "7203.T" in result.data
-        assert len(result.data["7203.T"]) == 2
+        assert result.success_count == len(returned)
+        assert result.error_count == len(failed)
+        assert {s: len(df) for s, df in result.data.items()} == dict.fromkeys(
+            returned, 2
+        )
+        assert list(result.errors) == failed
 
-    def test_handle_multiple_symbols_success(self) -> None:
-        """Test fetching multiple symbols successfully."""
+    def test_handle_bulk_fetch_failure_falls_back(
+        self, ohlcv_1row: pd.DataFrame
+    ) -> None:
+        """Test fallback to individual fetching on bulk failure."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_df1 = pd.DataFrame(
-            {
-                "open": [100.0],
-                "close": [105.0],
-                "high": [110.0],
-                "low": [95.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
-        )
-        mock_df2 = pd.DataFrame(
-            {
-                "open": [200.0],
-                "close": [205.0],
-                "high": [210.0],
-                "low": [195.0],
-                "volume": [2000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
+        mock_data_source = Mock(spec=StockDataSource)
+        # Bulk fetch fails
+        mock_data_source.fetch_multiple_daily_prices.side_effect = StockDataFetchError(
+            "Bulk fetch failed"
         )
-        mock_data_source.fetch_multiple_daily_prices.return_value = {
-            "AAPL": mock_df1,
-            "MSFT": mock_df2,
-        }
+
+        # Individual fetch succeeds for AAPL, fails for INVALID
+        def fetch_daily_prices(symbol: str, **_: object) -> pd.DataFrame:
+            if symbol == "INVALID":
+                raise StockDataFetchError("Invalid symbol", symbol="INVALID")
+            return ohlcv_1row
+
+        mock_data_source.fetch_daily_prices.side_effect = fetch_daily_prices
 
         handler = CollectDataHandler(data_source=mock_data_source)
         command = FetchStockDataCommand(
-            symbols=["AAPL", "MSFT"],
+            symbols=["AAPL", "INVALID"],
             period="1mo",
         )
 
@@ -115,31 +205,32 @@ class TestCollectDataHandler:
         result = handler.handle(command)
 
         # Assert
-        assert result.success_count == 2
-        assert result.error_count == 0
+        assert result.success_count == 1
+        assert result.error_count == 1
         assert "AAPL" in result.data
-        assert "MSFT" in result.data
+        assert "INVALID" in result.errors
 
-    def test_handle_partial_failure(self) -> None:
-        """Test handling partial failures in bulk fetch."""
+    def test_handle_with_repository_saves_data(self, ohlcv_1row: pd.DataFrame) -> None:
+        """Test that data is saved when repository is provided."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_df = pd.DataFrame(
-            {
-                "open": [100.0],
-                "close": [105.0],
-                "high": [110.0],
-                "low": [95.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
-        )
-        # Only return data for AAPL, not INVALID
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": mock_df}
+        mock_data_source = Mock(spec=StockDataSource)
+        mock_repository = MagicMock(spec=PostgresDailyPriceRepository)
+        mock_ticker = Mock(ticker_id=1)
 
-        handler = CollectDataHandler(data_source=mock_data_source)
+        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": ohlcv_1row}
+        mock_data_source.fetch_ticker_info.return_value = {
+            "name": "Apple Inc.",
+            "symbol": "AAPL",
+        }
+        mock_repository.get_or_create_ticker.return_value = mock_ticker
+        mock_repository.bulk_upsert_from_dataframe.return_value = 1
+
+        handler = CollectDataHandler(
+            data_source=mock_data_source,
+            daily_price_repository=mock_repository,
+        )
         command = FetchStockDataCommand(
-            symbols=["AAPL", "INVALID"],
+            symbols=["AAPL"],
             period="1mo",
         )
 
@@ -147,38 +238,65 @@ class TestCollectDataHandler:
         result = handler.handle(command)
 
         # Assert
-        assert result.success_count == 1
-        assert result.error_count == 1
-        assert "AAPL" in result.data
-        assert "INVALID" in result.errors
-
-    def test_handle_bulk_fetch_failure_falls_back(self) -> None:
-        """Test fallback to individual fetching on bulk failure."""
-        # Arrange
-        mock_data_source = MagicMock()
-        mock_df = pd.DataFrame(
-            {
-                "open": [100.0],
-                "close": [105.0],
-                "high": [110.0],
-                "low": [95.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
+        mock_repository.get_or_create_ticker.assert_called_once_with(
+            symbol="AAPL", name="Apple Inc."
         )
-        # Bulk fetch fails
-        mock_data_source.fetch_multiple_daily_prices.side_effect = StockDataFetchError(
-            "Bulk fetch failed"
+        mock_repository.bulk_upsert_from_dataframe.assert_called_once()
+        assert result.saved_records["AAPL"] == 1
+
+    def test_handle_save_failure_is_isolated_per_symbol(
+        self, ohlcv_1row: pd.DataFrame
+    ) -> None:
+        """Test that each symbol is saved in its own savepoint."""
+        mock_data_source = Mock(spec=StockDataSource)
+        mock_repository = MagicMock(spec=PostgresDailyPriceRepository)
+        mock_data_source.fetch_multiple_daily_prices.return_value = {
+            "AAPL": ohlcv_1row,
+            "MSFT": ohlcv_1row,
+        }
+        mock_repository.get_ticker_ids_by_symbols.return_value = {"AAPL": 1, "MSFT": 2}
+
+        def upsert(ticker_id: int, df: pd.DataFrame) -> int:
+            if ticker_id == 1:
+                raise RuntimeError("constraint violation")
+            return len(df)
+
+        mock_repository.bulk_upsert_from_dataframe.side_effect = upsert
+
+        handler = CollectDataHandler(
+            data_source=mock_data_source,
+            daily_price_repository=mock_repository,
         )
-        # Individual fetch succeeds for AAPL, fails for INVALID
-        mock_data_source.fetch_daily_prices.side_effect = [
-            mock_df,
-            StockDataFetchError("Invalid symbol", symbol="INVALID"),
-        ]
+        command = FetchStockDataCommand(symbols=["AAPL", "MSFT"], period="1mo")
 
-        handler = CollectDataHandler(data_source=mock_data_source)
+        result = handler.handle(command)
+
+        assert "constraint violation" in result.errors["AAPL"]
+        assert result.saved_records == {"MSFT": 1}
+        # One savepoint for the ticker prefetch plus one per saved symbol
+        assert mock_repository.savepoint.call_count == 3
+        savepoint = mock_repository.savepoint.return_value
+        exits = savepoint.__exit__.call_args_list
+        assert [call.args[0] for call in exits[1:]] == [RuntimeError, None]
+
+    def test_handle_existing_ticker_skips_lookup(
+        self, ohlcv_1row: pd.DataFrame
+    ) -> None:
+        """Test that registered tickers are resolved without per-symbol lookups."""
+        # Arrange
+        mock_data_source = Mock(spec=StockDataSource)
+        mock_repository = MagicMock(spec=PostgresDailyPriceRepository)
+
+        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": ohlcv_1row}
+        mock_repository.get_ticker_ids_by_symbols.return_value = {"AAPL": 7}
+        mock_repository.bulk_upsert_from_dataframe.return_value = 1
+
+        handler = CollectDataHandler(
+            data_source=mock_data_source,
+            daily_price_repository=mock_repository,
+        )
         command = FetchStockDataCommand(
-            symbols=["AAPL", "INVALID"],
+            symbols=["AAPL"],
             period="1mo",
         )
 
@@ -186,34 +304,26 @@ class TestCollectDataHandler:
         result = handler.handle(command)
 
         # Assert
-        assert result.success_count == 1
-        assert result.error_count == 1
-        assert "AAPL" in result.data
-        assert "INVALID" in result.errors
+        mock_repository.get_ticker_ids_by_symbols.assert_called_once_with(["AAPL"])
+        mock_repository.get_or_create_ticker.assert_not_called()
+        mock_data_source.fetch_ticker_info.assert_not_called()
+        mock_repository.bulk_upsert_from_dataframe.assert_called_once_with(
+            ticker_id=7, df=ohlcv_1row
+        )
+        assert result.saved_records["AAPL"] == 1
 
-    def test_handle_with_repository_saves_data(self) -> None:
-        """Test that data is saved when repository is provided."""
+    def test_handle_ticker_prefetch_failure_falls_back(
+        self, ohlcv_1row: pd.DataFrame
+    ) -> None:
+        """Test that a failed bulk ticker lookup falls back to per-symbol lookup."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_repository = MagicMock()
-        mock_ticker = MagicMock()
-        mock_ticker.ticker_id = 1
-
-        mock_df = pd.DataFrame(
-            {
-                "open": [100.0],
-                "close": [105.0],
-                "high": [110.0],
-                "low": [95.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
-        )
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": mock_df}
-        mock_data_source.fetch_ticker_info.return_value = {
-            "name": "Apple Inc.",
-            "symbol": "AAPL",
-        }
+        mock_data_source = Mock(spec=StockDataSource)
+        mock_repository = MagicMock(spec=PostgresDailyPriceRepository)
+        mock_ticker = Mock(ticker_id=1)
+
+        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": ohlcv_1row}
+        mock_data_source.fetch_ticker_info.return_value = _APPLE_INFO
+        mock_repository.get_ticker_ids_by_symbols.side_effect = RuntimeError("db")
         mock_repository.get_or_create_ticker.return_value = mock_ticker
         mock_repository.bulk_upsert_from_dataframe.return_value = 1
 
@@ -233,28 +343,18 @@ class TestCollectDataHandler:
         mock_repository.get_or_create_ticker.assert_called_once_with(
             symbol="AAPL", name="Apple Inc."
         )
-        mock_repository.bulk_upsert_from_dataframe.assert_called_once()
         assert result.saved_records["AAPL"] == 1
 
-    def test_handle_ticker_info_failure_continues(self) -> None:
+    def test_handle_ticker_info_failure_continues(
+        self, ohlcv_1row: pd.DataFrame
+    ) -> None:
         """Test that ticker info failure doesn't stop the process."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_repository = MagicMock()
-        mock_ticker = MagicMock()
-        mock_ticker.ticker_id = 1
-
-        mock_df = pd.DataFrame(
-            {
-                "open": [100.0],
-                "close": [105.0],
-                "high": [110.0],
-                "low": [95.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
-        )
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": mock_df}
+        mock_data_source = Mock(spec=StockDataSource)
+        mock_repository = MagicMock(spec=PostgresDailyPriceRepository)
+        mock_ticker = Mock(ticker_id=1)
+
+        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": ohlcv_1row}
         mock_data_source.fetch_ticker_info.side_effect = StockDataFetchError(
             "Failed to get info"
         )
@@ -283,217 +383,135 @@ class TestCollectDataHandler:
 class TestCollectDataHandlerWithHistoricalData:
     """Test cases for CollectDataHandler with historical data integration."""
 
-    def test_uses_historical_data_for_indicator_calculation(self) -> None:
-        """Test that historical data is used when calculating indicators."""
-        # Arrange
-        mock_data_source = MagicMock()
-        mock_repository = MagicMock()
-        mock_indicator_service = MagicMock()
-        mock_ticker = MagicMock()
-        mock_ticker.ticker_id = 1
-
-        # New data (small dataset)
-        new_df = pd.DataFrame(
-            {
-                "open": [100.0],
-                "high": [110.0],
-                "low": [95.0],
-                "close": [105.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-10"]),
+    @pytest.fixture
+    def wired(self, ohlcv_1row: pd.DataFrame) -> SimpleNamespace:
+        """Mocks wired for a one-symbol fetch; tests override what differs."""
+        ns = SimpleNamespace(
+            data_source=Mock(spec=StockDataSource),
+            repository=MagicMock(spec=PostgresDailyPriceRepository),
+            indicator_service=MagicMock(),
+            calc_result=MagicMock(),
         )
-
-        # Historical data from DB
-        historical_df = pd.DataFrame(
-            {
-                "open": [90.0 + i for i in range(5)],
-                "high": [100.0 + i for i in range(5)],
-                "low": [85.0 + i for i in range(5)],
-                "close": [95.0 + i for i in range(5)],
-                "volume": [900 + i * 10 for i in range(5)],
-            },
-            index=pd.DatetimeIndex(
-                ["2024-01-05", "2024-01-06", "2024-01-07", "2024-01-08", "2024-01-09"]
-            ),
+        ns.data_source.fetch_multiple_daily_prices.return_value = {"AAPL": ohlcv_1row}
+        ns.data_source.fetch_ticker_info.return_value = _APPLE_INFO
+        ns.repository.get_or_create_ticker.return_value = Mock(ticker_id=1)
+        ns.repository.bulk_upsert_from_dataframe.return_value = 1
+        ns.indicator_service.get_required_lookback.return_value = 75
+        ns.indicator_service.calculate_all.return_value = ns.calc_result
+        return ns
+
+    def _handler(
+        self, wired: SimpleNamespace, with_repository: bool = True
+    ) -> CollectDataHandler:
+        return CollectDataHandler(
+            data_source=wired.data_source,
+            daily_price_repository=wired.repository if with_repository else None,
+            indicator_service=wired.indicator_service,
         )
 
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": new_df}
-        mock_data_source.fetch_ticker_info.return_value = {"name": "Apple"}
-        mock_repository.get_or_create_ticker.return_value = mock_ticker
-        mock_repository.get_historical_for_indicator_calculation.return_value = []
-        mock_repository.daily_prices_to_dataframe.return_value = historical_df
-        mock_repository.bulk_upsert_from_dataframe.return_value = 1
-        mock_indicator_service.get_required_lookback.return_value = 75
-
-        # Mock calculate_all to return a result with all data
-        mock_calc_result = MagicMock()
-        mock_calc_result.data = pd.concat([historical_df, new_df]).sort_index()
-        mock_indicator_service.calculate_all.return_value = mock_calc_result
-
-        handler = CollectDataHandler(
-            data_source=mock_data_source,
-            daily_price_repository=mock_repository,
-            indicator_service=mock_indicator_service,
+    def test_uses_historical_data_for_indicator_calculation(
+        self, wired: SimpleNamespace
+    ) -> None:
+        """Test that historical data is used when calculating indicators."""
+        # Arrange
+        # History (5 days) followed by one new day, built once and sliced
+        opens = np.r_[np.arange(5, dtype=np.float64) + 90.0, 100.0]
+        volumes = np.r_[np.arange(5, dtype=np.int64) * 10 + 900, 1000]
+        combined = _make_df(
+            opens,
+            opens + 10.0,
+            opens - 5.0,
+            opens + 5.0,
+            volumes,
+            dates=[
+                "2024-01-05",
+                "2024-01-06",
+                "2024-01-07",
+                "2024-01-08",
+                "2024-01-09",
+                "2024-01-10",
+            ],
         )
-        command = FetchStockDataCommand(symbols=["AAPL"], period="1d")
+        historical_df, new_df = combined.iloc[:5], combined.iloc[5:]
+        wired.data_source.fetch_multiple_daily_prices.return_value = {"AAPL": new_df}
+        wired.repository.get_indicator_lookback_dataframe.return_value = historical_df
+        # calculate_all returns the combined history + new rows
+        wired.calc_result.data = combined
 
         # Act
-        result = handler.handle(command)
+        result = self._handler(wired).handle(
+            FetchStockDataCommand(symbols=["AAPL"], period="1d")
+        )
 
         # Assert
-        mock_repository.get_historical_for_indicator_calculation.assert_called_once()
-        mock_repository.daily_prices_to_dataframe.assert_called_once()
-        mock_indicator_service.calculate_all.assert_called_once()
+        wired.repository.get_indicator_lookback_dataframe.assert_called_once()
+        wired.indicator_service.calculate_all.assert_called_once()
         assert result.success_count == 1
 
-    def test_handles_no_historical_data_gracefully(self) -> None:
+    def test_handles_no_historical_data_gracefully(
+        self, wired: SimpleNamespace, ohlcv_1row: pd.DataFrame
+    ) -> None:
         """Test that missing historical data doesn't cause errors."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_repository = MagicMock()
-        mock_indicator_service = MagicMock()
-        mock_ticker = MagicMock()
-        mock_ticker.ticker_id = 1
-
-        new_df = pd.DataFrame(
-            {
-                "open": [100.0],
-                "high": [110.0],
-                "low": [95.0],
-                "close": [105.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
-        )
-
-        # Empty historical data
-        empty_df = pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
-
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": new_df}
-        mock_data_source.fetch_ticker_info.return_value = {"name": "Apple"}
-        mock_repository.get_or_create_ticker.return_value = mock_ticker
-        mock_repository.get_historical_for_indicator_calculation.return_value = []
-        mock_repository.daily_prices_to_dataframe.return_value = empty_df
-        mock_repository.bulk_upsert_from_dataframe.return_value = 1
-        mock_indicator_service.get_required_lookback.return_value = 75
-
-        mock_calc_result = MagicMock()
-        mock_calc_result.data = new_df.copy()
-        mock_indicator_service.calculate_all.return_value = mock_calc_result
-
-        handler = CollectDataHandler(
-            data_source=mock_data_source,
-            daily_price_repository=mock_repository,
-            indicator_service=mock_indicator_service,
+        wired.repository.get_indicator_lookback_dataframe.return_value = pd.DataFrame(
+            columns=["open", "high", "low", "close", "volume"]
         )
-        command = FetchStockDataCommand(symbols=["AAPL"], period="1d")
+        wired.calc_result.data = ohlcv_1row.copy()
 
         # Act
-        result = handler.handle(command)
+        result = self._handler(wired).handle(
+            FetchStockDataCommand(symbols=["AAPL"], period="1d")
+        )
 
         # Assert - should still work without errors
         assert result.success_count == 1
         assert result.error_count == 0
 
-    def test_backward_compatible_without_repository(self) -> None:
+    def test_backward_compatible_without_repository(
+        self, wired: SimpleNamespace, ohlcv_1row: pd.DataFrame
+    ) -> None:
         """Test that indicator calculation works without repository."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_indicator_service = MagicMock()
-
-        new_df = pd.DataFrame(
-            {
-                "open": [100.0],
-                "high": [110.0],
-                "low": [95.0],
-                "close": [105.0],
-                "volume": [1000],
-            },
-            index=pd.DatetimeIndex(["2024-01-01"]),
-        )
-
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": new_df}
-
-        mock_calc_result = MagicMock()
-        mock_calc_result.data = new_df.copy()
-        mock_calc_result.failed_indicators = {}
-        mock_indicator_service.calculate_all.return_value = mock_calc_result
-
-        # No repository provided
-        handler = CollectDataHandler(
-            data_source=mock_data_source,
-            indicator_service=mock_indicator_service,
-        )
-        command = FetchStockDataCommand(symbols=["AAPL"], period="1d")
+        wired.calc_result.data = ohlcv_1row.copy()
+        wired.calc_result.failed_indicators = {}
 
         # Act
-        result = handler.handle(command)
+        result = self._handler(wired, with_repository=False).handle(
+            FetchStockDataCommand(symbols=["AAPL"], period="1d")
+        )
 
         # Assert - should work without repository
         assert result.success_count == 1
-        mock_indicator_service.calculate_all.assert_called_once()
+        wired.indicator_service.calculate_all.assert_called_once()
 
-    def test_only_saves_new_data_portion(self) -> None:
+    def test_only_saves_new_data_portion(self, wired: SimpleNamespace) -> None:
         """Test that only new data is saved to database after calculation."""
         # Arrange
-        mock_data_source = MagicMock()
-        mock_repository = MagicMock()
-        mock_indicator_service = MagicMock()
-        mock_ticker = MagicMock()
-        mock_ticker.ticker_id = 1
-
-        new_df = pd.DataFrame(
-            {
-                "open": [100.0, 101.0],
-                "high": [110.0, 111.0],
-                "low": [95.0, 96.0],
-                "close": [105.0, 106.0],
-                "volume": [1000, 1100],
-            },
-            index=pd.DatetimeIndex(["2024-01-10", "2024-01-11"]),
-        )
-
-        historical_df = pd.DataFrame(
-            {
-                "open": [90.0],
-                "high": [100.0],
-                "low": [85.0],
-                "close": [95.0],
-                "volume": [900],
-            },
-            index=pd.DatetimeIndex(["2024-01-09"]),
+        # One day of history followed by two new days, built once and sliced
+        combined = _make_df(
+            [90.0, 100.0, 101.0],
+            [100.0, 110.0, 111.0],
+            [85.0, 95.0, 96.0],
+            [95.0, 105.0, 106.0],
+            [900, 1000, 1100],
+            dates=["2024-01-09", "2024-01-10", "2024-01-11"],
         )
-
-        mock_data_source.fetch_multiple_daily_prices.return_value = {"AAPL": new_df}
-        mock_data_source.fetch_ticker_info.return_value = {"name": "Apple"}
-        mock_repository.get_or_create_ticker.return_value = mock_ticker
-        mock_repository.get_historical_for_indicator_calculation.return_value = []
-        mock_repository.daily_prices_to_dataframe.return_value = historical_df
-        mock_repository.bulk_upsert_from_dataframe.return_value = 2
-        mock_indicator_service.get_required_lookback.return_value = 75
+        historical_df, new_df = combined.iloc[:1], combined.iloc[1:]
+        wired.data_source.fetch_multiple_daily_prices.return_value = {"AAPL": new_df}
+        wired.repository.get_indicator_lookback_dataframe.return_value = historical_df
+        wired.repository.bulk_upsert_from_dataframe.return_value = 2
 
         # Combined data with indicator columns
-        combined = pd.concat([historical_df, new_df]).sort_index()
-        combined["sma_5"] = 100.0  # Mock indicator
-
-        mock_calc_result = MagicMock()
-        mock_calc_result.data = combined
-        mock_indicator_service.calculate_all.return_value = mock_calc_result
-
-        handler = CollectDataHandler(
-            data_source=mock_data_source,
-            daily_price_repository=mock_repository,
-            indicator_service=mock_indicator_service,
-        )
-        command = FetchStockDataCommand(symbols=["AAPL"], period="2d")
+        wired.calc_result.data = combined.assign(sma_5=100.0)  # Mock indicator
 
         # Act
-        result = handler.handle(command)
+        result = self._handler(wired).handle(
+            FetchStockDataCommand(symbols=["AAPL"], period="2d")
+        )
 
         # Assert
         # The saved DataFrame should only contain 2 rows (new data)
-        call_args = mock_repository.bulk_upsert_from_dataframe.call_args
+        call_args = wired.repository.bulk_upsert_from_dataframe.call_args
         saved_df = call_args.kwargs.get("df")
         if saved_df is None and len(call_args.args) > 1:
             saved_df = call_args.args[1]
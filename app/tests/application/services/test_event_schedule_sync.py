@@ -1,5 +1,6 @@
 """Tests for EventScheduleSyncService."""
 
+import threading
 from datetime import date
 from unittest.mock import MagicMock
 
@@ -70,7 +71,12 @@ class TestEventScheduleSyncService:
         assert result.success is True
 
         # Verify repository calls
-        assert mock_earnings_repo.upsert.call_count == 2
+        mock_earnings_repo.upsert_many.assert_called_once()
+        rows = mock_earnings_repo.upsert_many.call_args[0][0]
+        assert [row["earnings_date"] for row in rows] == [
+            date(2024, 5, 15),
+            date(2024, 8, 15),
+        ]
         mock_dividend_repo.upsert.assert_called_once()
 
     def test_sync_symbol_no_dividend(self) -> None:
@@ -260,6 +266,41 @@ class TestEventScheduleSyncService:
         assert results == []
         mock_yahoo.fetch_earnings_dates.assert_not_called()
 
+    def test_sync_symbols_saves_on_calling_thread(self) -> None:
+        """Test that fetches may run in workers but DB writes stay on the caller."""
+        # Arrange
+        mock_yahoo = MagicMock()
+        mock_earnings_repo = MagicMock()
+        mock_dividend_repo = MagicMock()
+
+        mock_yahoo.fetch_earnings_dates.return_value = [date(2024, 5, 15)]
+        write_threads: set[int] = set()
+
+        def fetch_dividend_info(symbol: str) -> dict[str, date | None]:
+            return {"ex_dividend_date": None if symbol == "MSFT" else date(2024, 9, 27)}
+
+        def upsert_many(rows: list[dict[str, object]]) -> None:
+            write_threads.add(threading.get_ident())
+
+        mock_yahoo.fetch_dividend_info.side_effect = fetch_dividend_info
+        mock_earnings_repo.upsert_many.side_effect = upsert_many
+
+        service = EventScheduleSyncService(
+            yahoo_client=mock_yahoo,
+            earnings_repo=mock_earnings_repo,
+            dividend_repo=mock_dividend_repo,
+        )
+        symbols = [(f"{1000 + i}.T", i) for i in range(10)] + [("MSFT", 99)]
+
+        # Act
+        results = service.sync_symbols(symbols)
+
+        # Assert
+        assert [r.symbol for r in results] == [s for s, _ in symbols]
+        assert write_threads == {threading.get_ident()}
+        assert [r.dividend_synced for r in results] == [True] * 10 + [False]
+        assert mock_dividend_repo.upsert.call_count == 10
+
 
 class TestEventScheduleSyncServiceDataRetrieval:
     """Test cases for data retrieval methods."""
@@ -1,18 +1,28 @@
 """Pytest fixtures for testing."""
 
+import sqlite3
 from collections.abc import Generator
+from typing import Any
 
 import pytest
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.infrastructure.persistence.database import Base
+from src.infrastructure.persistence.models.news_article import url_hash
 
 
 @pytest.fixture
 def engine() -> Engine:
     """Create an in-memory SQLite engine for testing."""
-    return create_engine("sqlite:///:memory:")
+    test_engine = create_engine("sqlite:///:memory:")
+
+    @event.listens_for(test_engine, "connect")
+    def _register_functions(dbapi_conn: sqlite3.Connection, _: Any) -> None:
+        # Backs the Md5Digest expression used by generated columns
+        dbapi_conn.create_function("md5_digest", 1, url_hash, deterministic=True)
+
+    return test_engine
 
 
 @pytest.fixture
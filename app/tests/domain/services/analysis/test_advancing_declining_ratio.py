@@ -248,3 +248,58 @@ class TestAdvancingDecliningRatioService:
 
         # With no declining, ADR should be capped at 200
         assert result.short_term_adr == 200.0
+
+    def test_calculate_from_counts_matches_calculate(
+        self,
+        adr_service: AdvancingDecliningRatioService,
+        mixed_prices: Dict[str, pd.DataFrame],
+    ) -> None:
+        """Test that pre-aggregated counts give the same result."""
+        expected = adr_service.calculate(mixed_prices)
+
+        result = adr_service.calculate_from_counts(
+            expected.daily_advancing, expected.daily_declining
+        )
+
+        assert result == expected
+
+    def test_calculate_from_counts_empty_returns_neutral(
+        self, adr_service: AdvancingDecliningRatioService
+    ) -> None:
+        """Test that empty counts return neutral ADR."""
+        result = adr_service.calculate_from_counts([], [])
+
+        assert result.short_term_adr == 100.0
+        assert result.medium_term_adr == 100.0
+        assert result.divergence == ADRDivergence.NEUTRAL
+
+    def test_calculate_accepts_wide_close_frame(
+        self,
+        adr_service: AdvancingDecliningRatioService,
+        mixed_prices: Dict[str, pd.DataFrame],
+    ) -> None:
+        """Test that a date x symbol close frame gives the same result."""
+        wide = pd.DataFrame({s: df["close"] for s, df in mixed_prices.items()})
+
+        assert adr_service.calculate(wide) == adr_service.calculate(mixed_prices)
+
+    def test_calculate_series_matches_calculate_per_day(
+        self,
+        adr_service: AdvancingDecliningRatioService,
+        mixed_prices: Dict[str, pd.DataFrame],
+    ) -> None:
+        """Test that each row equals calculate() on the rows up to that day."""
+        wide = pd.DataFrame({s: df["close"] for s, df in mixed_prices.items()})
+        # A symbol that starts trading later is only counted once it has data
+        wide["LATE"] = [None] * 20 + [100.0 + j for j in range(len(wide) - 20)]
+
+        series = adr_service.calculate_series(wide, min_observations=5)
+
+        for day in wide.index[1:]:
+            subset = wide[wide.index <= day]
+            subset = subset.loc[:, subset.count() >= 5]
+            expected = adr_service.calculate(subset)
+            row = series.loc[day]
+            assert row["short_term_adr"] == pytest.approx(expected.short_term_adr)
+            assert row["medium_term_adr"] == pytest.approx(expected.medium_term_adr)
+            assert row["divergence"] == expected.divergence
@@ -165,6 +165,32 @@ class TestMarketRegimeAnalyzer:
         assert result.risk_assessment is not None
         assert result.market_breadth is not None
 
+    def test_adr_counts_match_universe_prices(
+        self,
+        analyzer: MarketRegimeAnalyzer,
+        uptrend_ohlcv: pd.DataFrame,
+        sample_universe_prices: Dict[str, pd.DataFrame],
+    ) -> None:
+        """Test that pre-aggregated ADR counts give the same breadth."""
+        expected = analyzer.analyze(
+            nikkei_df=uptrend_ohlcv,
+            topix_df=uptrend_ohlcv,
+            universe_prices=sample_universe_prices,
+        )
+        dates = pd.date_range(start="2024-01-01", periods=30, freq="D")
+        adr_counts = pd.DataFrame(
+            {"advancing": [0] + [6] * 29, "declining": [0] + [4] * 29},
+            index=dates,
+        )
+
+        result = analyzer.analyze(
+            nikkei_df=uptrend_ohlcv,
+            topix_df=uptrend_ohlcv,
+            adr_counts=adr_counts,
+        )
+
+        assert result.market_breadth == expected.market_breadth
+
     def test_uptrend_detection(
         self,
         analyzer: MarketRegimeAnalyzer,
@@ -366,6 +392,68 @@ class TestMarketRegimeAnalyzer:
         assert isinstance(result, MarketRegime)
 
 
+class TestAnalyzeRange:
+    """Tests for MarketRegimeAnalyzer.analyze_range."""
+
+    def test_matches_analyze_per_day(
+        self,
+        analyzer: MarketRegimeAnalyzer,
+        uptrend_ohlcv: pd.DataFrame,
+        high_volatility_ohlcv: pd.DataFrame,
+        sample_universe_prices: Dict[str, pd.DataFrame],
+    ) -> None:
+        """Test that each result equals analyze() on data up to that day."""
+        close_matrix = pd.DataFrame(
+            {s: df["close"] for s, df in sample_universe_prices.items()}
+        )
+        analysis_dates = pd.date_range(start="2024-02-15", periods=20, freq="D")
+
+        results = analyzer.analyze_range(
+            uptrend_ohlcv, high_volatility_ohlcv, close_matrix, analysis_dates
+        )
+
+        assert len(results) == len(analysis_dates)
+        for result, target in zip(results, analysis_dates, strict=True):
+            universe = close_matrix[close_matrix.index <= target]
+            expected = analyzer.analyze(
+                nikkei_df=uptrend_ohlcv[uptrend_ohlcv.index <= target],
+                topix_df=high_volatility_ohlcv[high_volatility_ohlcv.index <= target],
+                universe_prices=universe.loc[:, universe.count() >= 5],
+                end_date=target.date(),
+            )
+            assert result.analysis_date == expected.analysis_date
+            assert result.environment_code == expected.environment_code
+            assert result.risk_assessment == expected.risk_assessment
+            assert result.sentiment_analysis == expected.sentiment_analysis
+            assert result.trend_analysis.trend_direction == (
+                expected.trend_analysis.trend_direction
+            )
+            assert result.trend_analysis.adx_value == pytest.approx(
+                expected.trend_analysis.adx_value
+            )
+            assert result.volatility_analysis.atr_percent == pytest.approx(
+                expected.volatility_analysis.atr_percent
+            )
+            assert result.market_breadth.advancing_declining_ratios == pytest.approx(
+                expected.market_breadth.advancing_declining_ratios
+            )
+
+    def test_skips_days_without_enough_history(
+        self,
+        analyzer: MarketRegimeAnalyzer,
+        uptrend_ohlcv: pd.DataFrame,
+    ) -> None:
+        """Test that days with fewer than min_history index rows are skipped."""
+        analysis_dates = pd.date_range(start="2024-01-25", periods=10, freq="D")
+
+        results = analyzer.analyze_range(
+            uptrend_ohlcv, uptrend_ohlcv, None, analysis_dates
+        )
+
+        # 2024-01-30 is the 30th row
+        assert [r.analysis_date.day for r in results] == [30, 31, 1, 2, 3]
+
+
 class TestRiskScoreCalculation:
     """Tests for risk score calculation logic."""
 
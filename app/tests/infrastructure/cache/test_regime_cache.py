@@ -0,0 +1,133 @@
+"""Tests for RegimeCache."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.domain.models.market_regime import (
+    ADRDivergence,
+    EnvironmentCode,
+    MarketBreadth,
+    MarketRegime,
+    RiskAssessment,
+    Sentiment,
+    SentimentAnalysis,
+    TrendAnalysis,
+    TrendDirection,
+    TrendType,
+    VolatilityAnalysis,
+    VolatilityLevel,
+)
+from src.infrastructure.cache import RegimeCache
+
+
+def _regime(day: int) -> MarketRegime:
+    return MarketRegime(
+        analysis_date=date(2024, 1, day),
+        trend_analysis=TrendAnalysis(
+            trend_type=TrendType.TRENDING,
+            trend_direction=TrendDirection.UPTREND,
+            adx_value=30.0,
+            adx_interpretation="Strong Trend",
+        ),
+        volatility_analysis=VolatilityAnalysis(
+            volatility_level=VolatilityLevel.NORMAL,
+            atr_percent=1.5,
+            bollinger_band_width=5.0,
+            volatility_consensus=True,
+        ),
+        sentiment_analysis=SentimentAnalysis(
+            sentiment=Sentiment.POSITIVE,
+            nikkei_trend=TrendDirection.UPTREND,
+            topix_trend=TrendDirection.UPTREND,
+        ),
+        environment_code=EnvironmentCode.STABLE_UPTREND,
+        risk_assessment=RiskAssessment.from_score(10),
+        market_breadth=MarketBreadth(
+            advancing_declining_ratios={"short_term": 110.0, "medium_term": 100.0},
+            adr_divergence=ADRDivergence.NEUTRAL,
+        ),
+    )
+
+
+class TestRegimeCache:
+    """Test cases for RegimeCache."""
+
+    def test_put_then_get_round_trips(self, tmp_path: Path) -> None:
+        """Test that stored results are returned unchanged."""
+        cache = RegimeCache(tmp_path / "regime")
+        key = RegimeCache.build_key(1, "v1")
+        regimes = {date(2024, 1, 4): _regime(4), date(2024, 1, 5): None}
+
+        cache.put(key, regimes)
+
+        assert cache.get(key) == regimes
+        assert [p.suffix for p in (tmp_path / "regime").iterdir()] == [".pkl"]
+
+    def test_put_extends_previous_results(self, tmp_path: Path) -> None:
+        """Test that results for new dates are added to the stored ones."""
+        cache = RegimeCache(tmp_path)
+        key = RegimeCache.build_key(1, "v1")
+        cache.put(key, {date(2024, 1, 4): _regime(4)})
+
+        known = cache.get(key)
+        known[date(2024, 1, 5)] = _regime(5)
+        cache.put(key, known)
+
+        assert sorted(cache.get(key)) == [date(2024, 1, 4), date(2024, 1, 5)]
+
+    def test_get_missing_key_returns_empty(self, tmp_path: Path) -> None:
+        """Test that a miss returns an empty dict without creating files."""
+        cache = RegimeCache(tmp_path / "regime")
+
+        assert cache.get("missing") == {}
+        assert not (tmp_path / "regime").exists()
+
+    def test_corrupt_file_is_treated_as_miss(self, tmp_path: Path) -> None:
+        """Test that an unreadable cache file does not raise."""
+        cache = RegimeCache(tmp_path)
+        (tmp_path / "broken.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("broken") == {}
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            # Class that no longer exists (ImportError)
+            b"cnonexistent_module_for_test\nGone\n.",
+            # Constructor called with incompatible arguments (TypeError)
+            b"c__builtin__\nint\n(S'a'\nS'b'\nS'c'\ntR.",
+        ],
+        ids=["missing_module", "bad_constructor_args"],
+    )
+    def test_stale_pickle_is_treated_as_miss(
+        self, tmp_path: Path, payload: bytes
+    ) -> None:
+        """Test that pickles written by older code are treated as a miss."""
+        cache = RegimeCache(tmp_path)
+        (tmp_path / "stale.pkl").write_bytes(payload)
+
+        assert cache.get("stale") == {}
+
+    def test_put_prunes_superseded_keys(self, tmp_path: Path) -> None:
+        """Test that older versions of the same universe are deleted on put."""
+        cache = RegimeCache(tmp_path)
+        old_key = RegimeCache.build_key(1, "v1")
+        other_universe_key = RegimeCache.build_key(11, "v1")
+        cache.put(old_key, {date(2024, 1, 4): _regime(4)})
+        cache.put(other_universe_key, {date(2024, 1, 4): _regime(4)})
+
+        new_key = RegimeCache.build_key(1, "v2")
+        cache.put(new_key, {date(2024, 1, 5): _regime(5)})
+
+        assert sorted(p.stem for p in tmp_path.iterdir()) == sorted(
+            [new_key, other_universe_key]
+        )
+        assert cache.get(old_key) == {}
+
+    def test_key_changes_with_data_version(self) -> None:
+        """Test that new price data produces a different key."""
+        assert RegimeCache.build_key(1, "v1") == RegimeCache.build_key(1, "v1")
+        assert RegimeCache.build_key(1, "v1") != RegimeCache.build_key(1, "v2")
+        assert RegimeCache.build_key(1, "v1") != RegimeCache.build_key(2, "v1")
@@ -0,0 +1,74 @@
+"""Tests for NewsArticle ORM model."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportGeneralTypeIssues=false
+# pyright: reportArgumentType=false, reportAttributeAccessIssue=false
+# NOTE: SQLAlchemy ORM typing issues in tests
+
+import hashlib
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models import NewsArticle, Ticker
+from src.infrastructure.persistence.models.news_article import url_hash
+
+URL = "https://example.com/news/" + "a" * 200
+NOW = datetime(2024, 4, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _article(ticker_id: int, url: str) -> NewsArticle:
+    return NewsArticle(
+        ticker_id=ticker_id,
+        title="Headline",
+        url=url,
+        published_at=NOW,
+        retrieved_at=NOW,
+    )
+
+
+class TestNewsArticleUrlHash:
+    """Test cases for NewsArticle.url_hash."""
+
+    def test_url_hash_populated_on_insert(self, session: Session) -> None:
+        """Test that url_hash is generated as the MD5 digest of url."""
+        ticker = Ticker(symbol="AAPL")
+        session.add(ticker)
+        session.flush()
+
+        article = _article(ticker.ticker_id, URL)
+        session.add(article)
+        session.flush()
+
+        assert article.url_hash == hashlib.md5(URL.encode()).digest()
+        assert article.url_hash == url_hash(URL)
+
+    def test_url_hash_follows_url_update(self, session: Session) -> None:
+        """Test that changing url regenerates url_hash."""
+        ticker = Ticker(symbol="AAPL")
+        session.add(ticker)
+        session.flush()
+
+        article = _article(ticker.ticker_id, URL)
+        session.add(article)
+        session.flush()
+
+        article.url = URL + "?updated"
+        session.flush()
+
+        assert article.url_hash == url_hash(URL + "?updated")
+
+    def test_duplicate_url_for_ticker_rejected(self, session: Session) -> None:
+        """Test that the (ticker_id, url_hash) unique index rejects duplicates."""
+        ticker = Ticker(symbol="AAPL")
+        session.add(ticker)
+        session.flush()
+
+        session.add(_article(ticker.ticker_id, URL))
+        session.flush()
+        session.add(_article(ticker.ticker_id, URL))
+
+        with pytest.raises(IntegrityError):
+            session.flush()
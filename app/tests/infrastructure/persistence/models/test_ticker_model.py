@@ -0,0 +1,40 @@
+"""Tests for Ticker ORM model."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# NOTE: SQLAlchemy ORM typing issues in tests
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, selectinload
+
+from src.infrastructure.persistence.models import Ticker
+
+
+class TestTickerRelationships:
+    """Test cases for Ticker relationship loading."""
+
+    def test_lazy_load_raises(self, session: Session) -> None:
+        """Test that an unloaded collection raises instead of emitting SQL."""
+        session.add(Ticker(symbol="AAPL"))
+        session.commit()
+        session.expunge_all()
+
+        ticker = session.query(Ticker).filter(Ticker.symbol == "AAPL").one()
+
+        with pytest.raises(InvalidRequestError):
+            _ = ticker.daily_prices
+
+    def test_selectinload_allows_access(self, session: Session) -> None:
+        """Test that collections loaded explicitly can be accessed."""
+        session.add(Ticker(symbol="AAPL"))
+        session.commit()
+        session.expunge_all()
+
+        ticker = (
+            session.query(Ticker)
+            .options(selectinload(Ticker.daily_prices))
+            .filter(Ticker.symbol == "AAPL")
+            .one()
+        )
+
+        assert ticker.daily_prices == []
@@ -0,0 +1,38 @@
+"""Tests for Watchlist ORM model."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportGeneralTypeIssues=false
+# NOTE: SQLAlchemy ORM typing issues in tests
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models import Watchlist
+
+
+class TestWatchlistName:
+    """Test cases for the case-insensitive Watchlist name index."""
+
+    def test_name_differing_only_in_case_rejected(self, session: Session) -> None:
+        """Test that names are unique regardless of case."""
+        session.add(Watchlist(name="Tech Stocks"))
+        session.flush()
+        session.add(Watchlist(name="tech stocks"))
+
+        with pytest.raises(IntegrityError):
+            session.flush()
+
+    def test_lookup_by_lower_name(self, session: Session) -> None:
+        """Test that a lower(name) lookup finds the watchlist."""
+        session.add(Watchlist(name="Tech Stocks"))
+        session.flush()
+
+        result = (
+            session.query(Watchlist)
+            .filter(func.lower(Watchlist.name) == "TECH STOCKS".lower())
+            .one()
+        )
+
+        assert result.name == "Tech Stocks"
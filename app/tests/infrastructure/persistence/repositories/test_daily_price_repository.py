@@ -4,13 +4,23 @@
 # pyright: reportArgumentType=false
 # NOTE: MagicMock typing issues in tests
 
+import os
+from collections.abc import Generator
 from datetime import date
 from decimal import Decimal
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
 
-from src.infrastructure.persistence.repositories import PostgresDailyPriceRepository
+from src.infrastructure.persistence.models import DailyPrice, Ticker
+from src.infrastructure.persistence.repositories import (
+    PostgresDailyPriceRepository,
+    daily_price_repository,
+)
 
 
 class TestGetHistoricalForIndicatorCalculation:
@@ -219,3 +229,437 @@ class TestDailyPricesToDataframe:
         # Assert
         assert "adj_close" not in df.columns
         assert len(df) == 1
+
+
+class TestGetByTickerAndDateRange:
+    """Test cases for get_by_ticker_and_date_range."""
+
+    def test_returns_list_in_date_order(self, session: Session) -> None:
+        """Test that rows in range are returned as a list sorted by date."""
+        ticker = Ticker(symbol="AAPL")
+        session.add(ticker)
+        session.flush()
+        for price_id, day in enumerate([3, 1, 2, 9], start=1):
+            session.add(
+                DailyPrice(
+                    price_id=price_id,
+                    ticker_id=ticker.ticker_id,
+                    date=date(2024, 1, day),
+                    close=Decimal(100 + day),
+                )
+            )
+        session.flush()
+        repo = PostgresDailyPriceRepository(session)
+
+        result = repo.get_by_ticker_and_date_range(
+            ticker.ticker_id, date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert isinstance(result, list)
+        assert [p.date for p in result] == [
+            date(2024, 1, 1),
+            date(2024, 1, 2),
+            date(2024, 1, 3),
+        ]
+
+
+class TestGetDataframeByTickerAndDateRange:
+    """Test cases for get_dataframe_by_ticker_and_date_range."""
+
+    def test_returns_ohlcv_frame_in_date_order(self, session: Session) -> None:
+        """Test that rows in range are returned as an OHLCV DataFrame."""
+        ticker = Ticker(symbol="AAPL")
+        session.add(ticker)
+        session.flush()
+        for price_id, day in enumerate([3, 1, 2, 9], start=1):
+            session.add(
+                DailyPrice(
+                    price_id=price_id,
+                    ticker_id=ticker.ticker_id,
+                    date=date(2024, 1, day),
+                    open=Decimal("100.5"),
+                    high=Decimal("110"),
+                    low=Decimal("95"),
+                    close=Decimal(100 + day),
+                    volume=1000 * day,
+                )
+            )
+        session.flush()
+        repo = PostgresDailyPriceRepository(session)
+
+        df = repo.get_dataframe_by_ticker_and_date_range(
+            ticker.ticker_id, date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert list(df.index) == list(
+            pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"])
+        )
+        assert df["close"].tolist() == [101.0, 102.0, 103.0]
+        assert df["close"].dtype == "float64"
+        assert df["volume"].tolist() == [1000, 2000, 3000]
+
+
+class TestGetIndicatorLookbackDataframe:
+    """Test cases for get_indicator_lookback_dataframe."""
+
+    def test_returns_latest_rows_before_start_in_date_order(
+        self, session: Session
+    ) -> None:
+        """Test that the last lookback_days rows before the start are returned."""
+        ticker = Ticker(symbol="AAPL")
+        session.add(ticker)
+        session.flush()
+        for day in range(1, 8):
+            session.add(
+                DailyPrice(
+                    price_id=day,
+                    ticker_id=ticker.ticker_id,
+                    date=date(2024, 1, day),
+                    open=Decimal(100 + day),
+                    high=Decimal(110 + day),
+                    low=Decimal(90 + day),
+                    close=Decimal(100 + day),
+                    volume=1000,
+                )
+            )
+        session.flush()
+        repo = PostgresDailyPriceRepository(session)
+
+        df = repo.get_indicator_lookback_dataframe(
+            ticker.ticker_id, date(2024, 1, 6), lookback_days=3
+        )
+
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert list(df.index) == list(
+            pd.DatetimeIndex(["2024-01-03", "2024-01-04", "2024-01-05"])
+        )
+        assert df["close"].dtype == "float64"
+        assert df["close"].tolist() == [103.0, 104.0, 105.0]
+
+    def test_returns_empty_frame_without_history(self, session: Session) -> None:
+        """Test that an empty frame is returned when nothing precedes the start."""
+        repo = PostgresDailyPriceRepository(session)
+
+        df = repo.get_indicator_lookback_dataframe(1, date(2024, 1, 1))
+
+        assert df.empty
+
+
+class TestGetDataframesBySymbolsAndDateRange:
+    """Test cases for get_dataframes_by_symbols_and_date_range."""
+
+    def test_splits_single_query_result_by_symbol(self, session: Session) -> None:
+        """Test that one query's rows are grouped into a frame per symbol."""
+        price_id = 0
+        for symbol, closes in {"1321.T": [101, 102], "1306.T": [201]}.items():
+            ticker = Ticker(symbol=symbol)
+            session.add(ticker)
+            session.flush()
+            for day, close in enumerate(closes, start=1):
+                price_id += 1
+                session.add(
+                    DailyPrice(
+                        price_id=price_id,
+                        ticker_id=ticker.ticker_id,
+                        date=date(2024, 1, day),
+                        open=Decimal(close),
+                        high=Decimal(close + 10),
+                        low=Decimal(close - 10),
+                        close=Decimal(close),
+                        volume=1000,
+                        adj_close=Decimal(close) if symbol == "1306.T" else None,
+                    )
+                )
+        session.flush()
+        repo = PostgresDailyPriceRepository(session)
+
+        frames = repo.get_dataframes_by_symbols_and_date_range(
+            ["1321.T", "1306.T", "UNKNOWN"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert set(frames) == {"1321.T", "1306.T"}
+        assert list(frames["1321.T"].columns) == [
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+        ]
+        assert frames["1321.T"]["close"].tolist() == [101.0, 102.0]
+        assert frames["1306.T"]["adj_close"].tolist() == [201.0]
+        assert isinstance(frames["1306.T"].index, pd.DatetimeIndex)
+
+    def test_empty_symbols(self) -> None:
+        """Test that no query is issued for an empty symbol list."""
+        session = MagicMock()
+        repo = PostgresDailyPriceRepository(session)
+
+        assert (
+            repo.get_dataframes_by_symbols_and_date_range(
+                [], date(2024, 1, 1), date(2024, 1, 31)
+            )
+            == {}
+        )
+        session.connection.assert_not_called()
+
+
+class TestSavepoint:
+    """Test cases for savepoint."""
+
+    def test_begins_nested_transaction(self) -> None:
+        """Test that savepoint() returns the session's nested transaction."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+
+        assert repo.savepoint() is mock_session.begin_nested.return_value
+
+
+class TestBulkUpsertFromDataframe:
+    """Test cases for bulk_upsert_from_dataframe."""
+
+    def _make_df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "open": [100.5, 101.0],
+                "high": [110.25, 111.0],
+                "low": [95.75, 96.0],
+                "close": [105.0, 106.0],
+                "volume": [1000, 1500],
+                "sma_5": [float("nan"), 102.5],
+                "obv": [5000.0, 6500.7],
+            },
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-02"]),
+        )
+
+    def test_executes_single_on_conflict_statement(self) -> None:
+        """Test that rows are upserted with one executemany INSERT ... ON CONFLICT."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+
+        count = repo.bulk_upsert_from_dataframe(1, self._make_df())
+
+        assert count == 2
+        mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
+        stmt, params = mock_session.execute.call_args[0]
+        assert len(params) == 2
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (ticker_id, date) DO UPDATE" in sql
+        assert "coalesce(excluded.sma_5, daily_prices.sma_5)" in sql
+
+    def test_splits_rows_into_batches(self) -> None:
+        """Test that rows are written in batch_size chunks inside a savepoint."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session, batch_size=1)
+
+        count = repo.bulk_upsert_from_dataframe(1, self._make_df())
+
+        assert count == 2
+        assert mock_session.execute.call_count == 2
+        mock_session.begin_nested.assert_called_once()
+
+    def test_converts_values_and_nan(self) -> None:
+        """Test that values are converted per column and NaN becomes None."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+
+        rows = repo._dataframe_to_rows(1, self._make_df())
+
+        assert rows[0]["ticker_id"] == 1
+        assert rows[0]["date"] == date(2024, 1, 1)
+        assert rows[0]["open"] == 100.5
+        assert rows[0]["volume"] == 1000
+        assert rows[0]["sma_5"] is None
+        assert rows[1]["sma_5"] == 102.5
+        assert rows[1]["obv"] == 6500
+        assert isinstance(rows[1]["obv"], int)
+        assert rows[0]["adj_close"] is None
+        assert rows[0]["rsi_14"] is None
+
+    def test_empty_dataframe(self) -> None:
+        """Test that an empty DataFrame issues no statement."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+
+        count = repo.bulk_upsert_from_dataframe(1, pd.DataFrame())
+
+        assert count == 0
+        mock_session.execute.assert_not_called()
+
+
+class TestBulkCopyFromDataframe:
+    """Test cases for bulk_copy_from_dataframe."""
+
+    def _make_df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "open": [100.5],
+                "high": [110.25],
+                "low": [95.75],
+                "close": [105.0],
+                "volume": [1000],
+                "sma_5": [float("nan")],
+            },
+            index=pd.DatetimeIndex(["2024-01-01"]),
+        )
+
+    def test_copies_csv_into_staging_and_merges(self) -> None:
+        """Test that rows are COPYed into the staging table and then upserted."""
+        mock_session = MagicMock()
+        cursor = mock_session.connection.return_value.connection.cursor.return_value
+        repo = PostgresDailyPriceRepository(mock_session)
+
+        count = repo.bulk_copy_from_dataframe(1, self._make_df())
+
+        assert count == 1
+        copy_sql, buffer = cursor.copy_expert.call_args[0]
+        assert copy_sql.startswith("COPY staging_daily_prices (ticker_id, date, open")
+        csv = buffer.getvalue()
+        assert csv.startswith("1,2024-01-01,100.5,110.25,95.75,105.0,1000,")
+        assert "\\N" in csv
+        cursor.close.assert_called_once()
+        merge = mock_session.execute.call_args_list[-1][0][0]
+        sql = str(merge.compile(dialect=postgresql.dialect()))
+        assert "FROM staging_daily_prices ON CONFLICT (ticker_id, date)" in sql
+
+    def test_staging_table_has_only_copy_columns(self) -> None:
+        """Test that the staging table is not a LIKE copy of daily_prices."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+
+        repo.bulk_copy_from_dataframe(1, self._make_df())
+
+        ddl = str(mock_session.execute.call_args_list[0][0][0])
+        assert "LIKE" not in ddl
+        assert (
+            f"AS SELECT {', '.join(daily_price_repository.COPY_COLUMNS)} "
+            "FROM daily_prices WITH NO DATA" in ddl
+        )
+
+    def test_large_dataframe_uses_copy(self) -> None:
+        """Test that bulk_upsert_from_dataframe switches to COPY for large input."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+        df = pd.concat([self._make_df()] * daily_price_repository.COPY_THRESHOLD)
+
+        count = repo.bulk_upsert_from_dataframe(1, df)
+
+        assert count == daily_price_repository.COPY_THRESHOLD
+        cursor = mock_session.connection.return_value.connection.cursor.return_value
+        cursor.copy_expert.assert_called_once()
+        mock_session.begin_nested.assert_not_called()
+
+
+@pytest.mark.skipif(
+    "TEST_DATABASE_URL" not in os.environ,
+    reason="needs a migrated PostgreSQL database in TEST_DATABASE_URL",
+)
+class TestBulkCopyFromDataframePostgres:
+    """Run the staging DDL, COPY and merge against a real PostgreSQL server."""
+
+    @pytest.fixture
+    def pg_session(self) -> Generator[Session, None, None]:
+        # Everything runs in one outer transaction that is rolled back
+        engine = create_engine(os.environ["TEST_DATABASE_URL"])
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            session = Session(bind=connection, join_transaction_mode="create_savepoint")
+            yield session
+            session.close()
+            transaction.rollback()
+        engine.dispose()
+
+    def test_copies_and_upserts_rows(self, pg_session: Session) -> None:
+        """Test that COPY loads rows without price_id and merges them twice."""
+        ticker = Ticker(symbol="ZZCOPYTEST")
+        pg_session.add(ticker)
+        pg_session.flush()
+        repo = PostgresDailyPriceRepository(pg_session)
+        df = pd.DataFrame(
+            {
+                "open": [100.5, 101.5],
+                "high": [110.25, 111.25],
+                "low": [95.75, 96.75],
+                "close": [105.0, 106.0],
+                "volume": [1000, 1100],
+                "sma_5": [float("nan"), 102.5],
+            },
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-02"]),
+        )
+
+        assert repo.bulk_copy_from_dataframe(ticker.ticker_id, df) == 2
+        # A second call in the same transaction reuses the staging table
+        assert repo.bulk_copy_from_dataframe(ticker.ticker_id, df.iloc[1:]) == 1
+
+        rows = pg_session.scalars(
+            select(DailyPrice)
+            .where(DailyPrice.ticker_id == ticker.ticker_id)
+            .order_by(DailyPrice.date)
+        ).all()
+        assert [row.date for row in rows] == [date(2024, 1, 1), date(2024, 1, 2)]
+        assert rows[0].sma_5 is None
+        assert rows[1].close == Decimal("106.0")
+        assert all(row.price_id is not None for row in rows)
+
+
+class TestGetOrCreateTicker:
+    """Test cases for get_or_create_ticker."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Generator[None, None, None]:
+        daily_price_repository._ticker_id_cache.clear()
+        yield
+        daily_price_repository._ticker_id_cache.clear()
+
+    def test_second_call_uses_cached_id(self) -> None:
+        """Test that a resolved symbol is looked up by primary key afterwards."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+        ticker = MagicMock()
+        ticker.ticker_id = 7
+        ticker.symbol = "AAPL"
+        mock_session.query.return_value.filter.return_value.first.return_value = ticker
+        mock_session.get.return_value = ticker
+
+        first = repo.get_or_create_ticker("AAPL")
+        second = repo.get_or_create_ticker("AAPL")
+
+        assert first is ticker
+        assert second is ticker
+        mock_session.query.assert_called_once()
+        mock_session.get.assert_called_once()
+
+    def test_stale_cache_entry_falls_back_to_query(self) -> None:
+        """Test that a cached id whose row is gone is re-resolved by symbol."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+        daily_price_repository._ticker_id_cache["AAPL"] = 99
+        ticker = MagicMock()
+        ticker.ticker_id = 7
+        mock_session.get.return_value = None
+        mock_session.query.return_value.filter.return_value.first.return_value = ticker
+
+        result = repo.get_or_create_ticker("AAPL")
+
+        assert result is ticker
+        assert daily_price_repository._ticker_id_cache["AAPL"] == 7
+
+    def test_cached_id_for_other_symbol_falls_back_to_query(self) -> None:
+        """Test that a cached id now pointing at another symbol is re-resolved."""
+        mock_session = MagicMock()
+        repo = PostgresDailyPriceRepository(mock_session)
+        daily_price_repository._ticker_id_cache["AAPL"] = 99
+        other = MagicMock()
+        other.ticker_id = 99
+        other.symbol = "MSFT"
+        ticker = MagicMock()
+        ticker.ticker_id = 7
+        ticker.symbol = "AAPL"
+        mock_session.get.return_value = other
+        mock_session.query.return_value.filter.return_value.first.return_value = ticker
+
+        result = repo.get_or_create_ticker("AAPL")
+
+        assert result is ticker
+        assert daily_price_repository._ticker_id_cache["AAPL"] == 7
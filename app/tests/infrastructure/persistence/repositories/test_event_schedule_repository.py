@@ -4,15 +4,24 @@
 # pyright: reportArgumentType=false
 # NOTE: MagicMock typing issues in tests
 
-from datetime import date
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock
 
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models import (
+    EarningsSchedule,
+    Ticker,
+)
 from src.infrastructure.persistence.repositories import (
     PostgresDividendScheduleRepository,
     PostgresEarningsScheduleRepository,
 )
 
+RETRIEVED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestPostgresEarningsScheduleRepository:
     """Test cases for PostgresEarningsScheduleRepository."""
@@ -24,12 +33,7 @@ class TestPostgresEarningsScheduleRepository:
         repo = PostgresEarningsScheduleRepository(mock_session)
 
         mock_results = [MagicMock(), MagicMock()]
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = mock_results
+        mock_session.scalars.return_value = iter(mock_results)
 
         # Act
         result = repo.get_by_ticker(ticker_id=1, limit=10)
@@ -43,18 +47,43 @@ class TestPostgresEarningsScheduleRepository:
         mock_session = MagicMock()
         repo = PostgresEarningsScheduleRepository(mock_session)
 
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = []
+        mock_session.scalars.return_value = iter([])
 
         # Act
         repo.get_by_ticker(ticker_id=1, limit=5)
 
         # Assert
-        mock_query.limit.assert_called_once_with(5)
+        params = mock_session.scalars.call_args[0][1]
+        assert params == {"ticker_id": 1, "limit": 5}
+
+    def test_lookups_bind_parameters(self, session: Session) -> None:
+        """Test the prebuilt lookup statements against a real database."""
+        # Arrange
+        ticker = Ticker(symbol="7203.T")
+        session.add(ticker)
+        session.flush()
+        session.add_all(
+            EarningsSchedule(
+                ticker_id=ticker.ticker_id,
+                earnings_date=date(2024, m, 15),
+                retrieved_at=RETRIEVED_AT,
+            )
+            for m in (8, 2, 5)
+        )
+        session.flush()
+        repo = PostgresEarningsScheduleRepository(session)
+
+        # Act
+        first_two = repo.get_by_ticker(ticker.ticker_id, limit=2)
+        upcoming = repo.get_upcoming_by_ticker(ticker.ticker_id, date(2024, 3, 1))
+
+        # Assert
+        assert [s.earnings_date for s in first_two] == [
+            date(2024, 2, 15),
+            date(2024, 5, 15),
+        ]
+        assert upcoming is not None
+        assert upcoming.earnings_date == date(2024, 5, 15)
 
     def test_get_upcoming_by_ticker_returns_first_future(self) -> None:
         """Test that get_upcoming_by_ticker returns the first future schedule."""
@@ -64,11 +93,7 @@ class TestPostgresEarningsScheduleRepository:
 
         mock_schedule = MagicMock()
         mock_schedule.earnings_date = date(2024, 5, 15)
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.first.return_value = mock_schedule
+        mock_session.scalars.return_value.first.return_value = mock_schedule
 
         # Act
         result = repo.get_upcoming_by_ticker(ticker_id=1, from_date=date(2024, 4, 1))
@@ -83,11 +108,7 @@ class TestPostgresEarningsScheduleRepository:
         mock_session = MagicMock()
         repo = PostgresEarningsScheduleRepository(mock_session)
 
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.first.return_value = None
+        mock_session.scalars.return_value.first.return_value = None
 
         # Act
         result = repo.get_upcoming_by_ticker(ticker_id=1, from_date=date(2024, 12, 31))
@@ -96,7 +117,7 @@ class TestPostgresEarningsScheduleRepository:
         assert result is None
 
     def test_save_adds_to_session(self) -> None:
-        """Test that save adds schedule to session."""
+        """Test that save adds schedule to session without flushing."""
         # Arrange
         mock_session = MagicMock()
         repo = PostgresEarningsScheduleRepository(mock_session)
@@ -107,19 +128,16 @@ class TestPostgresEarningsScheduleRepository:
 
         # Assert
         mock_session.add.assert_called_once_with(mock_schedule)
-        mock_session.flush.assert_called_once()
+        mock_session.flush.assert_not_called()
         assert result == mock_schedule
 
-    def test_upsert_creates_new_when_not_exists(self) -> None:
-        """Test that upsert creates new schedule when not exists."""
+    def test_upsert_executes_on_conflict_returning(self) -> None:
+        """Test that upsert issues one INSERT ... ON CONFLICT ... RETURNING."""
         # Arrange
         mock_session = MagicMock()
         repo = PostgresEarningsScheduleRepository(mock_session)
-
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = None
+        mock_schedule = MagicMock()
+        mock_session.scalars.return_value.one.return_value = mock_schedule
 
         # Act
         result = repo.upsert(
@@ -130,42 +148,68 @@ class TestPostgresEarningsScheduleRepository:
         )
 
         # Assert
-        mock_session.add.assert_called_once()
-        mock_session.flush.assert_called_once()
-        assert result.ticker_id == 1
-        assert result.earnings_date == date(2024, 5, 15)
+        assert result == mock_schedule
+        mock_session.query.assert_not_called()
+        stmt, rows = mock_session.scalars.call_args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (ticker_id, earnings_date) DO UPDATE" in sql
+        assert "RETURNING" in sql
+        assert rows[0]["fiscal_quarter"] == "Q1"
+        assert rows[0]["is_confirmed"] is False
+        assert rows[0]["retrieved_at"] is not None
+
+    def test_upsert_keeps_existing_fiscal_period_when_none(self) -> None:
+        """Test that NULL fiscal_quarter/fiscal_year do not overwrite stored values."""
+        # Arrange
+        mock_session = MagicMock()
+        repo = PostgresEarningsScheduleRepository(mock_session)
 
-    def test_upsert_updates_existing(self) -> None:
-        """Test that upsert updates existing schedule."""
+        # Act
+        repo.upsert(ticker_id=1, earnings_date=date(2024, 5, 15))
+
+        # Assert
+        stmt = mock_session.scalars.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert (
+            "fiscal_quarter = coalesce(excluded.fiscal_quarter, "
+            "earnings_schedule.fiscal_quarter)" in sql
+        )
+        assert "is_confirmed = excluded.is_confirmed" in sql
+
+    def test_upsert_many_executes_single_statement(self) -> None:
+        """Test that upsert_many writes all rows with one executemany call."""
         # Arrange
         mock_session = MagicMock()
         repo = PostgresEarningsScheduleRepository(mock_session)
+        rows = [
+            {"ticker_id": 1, "earnings_date": date(2024, 5, 15)},
+            {"ticker_id": 1, "earnings_date": date(2024, 8, 15), "fiscal_year": 2025},
+        ]
 
-        mock_existing = MagicMock()
-        mock_existing.fiscal_quarter = None
-        mock_existing.fiscal_year = None
-        mock_existing.is_confirmed = False
+        # Act
+        count = repo.upsert_many(rows)
 
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = mock_existing
+        # Assert
+        assert count == 2
+        mock_session.execute.assert_called_once()
+        params = mock_session.execute.call_args[0][1]
+        assert len(params) == 2
+        assert params[0]["fiscal_year"] is None
+        assert params[1]["fiscal_year"] == 2025
+        assert params[0]["retrieved_at"] == params[1]["retrieved_at"]
+
+    def test_upsert_many_empty(self) -> None:
+        """Test that upsert_many issues no statement for empty input."""
+        # Arrange
+        mock_session = MagicMock()
+        repo = PostgresEarningsScheduleRepository(mock_session)
 
         # Act
-        result = repo.upsert(
-            ticker_id=1,
-            earnings_date=date(2024, 5, 15),
-            fiscal_quarter="Q1",
-            fiscal_year=2024,
-            is_confirmed=True,
-        )
+        count = repo.upsert_many([])
 
         # Assert
-        assert result == mock_existing
-        assert mock_existing.fiscal_quarter == "Q1"
-        assert mock_existing.fiscal_year == 2024
-        assert mock_existing.is_confirmed is True
-        mock_session.flush.assert_called_once()
+        assert count == 0
+        mock_session.execute.assert_not_called()
 
     def test_delete_by_ticker_returns_count(self) -> None:
         """Test that delete_by_ticker returns deleted count."""
@@ -195,12 +239,7 @@ class TestPostgresDividendScheduleRepository:
         repo = PostgresDividendScheduleRepository(mock_session)
 
         mock_results = [MagicMock(), MagicMock(), MagicMock()]
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = mock_results
+        mock_session.scalars.return_value = iter(mock_results)
 
         # Act
         result = repo.get_by_ticker(ticker_id=1, limit=10)
@@ -216,11 +255,7 @@ class TestPostgresDividendScheduleRepository:
 
         mock_schedule = MagicMock()
         mock_schedule.ex_dividend_date = date(2024, 9, 27)
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.first.return_value = mock_schedule
+        mock_session.scalars.return_value.first.return_value = mock_schedule
 
         # Act
         result = repo.get_upcoming_by_ticker(ticker_id=1, from_date=date(2024, 4, 1))
@@ -230,7 +265,7 @@ class TestPostgresDividendScheduleRepository:
         assert result.ex_dividend_date == date(2024, 9, 27)
 
     def test_save_adds_to_session(self) -> None:
-        """Test that save adds schedule to session."""
+        """Test that save adds schedule to session without flushing."""
         # Arrange
         mock_session = MagicMock()
         repo = PostgresDividendScheduleRepository(mock_session)
@@ -241,91 +276,81 @@ class TestPostgresDividendScheduleRepository:
 
         # Assert
         mock_session.add.assert_called_once_with(mock_schedule)
-        mock_session.flush.assert_called_once()
+        mock_session.flush.assert_not_called()
         assert result == mock_schedule
 
-    def test_upsert_creates_new_when_not_exists(self) -> None:
-        """Test that upsert creates new schedule when not exists."""
+    def test_upsert_executes_on_conflict_returning(self) -> None:
+        """Test that upsert issues one INSERT ... ON CONFLICT ... RETURNING."""
         # Arrange
         mock_session = MagicMock()
         repo = PostgresDividendScheduleRepository(mock_session)
-
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = None
+        mock_schedule = MagicMock()
+        mock_session.scalars.return_value.one.return_value = mock_schedule
 
         # Act
         result = repo.upsert(
             ticker_id=1,
             ex_dividend_date=date(2024, 9, 27),
-            dividend_rate=75.0,
-            dividend_yield=0.018,
+            dividend_rate=80.0,
+            dividend_yield=0.02,
         )
 
         # Assert
-        mock_session.add.assert_called_once()
-        mock_session.flush.assert_called_once()
-        assert result.ticker_id == 1
-        assert result.ex_dividend_date == date(2024, 9, 27)
+        assert result == mock_schedule
+        mock_session.query.assert_not_called()
+        stmt, rows = mock_session.scalars.call_args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (ticker_id, ex_dividend_date) DO UPDATE" in sql
+        assert rows[0]["dividend_rate"] == Decimal("80.0")
+        assert rows[0]["dividend_yield"] == Decimal("0.02")
 
-    def test_upsert_updates_existing(self) -> None:
-        """Test that upsert updates existing schedule."""
+    def test_upsert_handles_none_values(self) -> None:
+        """Test that None values do not overwrite stored amounts."""
         # Arrange
         mock_session = MagicMock()
         repo = PostgresDividendScheduleRepository(mock_session)
 
-        mock_existing = MagicMock()
-        mock_existing.dividend_rate = None
-        mock_existing.dividend_yield = None
-
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = mock_existing
-
         # Act
-        result = repo.upsert(
+        repo.upsert(
             ticker_id=1,
             ex_dividend_date=date(2024, 9, 27),
-            dividend_rate=80.0,
-            dividend_yield=0.02,
+            dividend_rate=None,
+            dividend_yield=None,
         )
 
         # Assert
-        assert result == mock_existing
-        assert mock_existing.dividend_rate == Decimal("80.0")
-        assert mock_existing.dividend_yield == Decimal("0.02")
-        mock_session.flush.assert_called_once()
+        stmt, rows = mock_session.scalars.call_args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert (
+            "dividend_rate = coalesce(excluded.dividend_rate, "
+            "dividend_schedule.dividend_rate)" in sql
+        )
+        assert rows[0]["dividend_rate"] is None
+        assert rows[0]["dividend_yield"] is None
 
-    def test_upsert_handles_none_values(self) -> None:
-        """Test that upsert handles None values correctly."""
+    def test_upsert_many_executes_single_statement(self) -> None:
+        """Test that upsert_many writes all rows with one executemany call."""
         # Arrange
         mock_session = MagicMock()
         repo = PostgresDividendScheduleRepository(mock_session)
+        rows = [
+            {"ticker_id": 1, "ex_dividend_date": date(2024, 3, 27)},
+            {
+                "ticker_id": 2,
+                "ex_dividend_date": date(2024, 9, 27),
+                "dividend_rate": 75.0,
+            },
+        ]
 
-        mock_existing = MagicMock()
-        mock_existing.dividend_rate = Decimal("50.0")
-        mock_existing.dividend_yield = Decimal("0.01")
-
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = mock_existing
-
-        # Act - upsert with None values should not update
-        result = repo.upsert(
-            ticker_id=1,
-            ex_dividend_date=date(2024, 9, 27),
-            dividend_rate=None,
-            dividend_yield=None,
-        )
+        # Act
+        count = repo.upsert_many(rows)
 
-        # Assert - existing values should remain unchanged
-        assert result == mock_existing
-        # Existing values should NOT be updated when None is passed
-        assert mock_existing.dividend_rate == Decimal("50.0")
-        assert mock_existing.dividend_yield == Decimal("0.01")
+        # Assert
+        assert count == 2
+        mock_session.execute.assert_called_once()
+        params = mock_session.execute.call_args[0][1]
+        assert params[0]["dividend_rate"] is None
+        assert params[1]["dividend_rate"] == Decimal("75.0")
 
     def test_delete_by_ticker_returns_count(self) -> None:
         """Test that delete_by_ticker returns deleted count."""
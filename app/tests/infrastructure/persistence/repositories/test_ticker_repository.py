@@ -6,6 +6,9 @@
 # At runtime, Column values are actual Python types, but static analysis
 # sees them as Column[T] objects.
 
+from typing import Any
+
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from src.infrastructure.persistence.models import Ticker
@@ -29,6 +32,17 @@ class TestPostgresTickerRepository:
         assert result.symbol == "7203.T"
         assert result.name == "Toyota Motor Corporation"
 
+    def test_save_defers_insert_until_flush(self, session: Session) -> None:
+        """Test that save leaves flushing to the owner of the session."""
+        repo = PostgresTickerRepository(session)
+        ticker = Ticker(symbol="7203.T", name="Toyota")
+
+        repo.save(ticker)
+        assert ticker in session.new
+
+        session.flush()
+        assert ticker.ticker_id is not None
+
     def test_get_by_id_not_found(self, session: Session) -> None:
         """Test get_by_id returns None for non-existent ID."""
         repo = PostgresTickerRepository(session)
@@ -80,6 +94,43 @@ class TestPostgresTickerRepository:
 
         assert result == []
 
+    def test_search(self, session: Session) -> None:
+        """Test substring search on symbol or name with blanks for missing text."""
+        repo = PostgresTickerRepository(session)
+        repo.save(Ticker(symbol="7203.T", name="Toyota", sector="Auto"))
+        repo.save(Ticker(symbol="9984.T"))
+        repo.save(Ticker(symbol="7267.T", name="Honda"))
+        session.flush()
+
+        rows = repo.search("toy")
+
+        assert [tuple(r) for r in rows] == [
+            (rows[0].ticker_id, "7203.T", "Toyota", "Auto")
+        ]
+        assert [r.symbol for r in repo.search("72")] == ["7203.T", "7267.T"]
+        assert [r.name for r in repo.search("9984")] == [""]
+        assert [r.symbol for r in repo.search(None, limit=2)] == ["7203.T", "7267.T"]
+
+    def test_search_escapes_wildcards(self, session: Session) -> None:
+        """Test that LIKE wildcards in the query are matched literally."""
+        repo = PostgresTickerRepository(session)
+        repo.save(Ticker(symbol="AB_C"))
+        repo.save(Ticker(symbol="ABXC"))
+        session.flush()
+
+        assert [r.symbol for r in repo.search("B_C")] == ["AB_C"]
+        assert repo.search("%") == []
+
+    def test_count(self, session: Session) -> None:
+        """Test counting all tickers and tickers matching a query."""
+        repo = PostgresTickerRepository(session)
+        repo.save(Ticker(symbol="7203.T", name="Toyota"))
+        repo.save(Ticker(symbol="7267.T", name="Honda"))
+        session.flush()
+
+        assert repo.count() == 2
+        assert repo.count("honda") == 1
+
     def test_delete(self, session: Session) -> None:
         """Test deleting a ticker."""
         repo = PostgresTickerRepository(session)
@@ -94,6 +145,24 @@ class TestPostgresTickerRepository:
         assert result is True
         assert repo.get_by_id(ticker_id) is None
 
+    def test_delete_issues_single_statement(self, session: Session) -> None:
+        """Test that delete does not SELECT the ticker first."""
+        repo = PostgresTickerRepository(session)
+        saved = repo.save(Ticker(symbol="7203.T", name="Toyota"))
+        session.commit()
+        ticker_id = saved.ticker_id
+        statements: list[str] = []
+
+        def record(_conn: Any, _cursor: Any, statement: str, *_: Any) -> None:
+            statements.append(statement)
+
+        event.listen(session.get_bind(), "before_cursor_execute", record)
+
+        repo.delete(ticker_id)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("DELETE FROM tickers")
+
     def test_delete_not_found(self, session: Session) -> None:
         """Test delete returns False for non-existent ID."""
         repo = PostgresTickerRepository(session)
@@ -0,0 +1,356 @@
+"""Tests for PostgresUniverseRepository."""
+
+# pyright: reportArgumentType=false
+# pyright: reportGeneralTypeIssues=false, reportReturnType=false
+# NOTE: Above suppresses SQLAlchemy Column type issues in tests.
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models import (
+    DailyPrice,
+    Ticker,
+    Universe,
+    UniverseSymbol,
+)
+from src.infrastructure.persistence.repositories import (
+    PostgresUniverseRepository,
+    universe_repository,
+)
+
+# (symbol, [close on 2024-01-01, 2024-01-02, 2024-01-03])
+PRICES: dict[str, list[str]] = {
+    "7203.T": ["100", "101", "99"],
+    "9984.T": ["50", "49", "49"],
+}
+
+
+@pytest.fixture
+def universe_id(session: Session) -> int:
+    """Create a universe with two symbols and three days of prices."""
+    universe = Universe(name="test", as_of_date=date(2024, 1, 3), config_name="t")
+    session.add(universe)
+    price_id = 0
+    for symbol, closes in PRICES.items():
+        ticker = Ticker(symbol=symbol)
+        session.add(ticker)
+        session.flush()
+        session.add(
+            UniverseSymbol(universe_id=universe.universe_id, ticker_id=ticker.ticker_id)
+        )
+        for day, close in enumerate(closes, start=1):
+            price_id += 1
+            session.add(
+                DailyPrice(
+                    price_id=price_id,
+                    ticker_id=ticker.ticker_id,
+                    date=date(2024, 1, day),
+                    open=Decimal(close),
+                    high=Decimal(close),
+                    low=Decimal(close),
+                    close=Decimal(close),
+                    volume=1000,
+                )
+            )
+    # A ticker outside the universe must not be returned
+    other = Ticker(symbol="6758.T")
+    session.add(other)
+    session.flush()
+    session.add(
+        DailyPrice(
+            price_id=price_id + 1,
+            ticker_id=other.ticker_id,
+            date=date(2024, 1, 1),
+            open=Decimal(1),
+            high=Decimal(1),
+            low=Decimal(1),
+            close=Decimal(1),
+            volume=1,
+        )
+    )
+    session.flush()
+    return universe.universe_id
+
+
+class TestGetUniversePrices:
+    """Test cases for get_universe_prices."""
+
+    def test_returns_close_frame_per_symbol(
+        self, session: Session, universe_id: int
+    ) -> None:
+        """Test that each universe symbol gets a float close series by date."""
+        repo = PostgresUniverseRepository(session)
+
+        result = repo.get_universe_prices(
+            universe_id, date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert set(result) == set(PRICES)
+        df = result["7203.T"]
+        assert list(df.columns) == ["close"]
+        assert df["close"].dtype == "float64"
+        assert list(df.index) == list(
+            pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"])
+        )
+        assert df["close"].tolist() == [100.0, 101.0, 99.0]
+
+    def test_filters_date_range(self, session: Session, universe_id: int) -> None:
+        """Test that rows outside the date range are excluded."""
+        repo = PostgresUniverseRepository(session)
+
+        result = repo.get_universe_prices(
+            universe_id, date(2024, 1, 2), date(2024, 1, 2)
+        )
+
+        assert result["9984.T"]["close"].tolist() == [49.0]
+
+    def test_concatenates_chunks(
+        self,
+        session: Session,
+        universe_id: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that rows read in several chunks are combined per symbol."""
+        monkeypatch.setattr(universe_repository, "PRICE_CHUNK_SIZE", 2)
+        repo = PostgresUniverseRepository(session)
+
+        result = repo.get_universe_prices(
+            universe_id, date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert result["7203.T"]["close"].tolist() == [100.0, 101.0, 99.0]
+        assert result["9984.T"]["close"].tolist() == [50.0, 49.0, 49.0]
+
+    def test_empty_range(self, session: Session, universe_id: int) -> None:
+        """Test that an empty result returns an empty dict."""
+        repo = PostgresUniverseRepository(session)
+
+        result = repo.get_universe_prices(
+            universe_id, date(2025, 1, 1), date(2025, 1, 31)
+        )
+
+        assert result == {}
+
+
+class TestGetUniverseCloseMatrix:
+    """Test cases for get_universe_close_matrix."""
+
+    def test_returns_wide_frame(self, session: Session, universe_id: int) -> None:
+        """Test that closes are pivoted into date rows and symbol columns."""
+        repo = PostgresUniverseRepository(session)
+
+        wide = repo.get_universe_close_matrix(
+            universe_id, date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert sorted(wide.columns) == sorted(PRICES)
+        assert list(wide.index) == list(
+            pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"])
+        )
+        assert wide["7203.T"].tolist() == [100.0, 101.0, 99.0]
+        assert wide["9984.T"].tolist() == [50.0, 49.0, 49.0]
+
+    def test_empty_range(self, session: Session, universe_id: int) -> None:
+        """Test that an empty range returns an empty frame."""
+        repo = PostgresUniverseRepository(session)
+
+        wide = repo.get_universe_close_matrix(
+            universe_id, date(2025, 1, 1), date(2025, 1, 31)
+        )
+
+        assert wide.empty
+
+
+class TestGetAdvancingDecliningCounts:
+    """Test cases for get_advancing_declining_counts."""
+
+    def test_counts_per_day(self, session: Session, universe_id: int) -> None:
+        """Test that up/down counts are aggregated per date in SQL."""
+        repo = PostgresUniverseRepository(session)
+
+        df = repo.get_advancing_declining_counts(
+            universe_id, date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert list(df.columns) == ["advancing", "declining"]
+        assert list(df.index) == list(
+            pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"])
+        )
+        assert df["advancing"].tolist() == [0, 1, 0]
+        assert df["declining"].tolist() == [0, 1, 1]
+
+
+class TestGetPriceDataVersion:
+    """Test cases for get_price_data_version."""
+
+    def test_changes_when_prices_are_added(
+        self, session: Session, universe_id: int
+    ) -> None:
+        """Test that a new price row in range changes the version."""
+        repo = PostgresUniverseRepository(session)
+        before = repo.get_price_data_version(
+            universe_id, date(2024, 1, 1), date(2024, 1, 31)
+        )
+        ticker = session.query(Ticker).filter(Ticker.symbol == "7203.T").one()
+        session.add(
+            DailyPrice(
+                price_id=100,
+                ticker_id=ticker.ticker_id,
+                date=date(2024, 1, 4),
+                open=Decimal(1),
+                high=Decimal(1),
+                low=Decimal(1),
+                close=Decimal(1),
+                volume=1,
+            )
+        )
+        session.flush()
+
+        after = repo.get_price_data_version(
+            universe_id, date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert before != after
+        assert after.startswith("2|7|2024-01-04")
+
+    def test_changes_when_prices_are_corrected(
+        self, session: Session, universe_id: int
+    ) -> None:
+        """Test that overwriting an existing price (e.g. by upsert) changes it."""
+        repo = PostgresUniverseRepository(session)
+        before = repo.get_price_data_version(
+            universe_id, date(2024, 1, 1), date(2024, 1, 31)
+        )
+        # e.g. adj_close rewritten after a split; row count and dates unchanged
+        session.execute(
+            update(DailyPrice)
+            .where(DailyPrice.date == date(2024, 1, 2))
+            .values(adj_close=Decimal("123.4567"))
+        )
+
+        after = repo.get_price_data_version(
+            universe_id, date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert before != after
+
+    def test_includes_extra_symbols(self, session: Session, universe_id: int) -> None:
+        """Test that prices of symbols outside the universe can be included."""
+        repo = PostgresUniverseRepository(session)
+
+        version = repo.get_price_data_version(
+            universe_id, date(2024, 1, 1), date(2024, 1, 31), ["6758.T"]
+        )
+
+        # 2 symbols, 6 universe rows + 1 row of the extra symbol
+        assert version.startswith("2|7|")
+
+
+class TestGetUniverse:
+    """Test cases for Universe lookups with optional symbol loading."""
+
+    def test_load_symbols_populates_associations(
+        self, session: Session, universe_id: int
+    ) -> None:
+        """Test that load_symbols=True loads symbol_associations up front."""
+        session.expunge_all()
+        repo = PostgresUniverseRepository(session)
+
+        universe = repo.get_by_id(universe_id, load_symbols=True)
+
+        assert universe is not None
+        assert len(universe.symbol_associations) == len(PRICES)
+
+    def test_symbols_not_loaded_by_default(
+        self, session: Session, universe_id: int
+    ) -> None:
+        """Test that accessing unloaded associations raises instead of querying."""
+        session.expunge_all()
+        repo = PostgresUniverseRepository(session)
+
+        universe = repo.get_latest()
+
+        assert universe is not None
+        with pytest.raises(InvalidRequestError):
+            _ = universe.symbol_associations
+
+    def test_get_by_name(self, session: Session, universe_id: int) -> None:
+        """Test lookup by name."""
+        repo = PostgresUniverseRepository(session)
+
+        universe = repo.get_by_name("test", load_symbols=True)
+
+        assert universe is not None
+        assert universe.universe_id == universe_id
+
+    def test_list_summaries(self, session: Session, universe_id: int) -> None:
+        """Test that only the listing columns are returned as rows."""
+        repo = PostgresUniverseRepository(session)
+
+        rows = repo.list_summaries()
+
+        assert [tuple(r) for r in rows] == [(universe_id, "test", 0, date(2024, 1, 3))]
+        assert rows[0].name == "test"
+
+    def test_get_symbol_ticker_pairs(self, session: Session, universe_id: int) -> None:
+        """Test that symbols are returned with their ticker IDs in one list."""
+        repo = PostgresUniverseRepository(session)
+        ticker_ids = {t.symbol: t.ticker_id for t in session.query(Ticker).all()}
+
+        pairs = repo.get_symbol_ticker_pairs(universe_id)
+
+        assert pairs == [(symbol, ticker_ids[symbol]) for symbol in sorted(PRICES)]
+
+
+class TestAddSymbolsBulk:
+    """Test cases for add_symbols_bulk."""
+
+    def test_inserts_all_symbols(self, session: Session) -> None:
+        """Test that every ticker is associated with the universe."""
+        universe = Universe(name="bulk", as_of_date=date(2024, 1, 3), config_name="t")
+        tickers = [Ticker(symbol=f"{1000 + i}.T") for i in range(3)]
+        session.add_all([universe, *tickers])
+        session.flush()
+        repo = PostgresUniverseRepository(session)
+
+        count = repo.add_symbols_bulk(
+            universe.universe_id, (t.ticker_id for t in tickers)
+        )
+
+        assert count == 3
+        assert sorted(repo.get_symbols(universe.universe_id)) == [
+            "1000.T",
+            "1001.T",
+            "1002.T",
+        ]
+
+    def test_empty_input(self, session: Session) -> None:
+        """Test that no statement is executed for empty input."""
+        repo = PostgresUniverseRepository(session)
+
+        assert repo.add_symbols_bulk(1, []) == 0
+
+    def test_large_input_uses_copy(self) -> None:
+        """Test that inputs above the threshold are loaded with COPY."""
+        mock_session = MagicMock()
+        cursor = mock_session.connection.return_value.connection.cursor.return_value
+        repo = PostgresUniverseRepository(mock_session)
+        ticker_ids = range(universe_repository.COPY_THRESHOLD + 1)
+
+        count = repo.add_symbols_bulk(7, ticker_ids)
+
+        assert count == universe_repository.COPY_THRESHOLD + 1
+        mock_session.execute.assert_not_called()
+        sql, buffer = cursor.copy_expert.call_args[0]
+        assert sql == "COPY universe_symbols (universe_id, ticker_id) FROM STDIN"
+        lines = buffer.getvalue().splitlines()
+        assert lines[:2] == ["7\t0", "7\t1"]
+        assert len(lines) == universe_repository.COPY_THRESHOLD + 1
+        cursor.close.assert_called_once()
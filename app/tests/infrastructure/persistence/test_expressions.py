@@ -0,0 +1,40 @@
+"""Tests for dialect-aware SQL expressions."""
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.expressions import any_of
+from src.infrastructure.persistence.models import Ticker
+
+
+class TestAnyOf:
+    """Test cases for any_of."""
+
+    def test_postgresql_binds_one_array_parameter(self) -> None:
+        """Test that PostgreSQL gets = ANY() with the list as one parameter."""
+        stmt = select(Ticker.symbol).where(any_of(Ticker.symbol, ["A", "B", "C"]))
+
+        compiled = stmt.compile(dialect=postgresql.psycopg2.dialect())
+
+        assert "tickers.symbol = ANY(%(param_1)s" in str(compiled)
+        assert " IN " not in str(compiled)
+        assert compiled.params == {"param_1": ["A", "B", "C"]}
+
+    def test_other_dialects_use_in(self, session: Session) -> None:
+        """Test that other dialects fall back to an expanding IN."""
+        session.add_all([Ticker(symbol=s) for s in ("A", "B", "C")])
+        session.flush()
+
+        for symbols in (["A", "C"], ["B"], []):
+            stmt = select(Ticker.symbol).where(any_of(Ticker.symbol, symbols))
+            assert sorted(session.scalars(stmt)) == symbols
+
+    def test_named_bindparam(self, session: Session) -> None:
+        """Test that a named bindparam is filled from the execution arguments."""
+        session.add_all([Ticker(symbol=s) for s in ("A", "B")])
+        session.flush()
+        stmt = select(Ticker.symbol).where(any_of(Ticker.symbol, bindparam("s")))
+
+        assert list(session.scalars(stmt, {"s": ["B"]})) == ["B"]
+        assert "ANY(%(s)s" in str(stmt.compile(dialect=postgresql.psycopg2.dialect()))
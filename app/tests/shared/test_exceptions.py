@@ -0,0 +1,43 @@
+"""Tests for custom exceptions."""
+
+import pickle
+
+import pytest
+
+from src.shared.exceptions import (
+    IndicatorCalculationError,
+    MarketRegimeAnalysisError,
+    StockAnalysisError,
+    StockDataFetchError,
+)
+
+
+class TestSlottedExceptions:
+    """Test cases for exceptions that store their attributes in slots."""
+
+    @pytest.mark.parametrize(
+        ("error", "attributes"),
+        [
+            (StockDataFetchError("failed", symbol="7203.T"), {"symbol": "7203.T"}),
+            (
+                IndicatorCalculationError("failed", indicator="rsi", symbol="AAPL"),
+                {"indicator": "rsi", "symbol": "AAPL"},
+            ),
+            (
+                MarketRegimeAnalysisError("failed", reason="no data"),
+                {"reason": "no data"},
+            ),
+        ],
+    )
+    def test_attributes_survive_pickling(
+        self, error: StockAnalysisError, attributes: dict[str, str]
+    ) -> None:
+        """Test that slot attributes and the message are kept through pickle."""
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert str(restored) == "failed"
+        for name, value in attributes.items():
+            assert getattr(error, name) == value
+            assert getattr(restored, name) == value
+        assert error.__dict__ == {}